@@ -0,0 +1,92 @@
+"""
+Page bundles: several read endpoints rendered into one JSON response.
+
+A bundle section names the endpoint it mirrors (path and query params)
+and a coroutine that renders it. Each section is first looked up in the
+response cache under the key the standalone endpoint would use, so the
+bundle and the individual endpoints share cached bodies; only the misses
+are rendered, in the request's own DB session, and stored back. Section
+bodies are spliced into the bundle as raw JSON without re-encoding.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import logging
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from ..config import get_settings
+from ..database import ReadSession
+from .response_cache import CACHE_RULES, call_backend, get_response_cache
+from .serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BundleSection:
+    name: str
+    path: str
+    render: Callable[[ReadSession], Awaitable[Any]]
+    params: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def render_body(result: Any) -> bytes:
+    """JSON body for a route's return value (a Response, a schema or plain data)."""
+    if isinstance(result, Response):
+        return result.body
+    if isinstance(result, BaseModel):
+        return result.model_dump_json().encode()
+    return dumps(result)
+
+
+async def section_body(section: BundleSection, db: ReadSession) -> bytes:
+    """Render one section, through the response cache when it is enabled."""
+    cache = get_response_cache() if get_settings().response_cache_enabled else None
+    rule = CACHE_RULES.get(section.path) if cache else None
+    if rule is None:
+        return await _render(section, db)
+
+    tags, ttl = rule
+    try:
+        key, etag = await call_backend(cache, cache.key_for, cache.prefix + section.path, section.params, tags, ttl)
+        entry = await call_backend(cache, cache.backend.get, key)
+    except Exception as e:
+        logger.error(f"Response cache lookup failed for bundle section {section.name}: {e}")
+        return await _render(section, db)
+
+    if entry is not None:
+        cache.hits += 1
+        return entry[2]
+
+    cache.misses += 1
+    body = await _render(section, db)
+    headers = [("content-type", "application/json"), ("etag", etag), ("cache-control", "no-cache")]
+    try:
+        # Not stored if a tag was bumped while rendering (see ResponseCacheMiddleware)
+        current = await call_backend(cache, cache.key_for, cache.prefix + section.path, section.params, tags, ttl)
+        if current == (key, etag):
+            await call_backend(cache, cache.backend.set, key, (200, headers, body), ttl)
+    except Exception as e:
+        logger.error(f"Response cache store failed for bundle section {section.name}: {e}")
+    return body
+
+
+async def _render(section: BundleSection, db: ReadSession) -> bytes:
+    try:
+        return render_body(await section.render(db))
+    except HTTPException as e:
+        # A section with nothing to show (e.g. no polls yet) is null, not an error
+        if e.status_code == 404:
+            return b"null"
+        raise
+
+
+async def render_bundle(sections: List[BundleSection], db: ReadSession) -> Response:
+    """Render the sections into one {name: section} JSON response."""
+    # One after another: a session runs one statement at a time
+    parts: Dict[str, bytes] = {s.name: await section_body(s, db) for s in sections}
+    body = b"{" + b",".join(dumps(name) + b":" + part for name, part in parts.items()) + b"}"
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,113 @@
+"""
+Response compression with Accept-Encoding negotiation.
+
+Responses of at least minimum_size bytes are compressed with brotli when
+the client accepts it and the brotli package is installed, otherwise
+with gzip. The encoding is appended to a strong ETag ("abc" becomes
+"abc-br") so each representation keeps a distinct validator;
+response_cache.matching_etag strips the suffix again, and a 304 echoes
+the suffixed tag the client sent. Bodies of at least threadpool_size
+bytes are compressed in the threadpool so the event loop keeps serving
+other requests. brotli is optional.
+"""
+
+from typing import Dict, Optional
+import gzip
+import logging
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+    logger.warning("brotli not installed, compressing with gzip only. Install with: pip install brotli")
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def available_encodings() -> tuple:
+    """Encodings this server can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the preferred encoding the client accepts, honouring q=0."""
+    if not accept_encoding:
+        return None
+
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    for encoding in available_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _with_body(response: Response, body: bytes) -> Response:
+    """A copy of response carrying body, keeping every header (repeated Set-Cookie included)."""
+    rebuilt = Response(content=body, status_code=response.status_code)
+    rebuilt.raw_headers = [
+        (name, value) for name, value in response.raw_headers if name != b"content-length"
+    ] + [(b"content-length", str(len(body)).encode("latin-1"))]
+    return rebuilt
+
+
+class CompressionMiddleware(BaseHTTPMiddleware):
+    """Compress large text/JSON responses for clients that accept it."""
+
+    def __init__(self, app, minimum_size: int = 1024, threadpool_size: int = 65536):
+        super().__init__(app)
+        self.minimum_size = minimum_size
+        self.threadpool_size = threadpool_size
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        content_type = response.headers.get("content-type", "")
+        if (
+            encoding is None
+            or response.status_code != 200
+            or "content-encoding" in response.headers
+            or not content_type.startswith(COMPRESSIBLE_TYPES)
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        if len(body) < self.minimum_size:
+            return _with_body(response, body)
+
+        if len(body) >= self.threadpool_size:
+            compressed = await run_in_threadpool(compress, body, encoding)
+        else:
+            compressed = compress(body, encoding)
+
+        compressed_response = _with_body(response, compressed)
+        headers = compressed_response.headers
+        headers["content-encoding"] = encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and etag.endswith('"') and not etag.startswith("W/"):
+            headers["etag"] = f'{etag[:-1]}-{encoding}"'
+        return compressed_response
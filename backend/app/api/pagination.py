@@ -0,0 +1,187 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints.
+
+A cursor is an opaque, URL-safe token holding the sort key name, the sort
+column value of the last row served and that row's id. The next page is
+fetched with a range predicate on (value, id) instead of OFFSET, so the
+cost of a page does not grow with its depth.
+"""
+
+from datetime import datetime
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import base64
+import json
+import time
+
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import Query
+
+from ..database import ReadSession
+
+
+def encode_cursor(sort_by: str, value: Any, row_id: int) -> str:
+    """Build an opaque cursor for the row a page ended on."""
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps({"s": sort_by, "v": value, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, int]:
+    """Decode a cursor into (value, id), rejecting malformed or mismatched cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload["v"]
+        row_id = payload["id"]
+        # Only the shapes encode_cursor writes may reach the SQL comparison
+        if isinstance(value, dict) and list(value) == ["dt"] and isinstance(value["dt"], str):
+            value = datetime.fromisoformat(value["dt"])
+        elif not isinstance(value, (str, int, float, type(None))):
+            raise TypeError("cursor value must be a scalar or a datetime")
+        if not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise TypeError("cursor id must be an integer")
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if payload.get("s") != sort_by:
+        raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+    return value, row_id
+
+
+def order_keyset(query: Query, column, id_column, descending: bool) -> Query:
+    """Apply the (column, id) ordering used by keyset pagination. NULLs sort last."""
+    if descending:
+        return query.order_by(column.desc().nulls_last(), id_column.desc())
+    return query.order_by(column.asc().nulls_last(), id_column.asc())
+
+
+def after_cursor(query: Query, column, id_column, descending: bool, value: Any, row_id: int) -> Query:
+    """Restrict a query to rows that sort strictly after the cursor position."""
+    id_after = id_column < row_id if descending else id_column > row_id
+
+    if value is None:
+        # Already inside the trailing NULL block
+        return query.filter(column.is_(None), id_after)
+
+    value_after = column < value if descending else column > value
+    return query.filter(or_(
+        value_after,
+        and_(column == value, id_after),
+        column.is_(None),
+    ))
+
+
+def page_statement(
+    query,
+    column,
+    id_column,
+    descending: bool,
+    sort_by: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+):
+    """Order and restrict a Query or select() to one page plus one extra row."""
+    query = order_keyset(query, column, id_column, descending)
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_by)
+        query = after_cursor(query, column, id_column, descending, value, row_id)
+    elif offset:
+        # Legacy offset paging, still supported for old clients
+        query = query.offset(offset)
+    return query.limit(limit + 1)
+
+
+def finish_page(rows: list, column, sort_by: str, limit: int):
+    """Split off the extra row and build the next cursor."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort_by, getattr(last, column.key), last.id)
+
+    return rows, has_more, next_cursor
+
+
+def paginate(
+    query: Query,
+    column,
+    id_column,
+    descending: bool,
+    sort_by: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+):
+    """
+    Fetch one page using the limit+1 trick instead of a COUNT.
+
+    Returns:
+        (rows, has_more, next_cursor)
+    """
+    query = page_statement(query, column, id_column, descending, sort_by, limit, cursor, offset)
+    return finish_page(query.all(), column, sort_by, limit)
+
+
+async def paginate_async(
+    db: ReadSession,
+    statement: Select,
+    column,
+    id_column,
+    descending: bool,
+    sort_by: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+):
+    """paginate() for a select() run on a read session (async or threadpool)."""
+    statement = page_statement(statement, column, id_column, descending, sort_by, limit, cursor, offset)
+    rows = (await db.execute(statement)).all()
+    return finish_page(rows, column, sort_by, limit)
+
+
+class CountCache:
+    """Short-lived cache of COUNT(*) results used as a total estimate."""
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl = ttl_seconds
+        self._entries: Dict[Any, Tuple[float, int]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Any, count: Callable[[], int]) -> int:
+        """Return the cached count for key, recomputing it once the TTL expires."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl:
+                return entry[1]
+
+        value = count()
+        with self._lock:
+            self._entries[key] = (now, value)
+        return value
+
+    async def get_async(self, key: Any, count: Callable[[], Awaitable[int]]) -> int:
+        """get() for a count that is awaited."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl:
+                return entry[1]
+
+        value = await count()
+        with self._lock:
+            self._entries[key] = (now, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache()
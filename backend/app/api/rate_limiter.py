@@ -0,0 +1,188 @@
+"""
+Sliding-window rate limiting for votes and submissions.
+
+Each (action, key) pair keeps the timestamps of its accepted requests
+within the window, so a request is accepted or rejected without a
+database query. The in-memory backend is per process; set
+RATE_LIMIT_REDIS_URL to share limits between workers. On startup the
+limiter is seeded from recent tier_votes and cope_entries rows so a
+restart does not reset anyone's allowance.
+"""
+
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Lock
+from typing import Deque, Dict, Iterable, Optional, Tuple
+import logging
+import time
+import uuid
+
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import CopeEntry, TierVote
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 24 * 60 * 60
+
+# action -> (limit, window in seconds)
+RATE_LIMITS: Dict[str, Tuple[int, int]] = {
+    "tier_vote": (1, DAY_SECONDS),  # keyed by item id and IP hash
+    "cope_submit": (5, DAY_SECONDS),  # keyed by IP hash
+}
+
+
+class MemoryBackend:
+    """Per-process sliding-window log."""
+
+    def __init__(self):
+        self._hits: Dict[str, Deque[float]] = defaultdict(deque)
+        self._lock = Lock()
+        self._calls = 0
+
+    def hit(self, key: str, limit: int, window: float, now: float) -> bool:
+        """Record a request if the key is under its limit. Returns whether it was accepted."""
+        with self._lock:
+            hits = self._hits[key]
+            while hits and hits[0] <= now - window:
+                hits.popleft()
+
+            self._calls += 1
+            if self._calls % 10000 == 0:
+                self._prune(now - window)
+
+            if len(hits) >= limit:
+                return False
+            hits.append(now)
+            return True
+
+    def seed(self, key: str, timestamps: Iterable[float], window: float):
+        with self._lock:
+            self._hits[key] = deque(sorted([*self._hits[key], *timestamps]))
+
+    def _prune(self, cutoff: float):
+        # Caller holds self._lock. Drops keys with no hits left in the window.
+        for key in [k for k, hits in self._hits.items() if not hits or hits[-1] <= cutoff]:
+            del self._hits[key]
+
+    def reset(self):
+        with self._lock:
+            self._hits.clear()
+
+
+# Trim, count and conditionally add in one atomic step
+_REDIS_HIT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1] - ARGV[2])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[2])))
+return 1
+"""
+
+# Seed a key only if Redis does not hold it already: an existing key has
+# the live hits, which already include the rows being seeded
+_REDIS_SEED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    redis.call('ZADD', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[1])))
+return 1
+"""
+
+
+class RedisBackend:
+    """Sliding-window log in Redis sorted sets, shared by all workers."""
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self._hit = self.client.register_script(_REDIS_HIT)
+        self._seed = self.client.register_script(_REDIS_SEED)
+
+    def hit(self, key: str, limit: int, window: float, now: float) -> bool:
+        member = f"{now}:{uuid.uuid4().hex}"
+        return bool(self._hit(keys=[self.prefix + key], args=[now, window, limit, member]))
+
+    def seed(self, key: str, timestamps: Iterable[float], window: float):
+        # Skipped for keys already in Redis, so restarts and other workers never count a row twice
+        args = [window]
+        for i, ts in enumerate(sorted(timestamps)):
+            args += [ts, f"seed:{i}:{ts}"]
+        if len(args) > 1:
+            self._seed(keys=[self.prefix + key], args=args)
+
+    def reset(self):
+        for key in self.client.scan_iter(f"{self.prefix}*"):
+            self.client.delete(key)
+
+
+class RateLimiter:
+    """Checks actions against RATE_LIMITS using a pluggable backend."""
+
+    def __init__(self, backend=None, limits: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.backend = backend or MemoryBackend()
+        self.limits = limits or RATE_LIMITS
+
+    def allow(self, action: str, key: str, now: Optional[float] = None) -> bool:
+        """Check and record one request for an action. False means over the limit."""
+        limit, window = self.limits[action]
+        return self.backend.hit(f"{action}:{key}", limit, window, now or time.time())
+
+    def seed_from_db(self, db: Session) -> int:
+        """Load requests still inside their window from the database. Returns rows loaded."""
+        now = datetime.utcnow()
+        seeds: Dict[str, list] = defaultdict(list)
+
+        since = now - timedelta(seconds=self.limits["tier_vote"][1])
+        for item_id, ip_hash, created_at in db.query(
+            TierVote.item_id, TierVote.voter_ip_hash, TierVote.created_at
+        ).filter(TierVote.created_at >= since, TierVote.voter_ip_hash.isnot(None)):
+            seeds[f"tier_vote:{item_id}:{ip_hash}"].append(_timestamp(created_at))
+
+        since = now - timedelta(seconds=self.limits["cope_submit"][1])
+        for ip_hash, created_at in db.query(
+            CopeEntry.submitted_by_ip_hash, CopeEntry.created_at
+        ).filter(CopeEntry.created_at > since, CopeEntry.submitted_by_ip_hash.isnot(None)):
+            seeds[f"cope_submit:{ip_hash}"].append(_timestamp(created_at))
+
+        for key, timestamps in seeds.items():
+            action = key.split(":", 1)[0]
+            self.backend.seed(key, timestamps, self.limits[action][1])
+
+        loaded = sum(len(t) for t in seeds.values())
+        logger.info(f"Rate limiter seeded with {loaded} recent requests")
+        return loaded
+
+    def reset(self):
+        self.backend.reset()
+
+
+def _timestamp(dt: datetime) -> float:
+    """Epoch seconds for a naive UTC datetime."""
+    return (dt - datetime(1970, 1, 1)).total_seconds()
+
+
+@lru_cache()
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter."""
+    settings = get_settings()
+    backend = None
+    if settings.rate_limit_redis_url:
+        try:
+            backend = RedisBackend(settings.rate_limit_redis_url)
+            logger.info("Rate limiter using Redis backend")
+        except ImportError:
+            logger.warning(
+                "redis not installed, rate limits are per process. "
+                "Install with: pip install redis"
+            )
+    return RateLimiter(backend)
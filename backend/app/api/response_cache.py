@@ -0,0 +1,315 @@
+"""
+Route-level response cache for the public read endpoints.
+
+GET responses for the paths in CACHE_RULES are cached by path and query
+string for the rule's TTL. Every rule names the tags its data depends
+on, and each tag has a version counter that is part of the cache key:
+writers call invalidate(tag) to bump the version, so every cached
+response built from that data is skipped from then on and ages out of
+the store. The in-process LRU backend is per worker; set
+RESPONSE_CACHE_REDIS_URL to share the cache and the tag versions
+between workers.
+
+The same versions give every cached path a strong ETag, so a request
+with a matching If-None-Match is answered 304 before the cache or the
+route is touched. ETags also change each TTL period, which bounds how
+long a version bump missed by another worker can go unnoticed.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import secrets
+import time
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# path (without the API prefix) -> (tags, ttl seconds)
+CACHE_RULES: Dict[str, Tuple[Tuple[str, ...], int]] = {
+    "/articles": (("articles",), 60),
+    "/promises": (("promises",), 300),
+    "/polls/latest": (("polls",), 300),
+    "/polls/history": (("polls",), 300),
+    "/tier-list": (("tier-list",), 30),
+    "/cope": (("cope",), 60),
+    "/cope/featured": (("cope",), 60),
+    "/stats": (("stats",), 30),
+    "/bundle/home": (("articles", "stats", "polls", "promises", "tier-list"), 30),
+}
+
+# Cached entry: (status code, headers, body)
+Entry = Tuple[int, List[Tuple[str, str]], bytes]
+
+
+class MemoryBackend:
+    """Per-process LRU of responses, with tag versions held alongside."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # Versions restart from zero with the process, so tell ETags apart
+        self.epoch = secrets.token_hex(4)
+        self._entries: "OrderedDict[str, Tuple[float, Entry]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, entry: Entry, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def versions(self, tags: Iterable[str]) -> List[int]:
+        with self._lock:
+            return [self._versions.get(tag, 0) for tag in tags]
+
+    def bump(self, tags: Iterable[str]):
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class RedisBackend:
+    """Responses and tag versions in Redis, shared by all workers."""
+
+    blocking = True
+    epoch = "redis"
+
+    def __init__(self, url: str, prefix: str = "respcache:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Entry]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return data["s"], [tuple(h) for h in data["h"]], data["b"].encode("latin-1")
+
+    def set(self, key: str, entry: Entry, ttl: float):
+        status, headers, body = entry
+        raw = json.dumps({"s": status, "h": headers, "b": body.decode("latin-1")})
+        self.client.set(self.prefix + key, raw, ex=max(1, int(ttl)))
+
+    def versions(self, tags: Iterable[str]) -> List[int]:
+        values = self.client.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return [int(v) if v else 0 for v in values]
+
+    def bump(self, tags: Iterable[str]):
+        pipe = self.client.pipeline()
+        for tag in tags:
+            pipe.incr(f"{self.prefix}tag:{tag}")
+        pipe.execute()
+
+    def clear(self):
+        for key in self.client.scan_iter(f"{self.prefix}*"):
+            self.client.delete(key)
+
+
+class ResponseCache:
+    """Tag-versioned response cache over a pluggable backend."""
+
+    def __init__(self, backend=None, prefix: str = "/api"):
+        self.backend = backend or MemoryBackend()
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def rule_for(self, path: str) -> Optional[Tuple[Tuple[str, ...], int]]:
+        if not path.startswith(self.prefix):
+            return None
+        return CACHE_RULES.get(path[len(self.prefix):])
+
+    def key(self, request: Request, tags: Tuple[str, ...], ttl: int) -> Tuple[str, str]:
+        """Build the cache key and ETag for a request."""
+        return self.key_for(request.url.path, request.query_params.multi_items(), tags, ttl)
+
+    def key_for(self, path: str, params: Iterable[Tuple[str, str]], tags: Tuple[str, ...], ttl: int) -> Tuple[str, str]:
+        """
+        Build the cache key and ETag for a path and its query params.
+
+        The key is the path, sorted query params and the current version
+        of each tag; the ETag hashes the key with the backend epoch and
+        the current TTL period.
+        """
+        query = "&".join(f"{k}={v}" for k, v in sorted(params))
+        versions = ",".join(map(str, self.backend.versions(tags)))
+        key = f"{path}?{query}#{versions}"
+        period = int(time.time() // ttl)
+        digest = hashlib.sha1(f"{key}#{self.backend.epoch}#{period}".encode()).hexdigest()[:20]
+        return key, f'"{digest}"'
+
+    def invalidate(self, *tags: str):
+        """Drop every cached response that depends on any of the tags."""
+        try:
+            self.backend.bump(tags)
+        except Exception as e:
+            logger.error(f"Error invalidating response cache tags {tags}: {e}")
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Serve cached GET responses for CACHE_RULES paths, storing 200s on a miss.
+
+    Answers 304 when If-None-Match carries the current ETag. A response
+    whose tags changed while it was rendered is passed through uncached.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        cache = get_response_cache()
+        rule = cache.rule_for(request.url.path) if request.method == "GET" else None
+        if rule is None:
+            return await call_next(request)
+
+        tags, ttl = rule
+        try:
+            key, etag = await call_backend(cache, cache.key, request, tags, ttl)
+        except Exception as e:
+            logger.error(f"Response cache lookup failed: {e}")
+            return await call_next(request)
+
+        matched = matching_etag(request.headers.get("if-none-match"), etag)
+        if matched:
+            cache.not_modified += 1
+            # The tag the client holds, with its encoding suffix, as on the 200 it came from
+            return Response(status_code=304, headers={"ETag": matched, "Cache-Control": "no-cache"})
+
+        try:
+            entry = await call_backend(cache, cache.backend.get, key)
+        except Exception as e:
+            logger.error(f"Response cache lookup failed: {e}")
+            entry = None
+
+        if entry is not None:
+            cache.hits += 1
+            status, headers, body = entry
+            response = Response(content=body, status_code=status, headers=dict(headers))
+            response.headers["X-Cache"] = "HIT"
+            return response
+
+        cache.misses += 1
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() != "content-length"]
+        try:
+            # A tag bumped while the route ran (e.g. /stats recomputing its snapshot)
+            # means the body may not match the versions in the key: neither store nor tag it
+            if await call_backend(cache, cache.key, request, tags, ttl) == (key, etag):
+                headers += [("etag", etag), ("cache-control", "no-cache")]
+                await call_backend(cache, cache.backend.set, key, (response.status_code, headers, body), ttl)
+        except Exception as e:
+            logger.error(f"Response cache store failed: {e}")
+
+        cached = Response(content=body, status_code=response.status_code, headers=dict(headers))
+        cached.headers["X-Cache"] = "MISS"
+        return cached
+
+
+async def call_backend(cache: ResponseCache, fn, *args):
+    """Call a cache method, off the event loop for network backends."""
+    if cache.backend.blocking:
+        return await run_in_threadpool(fn, *args)
+    return fn(*args)
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    Find the If-None-Match entry that matches an ETag (weak comparison, per RFC 9110).
+
+    Returns that entry as sent (without W/), including any encoding
+    suffix, or None if nothing matches.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    for sent in if_none_match.split(","):
+        sent = sent.strip()
+        if sent.startswith("W/"):
+            sent = sent[2:]
+        tag = sent
+        # Compressed representations carry an encoding suffix (see compression.py)
+        for suffix in ('-br"', '-gzip"'):
+            if tag.endswith(suffix):
+                tag = tag[: -len(suffix)] + '"'
+        if tag == etag:
+            return sent
+    return None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    return matching_etag(if_none_match, etag) is not None
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache."""
+    settings = get_settings()
+    backend = None
+    if settings.response_cache_redis_url:
+        try:
+            backend = RedisBackend(settings.response_cache_redis_url)
+            logger.info("Response cache using Redis backend")
+        except ImportError:
+            logger.warning(
+                "redis not installed, response cache is per process. "
+                "Install with: pip install redis"
+            )
+    return ResponseCache(
+        backend or MemoryBackend(settings.response_cache_size),
+        prefix=settings.api_prefix,
+    )
+
+
+def invalidate(*tags: str):
+    """Invalidate cached responses for the given tags."""
+    get_response_cache().invalidate(*tags)
@@ -9,14 +9,24 @@ import json
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
-from ..database import get_db, Article, Promise, Poll, TierItem, TierVote, XPost
-from ..scrapers.rss_scraper import RSSScraper
-from ..processors.content_filter import ContentFilter
+from ..database import (
+    get_db, get_read_db, pool_stats, reconcile_tier_votes, ReadSession,
+    Article, Job, Promise, Poll, TierItem, XPost, FeedState,
+)
+from ..processors.sentiment_cache import get_sentiment_cache
 from ..processors.formatter import PostFormatter
 from ..bot.x_bot import XBot
 from ..config import get_settings
+from ..worker.queue import decode, enqueue
+from .rate_limiter import get_rate_limiter
+from .vote_buffer import apply_cope_votes, apply_tier_votes, get_vote_buffer
+from .pagination import paginate_async, count_cache
+from .stats import stats_snapshot
+from .bundle import BundleSection, render_bundle
+from .serialization import FastJSONResponse, row_dicts, schema_columns
+from .response_cache import get_response_cache, invalidate
 from .schemas import (
     ArticleResponse,
     ArticleListResponse,
@@ -33,7 +43,10 @@ from .schemas import (
     TierVoteResponse,
     XPostResponse,
     PostQueueResponse,
-    ScrapeResponse,
+    JobResponse,
+    FeedStateResponse,
+    FeedStateListResponse,
+    SentimentCacheStats,
     ManualPostRequest,
     ManualPostResponse,
     DashboardStats,
@@ -46,38 +59,49 @@ settings = get_settings()
 # === Article Endpoints ===
 
 @router.get("/articles", response_model=ArticleListResponse)
-def get_articles(
+async def get_articles(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     category: Optional[str] = None,
     sort_by: str = Query("published_at", regex="^(published_at|sentiment_score|scraped_at)$"),
-    db: Session = Depends(get_db),
+    include_total: bool = False,
+    db: ReadSession = Depends(get_read_db),
 ):
-    """Get paginated list of negative articles."""
-    query = db.query(Article).filter(Article.sentiment_score < settings.sentiment_threshold)
+    """Get a page of negative articles. Pass next_cursor back as cursor for the next page."""
+    query = select(*schema_columns(Article, ArticleResponse)).where(Article.sentiment_score < settings.sentiment_threshold)
 
     if category:
-        query = query.filter(Article.category == category)
+        query = query.where(Article.category == category)
 
-    # Sorting
+    # Sorting (most negative first for sentiment, newest first otherwise)
     if sort_by == "sentiment_score":
-        query = query.order_by(Article.sentiment_score)
+        column, descending = Article.sentiment_score, False
     elif sort_by == "scraped_at":
-        query = query.order_by(Article.scraped_at.desc())
+        column, descending = Article.scraped_at, True
     else:
-        query = query.order_by(Article.published_at.desc())
-
-    total = query.count()
-    articles = query.offset(offset).limit(limit).all()
+        column, descending = Article.published_at, True
 
-    return ArticleListResponse(
-        articles=[ArticleResponse.model_validate(a) for a in articles],
-        total=total,
-        page=offset // limit + 1,
-        per_page=limit,
-        has_more=offset + limit < total,
+    articles, has_more, next_cursor = await paginate_async(
+        db, query, column, Article.id, descending, sort_by, limit, cursor=cursor, offset=offset,
     )
 
+    total = None
+    if include_total:
+        total = await count_cache.get_async(
+            ("articles", category),
+            lambda: db.scalar(select(func.count()).select_from(query.subquery())),
+        )
+
+    return FastJSONResponse({
+        "articles": row_dicts(articles),
+        "total": total,
+        "page": None if cursor else offset // limit + 1,
+        "per_page": limit,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    })
+
 
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
 def get_article(article_id: int, db: Session = Depends(get_db)):
@@ -91,21 +115,23 @@ def get_article(article_id: int, db: Session = Depends(get_db)):
 # === Promise Endpoints ===
 
 @router.get("/promises", response_model=PromiseListResponse)
-def get_promises(db: Session = Depends(get_db)):
+async def get_promises(db: ReadSession = Depends(get_read_db)):
     """Get all tracked promises."""
-    promises = db.query(Promise).order_by(Promise.created_at.desc()).all()
-
-    broken = sum(1 for p in promises if p.status == "broken")
-    uturn = sum(1 for p in promises if p.status == "u-turn")
-    pending = sum(1 for p in promises if p.status == "pending")
-
-    return PromiseListResponse(
-        promises=[PromiseResponse.model_validate(p) for p in promises],
-        total=len(promises),
-        broken_count=broken,
-        uturn_count=uturn,
-        pending_count=pending,
-    )
+    promises = row_dicts(await db.execute(
+        select(*schema_columns(Promise, PromiseResponse)).order_by(Promise.created_at.desc())
+    ))
+
+    broken = sum(1 for p in promises if p["status"] == "broken")
+    uturn = sum(1 for p in promises if p["status"] == "u-turn")
+    pending = sum(1 for p in promises if p["status"] == "pending")
+
+    return FastJSONResponse({
+        "promises": promises,
+        "total": len(promises),
+        "broken_count": broken,
+        "uturn_count": uturn,
+        "pending_count": pending,
+    })
 
 
 @router.post("/promises", response_model=PromiseResponse)
@@ -122,6 +148,8 @@ def create_promise(promise: PromiseCreate, db: Session = Depends(get_db)):
     db.add(db_promise)
     db.commit()
     db.refresh(db_promise)
+    stats_snapshot.invalidate()
+    invalidate("promises")
     return PromiseResponse.model_validate(db_promise)
 
 
@@ -146,28 +174,30 @@ def update_promise(
     promise.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(promise)
+    stats_snapshot.invalidate()
+    invalidate("promises")
     return PromiseResponse.model_validate(promise)
 
 
 # === Poll Endpoints ===
 
 @router.get("/polls/latest", response_model=PollResponse)
-def get_latest_poll(db: Session = Depends(get_db)):
+async def get_latest_poll(db: ReadSession = Depends(get_read_db)):
     """Get the most recent polling data."""
-    poll = db.query(Poll).order_by(Poll.date.desc()).first()
+    poll = await db.scalar(select(Poll).order_by(Poll.date.desc()).limit(1))
     if not poll:
         raise HTTPException(status_code=404, detail="No polling data available")
     return PollResponse.model_validate(poll)
 
 
 @router.get("/polls/history", response_model=PollHistoryResponse)
-def get_poll_history(
+async def get_poll_history(
     days: int = Query(90, ge=7, le=365),
-    db: Session = Depends(get_db),
+    db: ReadSession = Depends(get_read_db),
 ):
     """Get historical polling data for charts."""
     since = datetime.utcnow() - timedelta(days=days)
-    polls = db.query(Poll).filter(Poll.date >= since).order_by(Poll.date).all()
+    polls = (await db.scalars(select(Poll).where(Poll.date >= since).order_by(Poll.date))).all()
 
     if not polls:
         return PollHistoryResponse(
@@ -190,23 +220,19 @@ def get_poll_history(
 # === Tier List Endpoints ===
 
 @router.get("/tier-list", response_model=TierListResponse)
-def get_tier_list(db: Session = Depends(get_db)):
+async def get_tier_list(db: ReadSession = Depends(get_read_db)):
     """Get the tier list with vote averages."""
-    items = db.query(TierItem).filter(TierItem.is_active == True).all()
-
-    items_with_votes = []
-    total_votes = 0
-
-    for item in items:
-        votes = db.query(TierVote).filter(TierVote.item_id == item.id).all()
-        vote_count = len(votes)
-        total_votes += vote_count
+    average = func.coalesce(TierItem.vote_sum * 1.0 / func.nullif(TierItem.vote_count, 0), 0)
 
-        avg_vote = None
-        if votes:
-            avg_vote = sum(v.vote_value for v in votes if v.vote_value) / vote_count
-
-        item_response = TierItemResponse(
+    # Sort by average vote (worst first)
+    items = (await db.scalars(
+        select(TierItem)
+        .where(TierItem.is_active == True)
+        .order_by(average.desc(), TierItem.id)
+    )).all()
+
+    items_with_votes = [
+        TierItemResponse(
             id=item.id,
             description=item.description,
             category=item.category,
@@ -214,13 +240,12 @@ def get_tier_list(db: Session = Depends(get_db)):
             source_url=item.source_url,
             created_at=item.created_at,
             is_active=item.is_active,
-            average_vote=avg_vote,
-            vote_count=vote_count,
+            average_vote=item.average_vote,
+            vote_count=item.vote_count,
         )
-        items_with_votes.append(item_response)
-
-    # Sort by average vote (worst first)
-    items_with_votes.sort(key=lambda x: x.average_vote or 0, reverse=True)
+        for item in items
+    ]
+    total_votes = sum(item.vote_count for item in items)
 
     return TierListResponse(items=items_with_votes, total_votes=total_votes)
 
@@ -241,79 +266,87 @@ def vote_on_tier_item(
     client_ip = request.client.host if request.client else "unknown"
     ip_hash = hashlib.sha256(client_ip.encode()).hexdigest()
 
-    # Check for existing vote from this IP in last 24 hours
-    since = datetime.utcnow() - timedelta(hours=24)
-    existing = db.query(TierVote).filter(
-        TierVote.item_id == vote.item_id,
-        TierVote.voter_ip_hash == ip_hash,
-        TierVote.created_at >= since,
-    ).first()
-
-    if existing:
+    # One vote per item per IP in a 24 hour window
+    if not get_rate_limiter().allow("tier_vote", f"{item.id}:{ip_hash}"):
         raise HTTPException(status_code=429, detail="Already voted on this item recently")
 
-    # Create vote
-    db_vote = TierVote(
-        item_id=vote.item_id,
-        item_description=item.description,
-        vote_value=vote.vote_value,
-        voter_ip_hash=ip_hash,
-    )
-    db.add(db_vote)
-    db.commit()
-
-    # Calculate new average
-    votes = db.query(TierVote).filter(TierVote.item_id == vote.item_id).all()
-    total = len(votes)
-    avg = sum(v.vote_value for v in votes if v.vote_value) / total
+    buffer = get_vote_buffer()
+    if buffer.accepting():
+        # Written by the vote buffer's next flush
+        pending_sum, pending_count = buffer.add_tier_vote(
+            item.id, item.description, vote.vote_value, ip_hash
+        )
+        total = item.vote_count + pending_count
+        avg = (item.vote_sum + pending_sum) / total
+    else:
+        # Insert the vote and update the running aggregates in one transaction
+        apply_tier_votes(db, [{
+            "item_id": item.id,
+            "item_description": item.description,
+            "vote_value": vote.vote_value,
+            "voter_ip_hash": ip_hash,
+            "created_at": datetime.utcnow(),
+        }])
+        db.commit()
+        db.refresh(item)
+        invalidate("tier-list")
+        avg = item.average_vote
+        total = item.vote_count
 
     return TierVoteResponse(success=True, new_average=avg, total_votes=total)
 
 
 # === Admin Endpoints ===
 
-@router.post("/admin/scrape", response_model=ScrapeResponse)
+@router.post("/admin/scrape", response_model=JobResponse, status_code=202)
 def trigger_scrape(db: Session = Depends(get_db)):
-    """Manually trigger a scrape run."""
-    scraper = RSSScraper()
-    content_filter = ContentFilter()
-
-    try:
-        articles = scraper.scrape()
-        filtered = content_filter.filter_articles(articles)
-
-        saved = 0
-        for fa in filtered:
-            existing = db.query(Article).filter(Article.url == fa.article.url).first()
-            if not existing:
-                article = Article(
-                    title=fa.article.title,
-                    url=fa.article.url,
-                    source=fa.article.source,
-                    published_at=fa.article.published_at,
-                    sentiment_score=fa.sentiment_score,
-                    content_snippet=fa.article.content_snippet,
-                    category=fa.article.category,
-                )
-                db.add(article)
-                saved += 1
+    """Queue a full scrape. Poll /admin/jobs/{id} for its status and counts."""
+    job = enqueue(db, "scrape", {"due_only": False}, unique=True)
+    db.commit()
+    return job_response(job)
+
+
+@router.get("/admin/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_db)):
+    """Get the status of a background job."""
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_response(job)
+
+
+def job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        kind=job.kind,
+        status=job.status,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        run_at=job.run_at,
+        created_at=job.created_at,
+        started_at=job.locked_at,
+        finished_at=job.finished_at,
+        last_error=job.last_error,
+        result=decode(job.result),
+    )
 
-        db.commit()
 
-        return ScrapeResponse(
-            success=True,
-            articles_found=len(filtered),
-            articles_saved=saved,
-            message=f"Scrape completed. Found {len(filtered)} negative articles, saved {saved} new.",
-        )
+@router.get("/admin/feeds", response_model=FeedStateListResponse)
+def get_feed_states(db: Session = Depends(get_db)):
+    """Get per-source polling state: cache hit/miss counts, learned rate and next poll."""
+    feeds = db.query(FeedState).order_by(FeedState.source_name).all()
+
+    return FeedStateListResponse(
+        feeds=[FeedStateResponse.model_validate(f) for f in feeds],
+        total_not_modified=sum(f.not_modified_count or 0 for f in feeds),
+        total_fetched=sum(f.fetched_count or 0 for f in feeds),
+    )
 
-    except Exception as e:
-        return ScrapeResponse(
-            success=False,
-            articles_found=0,
-            articles_saved=0,
-            message=f"Scrape failed: {str(e)}",
-        )
+
+@router.get("/admin/sentiment-cache", response_model=SentimentCacheStats)
+def get_sentiment_cache_stats():
+    """Get sentiment score cache hit ratio and eviction counts."""
+    return SentimentCacheStats(**get_sentiment_cache().stats())
 
 
 @router.post("/admin/post", response_model=ManualPostResponse)
@@ -348,6 +381,7 @@ def manual_post(
         article.is_posted = True
         article.posted_at = datetime.utcnow()
         db.commit()
+        invalidate("articles")
 
         return ManualPostResponse(
             success=True,
@@ -364,53 +398,27 @@ def manual_post(
 @router.get("/admin/queue", response_model=PostQueueResponse)
 def get_post_queue(db: Session = Depends(get_db)):
     """Get the current post queue."""
-    pending = db.query(XPost).filter(XPost.status == "pending").all()
-    scheduled = db.query(XPost).filter(
+    columns = schema_columns(XPost, XPostResponse)
+    pending = row_dicts(db.query(*columns).filter(XPost.status == "pending"))
+    scheduled = row_dicts(db.query(*columns).filter(
         XPost.status == "scheduled",
         XPost.scheduled_for > datetime.utcnow()
-    ).order_by(XPost.scheduled_for).all()
+    ).order_by(XPost.scheduled_for))
 
-    return PostQueueResponse(
-        pending=[XPostResponse.model_validate(p) for p in pending],
-        scheduled=[XPostResponse.model_validate(s) for s in scheduled],
-        total_pending=len(pending),
-        total_scheduled=len(scheduled),
-    )
+    return FastJSONResponse({
+        "pending": pending,
+        "scheduled": scheduled,
+        "total_pending": len(pending),
+        "total_scheduled": len(scheduled),
+    })
 
 
 # === Dashboard Stats ===
 
 @router.get("/stats", response_model=DashboardStats)
 def get_dashboard_stats(db: Session = Depends(get_db)):
-    """Get dashboard statistics."""
-    total_articles = db.query(Article).count()
-    negative_articles = db.query(Article).filter(
-        Article.sentiment_score < settings.sentiment_threshold
-    ).count()
-
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    posts_today = db.query(XPost).filter(
-        XPost.posted_at >= today,
-        XPost.status == "posted"
-    ).count()
-    posts_total = db.query(XPost).filter(XPost.status == "posted").count()
-
-    broken_promises = db.query(Promise).filter(
-        Promise.status.in_(["broken", "u-turn"])
-    ).count()
-
-    latest_poll = db.query(Poll).order_by(Poll.date.desc()).first()
-    latest_approval = latest_poll.approval_rating if latest_poll else None
-
-    return DashboardStats(
-        total_articles=total_articles,
-        negative_articles=negative_articles,
-        posts_today=posts_today,
-        posts_total=posts_total,
-        broken_promises=broken_promises,
-        latest_approval_rating=latest_approval,
-        days_since_disaster=0,  # Always 0 for satirical effect
-    )
+    """Get dashboard statistics (served from the in-memory snapshot)."""
+    return stats_snapshot.get(db)
 
 
 @router.post("/admin/seed")
@@ -463,63 +471,94 @@ def seed_data(db: Session = Depends(get_db)):
             items_added += 1
 
     db.commit()
+    stats_snapshot.invalidate()
+    invalidate("polls", "tier-list")
 
     return {"success": True, "polls_added": polls_added, "tier_items_added": items_added}
 
 
+@router.get("/admin/response-cache")
+def get_response_cache_stats():
+    """Get response cache hit/miss counters."""
+    return get_response_cache().stats()
+
+
+@router.get("/admin/db-pool")
+def get_db_pool_stats():
+    """Get connection pool occupancy and checkout wait times."""
+    return pool_stats()
+
+
+@router.get("/admin/vote-buffer")
+def get_vote_buffer_stats():
+    """Get write-behind vote buffer counters."""
+    return get_vote_buffer().stats()
+
+
+@router.post("/admin/tier-list/reconcile")
+def reconcile_tier_list(db: Session = Depends(get_db)):
+    """Rebuild tier item vote aggregates from the raw votes."""
+    items_fixed = reconcile_tier_votes(db)
+    db.commit()
+    invalidate("tier-list")
+    return {"success": True, "items_fixed": items_fixed}
+
+
 # === Cope Endpoints (Wall of Cope) ===
 
+COPE_LIST_COLUMNS = (
+    "id", "content", "source_url", "source_platform", "source_username",
+    "category", "cope_level", "votes", "created_at",
+)
+
+
 @router.get("/cope")
-def get_cope_entries(
+async def get_cope_entries(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     category: Optional[str] = None,
     sort_by: str = Query("votes", regex="^(votes|recent|cope_level)$"),
-    db: Session = Depends(get_db),
+    db: ReadSession = Depends(get_read_db),
 ):
-    """Get approved cope entries."""
+    """
+    Get approved cope entries.
+
+    The body stays a plain list; the cursor for the next page is returned
+    in the X-Next-Cursor header when there are more entries.
+    """
     from ..database import CopeEntry
 
-    query = db.query(CopeEntry).filter(CopeEntry.is_approved == True)
+    query = select(
+        *[getattr(CopeEntry, name) for name in COPE_LIST_COLUMNS]
+    ).where(CopeEntry.is_approved == True)
 
     if category:
-        query = query.filter(CopeEntry.category == category)
+        query = query.where(CopeEntry.category == category)
 
-    if sort_by == "votes":
-        query = query.order_by(CopeEntry.votes.desc())
-    elif sort_by == "recent":
-        query = query.order_by(CopeEntry.created_at.desc())
+    if sort_by == "recent":
+        column = CopeEntry.created_at
     elif sort_by == "cope_level":
-        query = query.order_by(CopeEntry.cope_level.desc())
-
-    total = query.count()
-    entries = query.offset(offset).limit(limit).all()
-
-    return [
-        {
-            "id": e.id,
-            "content": e.content,
-            "source_url": e.source_url,
-            "source_platform": e.source_platform,
-            "source_username": e.source_username,
-            "category": e.category,
-            "cope_level": e.cope_level,
-            "votes": e.votes,
-            "created_at": e.created_at.isoformat(),
-        }
-        for e in entries
-    ]
+        column = CopeEntry.cope_level
+    else:
+        column = CopeEntry.votes
+
+    entries, has_more, next_cursor = await paginate_async(
+        db, query, column, CopeEntry.id, True, sort_by, limit, cursor=cursor, offset=offset,
+    )
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return FastJSONResponse(row_dicts(entries), headers=headers)
 
 
 @router.get("/cope/featured")
-def get_featured_cope(db: Session = Depends(get_db)):
+async def get_featured_cope(db: ReadSession = Depends(get_read_db)):
     """Get cope of the week."""
     from ..database import CopeEntry
 
-    entry = db.query(CopeEntry).filter(
+    entry = await db.scalar(select(CopeEntry).where(
         CopeEntry.is_featured == True,
         CopeEntry.is_approved == True
-    ).first()
+    ).limit(1))
 
     if not entry:
         # Return a default/mock featured entry
@@ -569,14 +608,8 @@ def submit_cope(
     client_ip = request.client.host if request and request.client else "unknown"
     ip_hash = hashlib.sha256(client_ip.encode()).hexdigest()[:16]
 
-    # Check for existing submissions from this IP in last 24 hours
-    since = datetime.utcnow() - timedelta(hours=24)
-    recent_submissions = db.query(CopeEntry).filter(
-        CopeEntry.submitted_by_ip_hash == ip_hash,
-        CopeEntry.created_at > since
-    ).count()
-
-    if recent_submissions >= 5:
+    # At most 5 submissions per IP in a 24 hour window
+    if not get_rate_limiter().allow("cope_submit", ip_hash):
         raise HTTPException(429, "Too many submissions. Try again later.")
 
     # Create entry (not approved by default)
@@ -605,10 +638,17 @@ def vote_cope(cope_id: int, db: Session = Depends(get_db)):
     if not entry:
         raise HTTPException(404, "Cope not found")
 
-    entry.votes += 1
-    db.commit()
+    buffer = get_vote_buffer()
+    if buffer.accepting():
+        votes = entry.votes + buffer.add_cope_vote(cope_id)
+    else:
+        apply_cope_votes(db, {cope_id: 1})
+        db.commit()
+        invalidate("cope")
+        db.refresh(entry)
+        votes = entry.votes
 
-    return {"success": True, "votes": entry.votes}
+    return {"success": True, "votes": votes}
 
 
 @router.get("/admin/cope/pending")
@@ -616,21 +656,18 @@ def get_pending_cope(db: Session = Depends(get_db)):
     """Get pending cope entries for moderation (admin only)."""
     from ..database import CopeEntry
 
-    entries = db.query(CopeEntry).filter(
+    entries = db.query(
+        CopeEntry.id,
+        CopeEntry.content,
+        CopeEntry.source_url,
+        CopeEntry.source_platform,
+        CopeEntry.category,
+        CopeEntry.created_at,
+    ).filter(
         CopeEntry.is_approved == False
-    ).order_by(CopeEntry.created_at.desc()).all()
-
-    return [
-        {
-            "id": e.id,
-            "content": e.content,
-            "source_url": e.source_url,
-            "source_platform": e.source_platform,
-            "category": e.category,
-            "created_at": e.created_at.isoformat(),
-        }
-        for e in entries
-    ]
+    ).order_by(CopeEntry.created_at.desc())
+
+    return FastJSONResponse(row_dicts(entries))
 
 
 @router.post("/admin/cope/{cope_id}/approve")
@@ -650,6 +687,7 @@ def approve_cope(
     entry.cope_level = cope_level
     entry.approved_at = datetime.utcnow()
     db.commit()
+    invalidate("cope")
 
     return {"success": True, "message": "Cope approved"}
 
@@ -670,5 +708,54 @@ def feature_cope(cope_id: int, db: Session = Depends(get_db)):
 
     entry.is_featured = True
     db.commit()
+    invalidate("cope")
 
     return {"success": True, "message": "Cope set as featured"}
+
+
+# === Page Bundles ===
+
+HOME_SECTIONS = ("articles", "stats", "latest_poll", "poll_history", "promises", "tier_list")
+
+
+@router.get("/bundle/home")
+async def get_home_bundle(
+    sections: str = Query(",".join(HOME_SECTIONS), description="Comma-separated sections to include"),
+    articles_limit: int = Query(6, ge=1, le=100),
+    poll_days: int = Query(90, ge=7, le=365),
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Get the homepage data in one response.
+
+    Each section matches the body of its standalone endpoint
+    (/articles?limit=, /stats, /polls/latest, /polls/history?days=,
+    /promises, /tier-list); latest_poll is null when there are no polls.
+    """
+    requested = [name.strip() for name in sections.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(HOME_SECTIONS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown sections: {', '.join(unknown)}")
+
+    available = {
+        "articles": BundleSection(
+            "articles", "/articles",
+            lambda session: get_articles(
+                limit=articles_limit, offset=0, cursor=None, category=None,
+                sort_by="published_at", include_total=False, db=session,
+            ),
+            [("limit", str(articles_limit))],
+        ),
+        # The stats snapshot is sync; run_sync gives it a Session on this connection
+        "stats": BundleSection("stats", "/stats", lambda session: session.run_sync(get_dashboard_stats)),
+        "latest_poll": BundleSection("latest_poll", "/polls/latest", get_latest_poll),
+        "poll_history": BundleSection(
+            "poll_history", "/polls/history",
+            lambda session: get_poll_history(days=poll_days, db=session),
+            [("days", str(poll_days))],
+        ),
+        "promises": BundleSection("promises", "/promises", get_promises),
+        "tier_list": BundleSection("tier_list", "/tier-list", get_tier_list),
+    }
+    # Keep the client's order, without duplicates
+    return await render_bundle([available[name] for name in dict.fromkeys(requested)], db)
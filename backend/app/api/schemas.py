@@ -30,10 +30,11 @@ class ArticleResponse(ArticleBase):
 
 class ArticleListResponse(BaseModel):
     articles: List[ArticleResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # Cached estimate, only when include_total=true
+    page: Optional[int] = None  # Only for offset paging
     per_page: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 # Promise schemas
@@ -175,11 +176,51 @@ class PostQueueResponse(BaseModel):
 
 
 # Admin schemas
-class ScrapeResponse(BaseModel):
-    success: bool
-    articles_found: int
-    articles_saved: int
-    message: str
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    result: Optional[dict] = None
+
+
+class FeedStateResponse(BaseModel):
+    source_name: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified_count: int = 0
+    fetched_count: int = 0
+    last_polled_at: Optional[datetime] = None
+    latest_published_at: Optional[datetime] = None
+    new_entries_per_hour: Optional[float] = None
+    poll_interval_minutes: Optional[float] = None
+    next_poll_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class FeedStateListResponse(BaseModel):
+    feeds: List[FeedStateResponse]
+    total_not_modified: int
+    total_fetched: int
+
+
+class SentimentCacheStats(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    store_hits: int
+    evictions: int
+    hit_ratio: float
+    persistent: bool
 
 
 class ManualPostRequest(BaseModel):
@@ -0,0 +1,36 @@
+"""
+Fast serialization for large list responses.
+
+List endpoints select only the columns their response schema needs and
+turn the result rows straight into dicts, skipping per-row Pydantic
+validation and FastAPI's jsonable_encoder pass. FastJSONResponse then
+encodes with orjson.
+"""
+
+from typing import Any, Iterable, List, Type
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact JSON bytes."""
+    return orjson.dumps(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def schema_columns(model, schema: Type[BaseModel]) -> list:
+    """The model columns backing each field of a response schema, in field order."""
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def row_dicts(rows: Iterable) -> List[dict]:
+    """Convert column-tuple result rows into plain dicts."""
+    return [dict(row._mapping) for row in rows]
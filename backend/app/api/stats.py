@@ -0,0 +1,117 @@
+"""
+Dashboard statistics.
+
+All counts are computed in one statement with conditional aggregates,
+and the result is held as a snapshot that the homepage reads from
+memory. The snapshot is refreshed after each scrape and posting run,
+and recomputed on read once it is older than STATS_CACHE_TTL_SECONDS.
+A changed snapshot bumps the "stats" response cache tag, which is what
+the /stats ETag is derived from.
+"""
+
+from datetime import datetime
+from threading import Lock
+from typing import Optional, Tuple
+import logging
+import time
+
+from sqlalchemy import func, select, true
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import SessionLocal, Article, Poll, Promise, XPost
+from .response_cache import invalidate
+from .schemas import DashboardStats
+
+logger = logging.getLogger(__name__)
+
+
+def compute_dashboard_stats(db: Session) -> DashboardStats:
+    """Compute the dashboard counts with a single query."""
+    threshold = get_settings().sentiment_threshold
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    articles = select(
+        func.count().label("total"),
+        func.count().filter(Article.sentiment_score < threshold).label("negative"),
+    ).select_from(Article).subquery()
+
+    posts = select(
+        func.count().filter(XPost.status == "posted").label("total"),
+        func.count().filter(XPost.status == "posted", XPost.posted_at >= today).label("today"),
+    ).select_from(XPost).subquery()
+
+    promises = select(
+        func.count().filter(Promise.status.in_(["broken", "u-turn"])).label("broken"),
+    ).select_from(Promise).subquery()
+
+    latest_approval = (
+        select(Poll.approval_rating).order_by(Poll.date.desc()).limit(1).scalar_subquery()
+    )
+
+    # Each subquery is a single row; join them explicitly rather than as a cartesian FROM list
+    row = db.execute(select(
+        articles.c.total,
+        articles.c.negative,
+        posts.c.today,
+        posts.c.total,
+        promises.c.broken,
+        latest_approval,
+    ).select_from(articles.join(posts, true()).join(promises, true()))).one()
+
+    return DashboardStats(
+        total_articles=row[0],
+        negative_articles=row[1],
+        posts_today=row[2],
+        posts_total=row[3],
+        broken_promises=row[4],
+        latest_approval_rating=row[5],
+        days_since_disaster=0,  # Always 0 for satirical effect
+    )
+
+
+class StatsSnapshot:
+    """The latest DashboardStats, kept in memory with a short TTL."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, session_factory=SessionLocal):
+        self.ttl = ttl_seconds if ttl_seconds is not None else get_settings().stats_cache_ttl_seconds
+        self.session_factory = session_factory
+        self._snapshot: Optional[Tuple[float, DashboardStats]] = None
+        self._lock = Lock()
+
+    def get(self, db: Session) -> DashboardStats:
+        """Return the snapshot, recomputing it with db if it is missing or stale."""
+        with self._lock:
+            snapshot = self._snapshot
+        if snapshot and time.monotonic() - snapshot[0] < self.ttl:
+            return snapshot[1]
+
+        stats = compute_dashboard_stats(db)
+        self._store(stats)
+        return stats
+
+    def refresh(self):
+        """Recompute the snapshot now, after an event that changes the counts."""
+        db = self.session_factory()
+        try:
+            self._store(compute_dashboard_stats(db))
+        except Exception as e:
+            logger.error(f"Error refreshing dashboard stats: {e}")
+            self.invalidate()
+        finally:
+            db.close()
+
+    def _store(self, stats: DashboardStats):
+        with self._lock:
+            changed = self._snapshot is not None and self._snapshot[1] != stats
+            self._snapshot = (time.monotonic(), stats)
+        if changed:
+            invalidate("stats")
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+        invalidate("stats")
+
+
+stats_snapshot = StatsSnapshot()
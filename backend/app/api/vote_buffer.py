@@ -0,0 +1,241 @@
+"""
+Write-behind buffering for tier list and Wall of Cope votes.
+
+Votes are coalesced in memory and written by a background thread every
+flush interval as batched atomic increments (votes = votes + n) and one
+bulk insert of tier votes, instead of one commit per request. At most
+one interval's worth of votes (or max_pending votes, whichever comes
+first) is held in memory at a time; once max_pending is reached, votes
+are written through directly by the request. A failed flush is retried
+with the next one up to max_retries times, then its votes are dropped
+and counted, so a bad row or a long outage cannot grow the buffer or
+retry the same batch forever. The buffer is flushed on stop.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import SessionLocal, CopeEntry, TierItem, TierVote
+from .response_cache import invalidate
+
+logger = logging.getLogger(__name__)
+
+
+def apply_cope_votes(db: Session, counts: Dict[int, int]):
+    """Add vote counts to cope entries with one batched atomic UPDATE."""
+    if not counts:
+        return
+    table = CopeEntry.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("cope_id"))
+        .values(votes=table.c.votes + bindparam("n"))
+    )
+    db.connection().execute(stmt, [{"cope_id": k, "n": n} for k, n in counts.items()])
+
+
+def apply_tier_votes(db: Session, rows: List[dict]):
+    """Insert tier votes in bulk and bump each item's running aggregates."""
+    if not rows:
+        return
+    db.execute(insert(TierVote), rows)
+
+    totals: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+    for row in rows:
+        totals[row["item_id"]][0] += row["vote_value"] or 0
+        totals[row["item_id"]][1] += 1
+
+    table = TierItem.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("item_id"))
+        .values(
+            vote_sum=table.c.vote_sum + bindparam("add_sum"),
+            vote_count=table.c.vote_count + bindparam("add_count"),
+        )
+    )
+    db.connection().execute(stmt, [
+        {"item_id": item_id, "add_sum": s, "add_count": c}
+        for item_id, (s, c) in totals.items()
+    ])
+
+
+class VoteBuffer:
+    """In-process write-behind buffer for votes."""
+
+    def __init__(
+        self,
+        flush_interval: float = 0.25,
+        max_pending: int = 1000,
+        max_retries: int = 3,
+        session_factory=SessionLocal,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.session_factory = session_factory
+
+        self._cope: Dict[int, int] = defaultdict(int)
+        self._tier: List[dict] = []
+        self._pending = 0
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._wake = Event()
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+
+        self.flushes = 0
+        self.votes_written = 0
+        self.failed_flushes = 0
+        self.consecutive_failures = 0
+        self.votes_dropped = 0
+        self.write_throughs = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def accepting(self) -> bool:
+        """Whether to queue a vote: False when stopped or full, and the caller writes it directly."""
+        with self._lock:
+            if not self.running:
+                return False
+            if self._pending >= self.max_pending:
+                self.write_throughs += 1
+                return False
+            return True
+
+    def add_cope_vote(self, cope_id: int) -> int:
+        """Queue one cope vote. Returns the votes now pending for the entry."""
+        with self._lock:
+            self._cope[cope_id] += 1
+            self._note_pending()
+            return self._cope[cope_id]
+
+    def add_tier_vote(
+        self, item_id: int, item_description: str, vote_value: int, voter_ip_hash: str
+    ) -> Tuple[int, int]:
+        """Queue one tier list vote. Returns the (sum, count) now pending for the item."""
+        with self._lock:
+            self._tier.append({
+                "item_id": item_id,
+                "item_description": item_description,
+                "vote_value": vote_value,
+                "voter_ip_hash": voter_ip_hash,
+                "created_at": datetime.utcnow(),
+            })
+            self._note_pending()
+            values = [row["vote_value"] for row in self._tier if row["item_id"] == item_id]
+            return sum(values), len(values)
+
+    def _note_pending(self):
+        # Caller holds self._lock
+        self._pending += 1
+        if self._pending >= self.max_pending:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write all queued votes in one transaction. Returns the number written."""
+        with self._flush_lock:
+            with self._lock:
+                cope, self._cope = dict(self._cope), defaultdict(int)
+                tier, self._tier = self._tier, []
+                self._pending = 0
+
+            written = sum(cope.values()) + len(tier)
+            if not written:
+                return 0
+
+            db = self.session_factory()
+            try:
+                apply_cope_votes(db, cope)
+                apply_tier_votes(db, tier)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                with self._lock:
+                    self.failed_flushes += 1
+                    self.consecutive_failures += 1
+                    give_up = self.consecutive_failures > self.max_retries
+                    if give_up:
+                        self.consecutive_failures = 0
+                        self.votes_dropped += written
+                if give_up:
+                    logger.error(f"Error flushing votes, dropping {written} after {self.max_retries} retries: {e}")
+                else:
+                    logger.error(f"Error flushing votes, re-queueing {written}: {e}")
+                    self._requeue(cope, tier)
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self.consecutive_failures = 0
+                self.flushes += 1
+                self.votes_written += written
+            invalidate(*[tag for tag, changed in (("cope", cope), ("tier-list", tier)) if changed])
+            return written
+
+    def _requeue(self, cope: Dict[int, int], tier: List[dict]):
+        with self._lock:
+            for cope_id, n in cope.items():
+                self._cope[cope_id] += n
+            self._tier[:0] = tier
+            self._pending += sum(cope.values()) + len(tier)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def start(self):
+        """Start the background flush thread."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="vote-buffer", daemon=True)
+        self._thread.start()
+        logger.info(f"Vote buffer started (flush every {self.flush_interval * 1000:.0f}ms)")
+
+    def stop(self):
+        """Stop the flush thread and write out anything still queued."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        written = self.flush()
+        logger.info(f"Vote buffer stopped ({written} votes flushed on shutdown)")
+
+    def stats(self) -> dict:
+        """Get buffer counters for monitoring."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "pending": self._pending,
+                "flushes": self.flushes,
+                "votes_written": self.votes_written,
+                "failed_flushes": self.failed_flushes,
+                "votes_dropped": self.votes_dropped,
+                "write_throughs": self.write_throughs,
+            }
+
+
+@lru_cache()
+def get_vote_buffer() -> VoteBuffer:
+    """Get the process-wide vote buffer."""
+    settings = get_settings()
+    return VoteBuffer(
+        flush_interval=settings.vote_flush_interval_ms / 1000,
+        max_pending=settings.vote_buffer_max_pending,
+        max_retries=settings.vote_flush_max_retries,
+    )
@@ -0,0 +1,170 @@
+"""
+Lease-based leader election for the background scheduler.
+
+Every API worker and replica starts a PostScheduler, but only the one
+holding the "scheduler" row in scheduler_leases runs jobs. The leader
+renews its lease every third of the lease time; when it stops renewing
+(crash, lost database connection, shutdown) the lease expires and the
+next worker to try takes it over. A plain row with an expiry works the
+same on SQLite and PostgreSQL.
+
+Expiry is compared against each process's own clock, so replicas need
+clocks that agree to well within the lease time.
+"""
+
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+import asyncio
+import logging
+import os
+import secrets
+import socket
+
+from sqlalchemy import case, or_
+from sqlalchemy.exc import IntegrityError
+
+from ..database import SessionLocal, SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+
+def default_holder_id() -> str:
+    """A name for this process that is unique across hosts and restarts."""
+    return f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(3)}"
+
+
+class LeaderElection:
+    """Holds, renews and gives up a named lease, reporting changes of leadership."""
+
+    def __init__(
+        self,
+        name: str = "scheduler",
+        lease_seconds: float = 30,
+        session_factory=SessionLocal,
+        on_elected: Optional[Callable[[], None]] = None,
+        on_demoted: Optional[Callable[[], None]] = None,
+        holder_id: Optional[str] = None,
+    ):
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.session_factory = session_factory
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.holder_id = holder_id or default_holder_id()
+        self.is_leader = False
+        self.lease_expires_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def try_acquire(self, now: Optional[datetime] = None) -> bool:
+        """Take or renew the lease. Returns whether this process holds it."""
+        now = now or datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+
+        db = self.session_factory()
+        try:
+            # Renew our own lease, or take over one that has expired
+            updated = db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                or_(SchedulerLease.holder == self.holder_id, SchedulerLease.expires_at < now),
+            ).update({
+                SchedulerLease.acquired_at: case(
+                    (SchedulerLease.holder == self.holder_id, SchedulerLease.acquired_at),
+                    else_=now,
+                ),
+                SchedulerLease.holder: self.holder_id,
+                SchedulerLease.expires_at: expires_at,
+            }, synchronize_session=False)
+
+            if not updated:
+                db.add(SchedulerLease(
+                    name=self.name, holder=self.holder_id, acquired_at=now, expires_at=expires_at,
+                ))
+                try:
+                    db.flush()
+                except IntegrityError:
+                    # Held by another process
+                    db.rollback()
+                    return False
+
+            db.commit()
+            self.lease_expires_at = expires_at
+            return True
+        finally:
+            db.close()
+
+    def release(self):
+        """Give up the lease so another process can take over straight away."""
+        db = self.session_factory()
+        try:
+            db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                SchedulerLease.holder == self.holder_id,
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error releasing {self.name} lease: {e}")
+        finally:
+            db.close()
+        self._set_leader(False)
+
+    @property
+    def renew_interval(self) -> float:
+        """Seconds between election rounds."""
+        return self.lease_seconds / 3
+
+    def tick(self, now: Optional[datetime] = None):
+        """One election round: acquire or renew, then apply any change of leadership."""
+        now = now or datetime.utcnow()
+        try:
+            self._set_leader(self.try_acquire(now))
+        except Exception as e:
+            logger.error(f"Error renewing {self.name} lease: {e}")
+            # Without the database we cannot renew. Stop while the lease is still ours:
+            # the next tick may come only after it has expired and been taken over
+            renew_by = now + timedelta(seconds=self.renew_interval)
+            if self.is_leader and (self.lease_expires_at is None or renew_by >= self.lease_expires_at):
+                self._set_leader(False)
+
+    def _set_leader(self, leader: bool):
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        if leader:
+            logger.info(f"Elected {self.name} leader as {self.holder_id}")
+            callback = self.on_elected
+        else:
+            logger.info(f"No longer {self.name} leader")
+            self.lease_expires_at = None
+            callback = self.on_demoted
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error handling {self.name} leadership change: {e}")
+
+    def start(self):
+        """Start the election loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.is_leader:
+            self.release()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # The lease queries are blocking, so they run off the event loop
+            await loop.run_in_executor(None, self.tick)
+            await asyncio.sleep(self.renew_interval)
+
+    def status(self) -> dict:
+        return {
+            "enabled": True,
+            "is_leader": self.is_leader,
+            "holder_id": self.holder_id,
+            "lease_expires_at": self.lease_expires_at.isoformat() if self.lease_expires_at else None,
+        }
@@ -3,18 +3,27 @@ Post scheduling system for automated posting.
 """
 
 from datetime import datetime, timedelta, time
+from functools import lru_cache
+from threading import Lock
 from typing import List, Optional, Callable
 import logging
 import random
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from ..database import SessionLocal, XPost, Article
+from ..config import get_settings
+from ..database import SessionLocal, XPost, Article, insert_articles
 from ..scrapers.rss_scraper import RSSScraper
+from ..scrapers.feed_state import FeedStateStore
 from ..processors.content_filter import ContentFilter
-from ..processors.formatter import PostFormatter
+from ..processors.formatter import FormattedPost, PostFormatter
+from ..api.stats import stats_snapshot
+from ..api.response_cache import invalidate
+from ..worker.queue import enqueue
 from .x_bot import XBot
 
 logger = logging.getLogger(__name__)
@@ -29,28 +38,58 @@ PEAK_HOURS = [
 
 
 class PostScheduler:
-    """Manages scheduled scraping and posting."""
+    """
+    Manages scheduled scraping and posting.
+
+    The jobs do blocking work (feed fetches, tweepy calls that may sleep
+    on rate limits, SQLAlchemy sessions), so they are plain functions run
+    on a dedicated thread pool; the AsyncIOScheduler only triggers them
+    and the event loop keeps serving requests meanwhile. With
+    enqueue_jobs the scheduler only adds each run to the job queue, for
+    a separate `python -m app.worker` process to run.
+    """
 
     def __init__(
         self,
         bot: XBot,
         scrape_interval_minutes: int = 30,
         posts_per_day: int = 6,
+        adaptive_polling: bool = False,
+        poll_tick_minutes: int = 5,
+        workers: int = 2,
+        enqueue_jobs: bool = False,
     ):
         self.bot = bot
+        self.enqueue_jobs = enqueue_jobs
         self.scrape_interval = scrape_interval_minutes
+        self.adaptive_polling = adaptive_polling
+        self.poll_tick = poll_tick_minutes
         self.posts_per_day = posts_per_day
-        self.scheduler = AsyncIOScheduler()
-        self.scraper = RSSScraper()
+        self.scheduler = AsyncIOScheduler(
+            executors={"default": ThreadPoolExecutor(max_workers=workers)},
+            job_defaults={"coalesce": True, "max_instances": 1},
+        )
+        self.scraper = RSSScraper(state_store=FeedStateStore())
         self.content_filter = ContentFilter()
         self.formatter = PostFormatter()
-
-    def start(self):
-        """Start the scheduler."""
-        # Schedule regular scraping
+        self.paused = False
+        # The scheduled scrape and an embedded job worker share this scraper
+        self._scrape_lock = Lock()
+
+    @property
+    def is_active(self) -> bool:
+        """Whether jobs are being run (started and not paused)."""
+        return self.scheduler.state == STATE_RUNNING
+
+    def start(self, paused: bool = False):
+        """Start the scheduler, optionally paused until resume() (see leader.py)."""
+        # Schedule regular scraping. With adaptive polling the job ticks at the
+        # minimum poll interval and only scrapes feeds that are due.
         self.scheduler.add_job(
-            self.run_scrape,
-            trigger=IntervalTrigger(minutes=self.scrape_interval),
+            self._job("scrape", self.run_scrape, {"due_only": self.adaptive_polling}),
+            trigger=IntervalTrigger(
+                minutes=self.poll_tick if self.adaptive_polling else self.scrape_interval
+            ),
             id="scrape_job",
             name="Scrape news sources",
             replace_existing=True,
@@ -58,7 +97,7 @@ class PostScheduler:
 
         # Schedule daily post planning
         self.scheduler.add_job(
-            self.plan_daily_posts,
+            self._job("plan_posts", self.plan_daily_posts),
             trigger=CronTrigger(hour=6, minute=0),  # 6 AM UK
             id="plan_posts_job",
             name="Plan daily posts",
@@ -67,65 +106,104 @@ class PostScheduler:
 
         # Schedule post execution every 30 minutes
         self.scheduler.add_job(
-            self.execute_scheduled_posts,
+            self._job("execute_posts", self.execute_scheduled_posts),
             trigger=IntervalTrigger(minutes=30),
             id="execute_posts_job",
             name="Execute scheduled posts",
             replace_existing=True,
         )
 
-        self.scheduler.start()
-        logger.info("Scheduler started")
+        self.paused = paused
+        self.scheduler.start(paused=paused)
+        logger.info("Scheduler started" + (" (paused)" if paused else ""))
+
+    def _job(self, kind: str, run: Callable[[], None], payload: Optional[dict] = None) -> Callable[[], None]:
+        """The function to schedule: run itself, or a function queueing a job of this kind."""
+        if not self.enqueue_jobs:
+            return run
+
+        def queue_job():
+            db = SessionLocal()
+            try:
+                job = enqueue(db, kind, payload, unique=True)
+                db.commit()
+                logger.info(f"Queued {kind} job {job.id}")
+            except Exception as e:
+                logger.error(f"Error queueing {kind} job: {e}")
+            finally:
+                db.close()
+
+        return queue_job
+
+    def pause(self):
+        """Stop running jobs without removing them; a running job finishes its current step."""
+        self.paused = True
+        if self.scheduler.running:
+            self.scheduler.pause()
+            logger.info("Scheduler paused")
+
+    def resume(self):
+        self.paused = False
+        if self.scheduler.running:
+            self.scheduler.resume()
+            logger.info("Scheduler resumed")
 
     def stop(self):
         """Stop the scheduler."""
+        if not self.scheduler.running:
+            return
         self.scheduler.shutdown()
         logger.info("Scheduler stopped")
 
-    async def run_scrape(self):
+    def run_scrape(self):
         """Run a scraping job."""
         logger.info("Starting scheduled scrape...")
 
         try:
-            # Scrape RSS feeds
-            articles = self.scraper.scrape()
+            self.scrape_and_store(due_only=self.adaptive_polling)
+        except Exception as e:
+            logger.error(f"Error in scheduled scrape: {e}")
+
+    def scrape_and_store(self, due_only: bool = False) -> dict:
+        """
+        Scrape the feeds (only those due for polling if due_only), filter and save.
+
+        Returns the counts; errors are raised to the caller.
+        """
+        with self._scrape_lock:
+            return self._scrape_and_store(due_only)
 
+    def _scrape_and_store(self, due_only: bool) -> dict:
+        # Scrape RSS feeds
+        sources = self.scraper.due_sources() if due_only else None
+        if sources == []:
+            logger.info("No feeds due for polling")
+            return {"articles_found": 0, "articles_saved": 0}
+        articles = self.scraper.scrape(sources)
+
+        db = SessionLocal()
+        try:
             # Filter for negative Starmer content
             filtered = self.content_filter.filter_articles(articles)
 
             # Save to database
-            db = SessionLocal()
-            try:
-                saved = 0
-                for fa in filtered:
-                    # Check if URL already exists
-                    existing = db.query(Article).filter(
-                        Article.url == fa.article.url
-                    ).first()
-
-                    if not existing:
-                        article = Article(
-                            title=fa.article.title,
-                            url=fa.article.url,
-                            source=fa.article.source,
-                            published_at=fa.article.published_at,
-                            sentiment_score=fa.sentiment_score,
-                            content_snippet=fa.article.content_snippet,
-                            category=fa.article.category,
-                        )
-                        db.add(article)
-                        saved += 1
-
-                db.commit()
-                logger.info(f"Saved {saved} new articles")
-
-            finally:
-                db.close()
+            result = insert_articles(db, [fa.to_row() for fa in filtered])
+            db.commit()
+            logger.info(f"Saved {result.inserted} new articles")
+        except Exception:
+            # Leave the feeds' high-water marks where they were so the entries are fetched again
+            self.scraper.rollback_feed_states()
+            raise
+        finally:
+            db.close()
+        self.scraper.commit_feed_states()
 
-        except Exception as e:
-            logger.error(f"Error in scheduled scrape: {e}")
+        stats_snapshot.refresh()
+        if result.inserted:
+            invalidate("articles")
+        return {"articles_found": len(filtered), "articles_saved": result.inserted}
 
-    async def plan_daily_posts(self):
+    def plan_daily_posts(self):
         """Plan posts for the day based on peak hours."""
         logger.info("Planning daily posts...")
 
@@ -162,7 +240,7 @@ class PostScheduler:
         finally:
             db.close()
 
-    async def execute_scheduled_posts(self):
+    def execute_scheduled_posts(self):
         """Execute posts that are due."""
         if not self.bot.is_configured():
             logger.warning("Bot not configured. Skipping post execution.")
@@ -178,6 +256,11 @@ class PostScheduler:
             ).all()
 
             for x_post in due_posts:
+                if self.paused:
+                    # Leadership moved to another process mid-run
+                    logger.warning("Scheduler paused, leaving remaining posts to the new leader")
+                    break
+
                 formatted = FormattedPost(
                     text=x_post.post_text,
                     article_id=x_post.article_id,
@@ -200,6 +283,9 @@ class PostScheduler:
                     x_post.status = "failed"
 
             db.commit()
+            if due_posts:
+                stats_snapshot.refresh()
+                invalidate("articles")
 
         finally:
             db.close()
@@ -271,3 +357,31 @@ class PostScheduler:
             ).order_by(XPost.scheduled_for).all()
         finally:
             db.close()
+
+
+def create_post_scheduler() -> PostScheduler:
+    """Build a PostScheduler and its X bot from settings."""
+    settings = get_settings()
+    bot = XBot(
+        api_key=settings.x_api_key,
+        api_secret=settings.x_api_secret,
+        access_token=settings.x_access_token,
+        access_token_secret=settings.x_access_token_secret,
+        community_id=settings.x_community_id,
+        max_posts_per_day=settings.max_posts_per_day,
+        min_minutes_between_posts=settings.min_minutes_between_posts,
+    )
+    return PostScheduler(
+        bot=bot,
+        scrape_interval_minutes=settings.scrape_interval_minutes,
+        adaptive_polling=settings.adaptive_polling,
+        poll_tick_minutes=settings.feed_poll_min_minutes,
+        workers=settings.scheduler_workers,
+        enqueue_jobs=settings.scheduler_enqueue_jobs,
+    )
+
+
+@lru_cache()
+def get_post_scheduler() -> PostScheduler:
+    """Get the process-wide PostScheduler, shared by the API lifespan and the job handlers."""
+    return create_post_scheduler()
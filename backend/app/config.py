@@ -5,7 +5,7 @@ Loads environment variables and provides application settings.
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -13,6 +13,18 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./starmer_watch.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0  # wait for a free connection before failing
+    db_pool_recycle_seconds: int = 1800  # -1 keeps connections indefinitely
+    db_pool_pre_ping: bool = True
+    db_pool_wait_warn_ms: int = 100  # checkouts waiting longer count as slow
+    db_statement_timeout_ms: int = 0  # PostgreSQL only; 0 leaves the server default
+    sqlite_wal: bool = True  # readers no longer block behind scrape commits
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_mmap_size: int = 268435456  # bytes; 0 disables memory-mapped I/O
+    sqlite_busy_timeout_ms: int = 5000
+    async_reads: bool = False  # serve the read routes from the async engine (asyncpg / aiosqlite)
 
     # X/Twitter API
     x_api_key: Optional[str] = None
@@ -24,6 +36,40 @@ class Settings(BaseSettings):
     # Scraper Settings
     scrape_interval_minutes: int = 30
     sentiment_threshold: float = -0.2
+    sentiment_cache_size: int = 4096
+    sentiment_cache_persistent: bool = False
+    sentiment_workers: int = 0  # 0 scores in-process
+    sentiment_chunk_size: int = 64
+
+    # Feed Fetching
+    rss_fetch_concurrency: int = 8
+    rss_fetch_timeout_seconds: float = 10.0
+    rss_scrape_deadline_seconds: float = 60.0
+
+    # Adaptive Feed Polling
+    adaptive_polling: bool = True
+    feed_poll_min_minutes: int = 5
+    feed_poll_max_minutes: int = 180
+
+    # Vote Buffering
+    vote_buffer_enabled: bool = True
+    vote_flush_interval_ms: int = 250
+    vote_buffer_max_pending: int = 1000  # beyond this, votes are written directly
+    vote_flush_max_retries: int = 3  # failed flushes retried before their votes are dropped
+
+    # Background Jobs
+    scheduler_workers: int = 2  # threads running scrape and post jobs off the event loop
+    scheduler_leader_election: bool = True  # only the lease holder runs jobs
+    scheduler_lease_seconds: int = 30
+    scheduler_enqueue_jobs: bool = False  # hand scheduled jobs to the job queue instead of running them
+    worker_embedded: bool = False  # also run a job worker thread in the API process (single-process setups)
+    job_max_attempts: int = 3
+    job_retry_base_seconds: int = 30  # doubled after each failed attempt
+    job_retry_max_seconds: int = 3600
+    job_poll_interval_seconds: float = 2.0
+    job_stale_after_seconds: int = 900  # running jobs older than this are recovered
+    loop_lag_interval_ms: int = 500
+    loop_lag_warn_ms: int = 100
 
     # App Settings
     debug: bool = True
@@ -31,8 +77,15 @@ class Settings(BaseSettings):
 
     # API Settings
     api_prefix: str = "/api"
+    stats_cache_ttl_seconds: int = 30
+    response_cache_enabled: bool = True
+    response_cache_size: int = 1024
+    response_cache_redis_url: Optional[str] = None  # unset keeps the cache in process memory
+    compression_minimum_size: int = 1024  # bytes; smaller responses are sent uncompressed
+    compression_threadpool_size: int = 65536  # bytes; larger bodies are compressed off the event loop
 
     # Rate Limiting
+    rate_limit_redis_url: Optional[str] = None  # unset keeps limits in process memory
     max_posts_per_day: int = 50
     min_minutes_between_posts: int = 30
 
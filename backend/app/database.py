@@ -3,19 +3,134 @@ Database models and connection for Starmer Watch.
 Uses SQLAlchemy ORM with SQLite (dev) / PostgreSQL (prod).
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, CheckConstraint
+from functools import lru_cache
+from typing import AsyncIterator, Optional, List, Union
+import logging
+import time
+from sqlalchemy import event, exc, func, insert, create_engine, make_url, Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey, CheckConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.concurrency import run_in_threadpool
 from .config import get_settings
+from .utils.pool_wait import get_pool_wait_monitor
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-engine = create_engine(
+
+def _timed_get(pool, do_get):
+    """Take a connection record from the pool's queue, recording how long the caller queued for it.
+
+    Only the queue wait is timed: pre-ping and any reconnect happen after
+    _do_get() returns. A record opened here (pool below its limit) never
+    queued, so its connect time is not counted as waiting.
+    """
+    monitor = get_pool_wait_monitor(pool.wait_monitor)
+    started = time.perf_counter()
+    try:
+        record = do_get()
+    except exc.TimeoutError:
+        monitor.record_timeout()
+        logger.warning(f"Timed out waiting for a {pool.wait_monitor} database connection: {pool.status()}")
+        raise
+    opened = record.__dict__.pop("opened_for_checkout", False)
+    monitor.record(0.0 if opened else time.perf_counter() - started)
+    return record
+
+
+def _opened_record(create_connection):
+    """Create a connection record flagged as opened by the current checkout.
+
+    SQLAlchemy's own fresh flag is only cleared on checkout when pre-ping
+    or a checkout listener is active, so it cannot tell reused records apart.
+    """
+    record = create_connection()
+    record.opened_for_checkout = True
+    return record
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports checkout wait times to the "sync" monitor."""
+    wait_monitor = "sync"
+
+    def _do_get(self):
+        return _timed_get(self, super()._do_get)
+
+    def _create_connection(self):
+        return _opened_record(super()._create_connection)
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports checkout wait times to the "async" monitor."""
+    wait_monitor = "async"
+
+    def _do_get(self):
+        return _timed_get(self, super()._do_get)
+
+    def _create_connection(self):
+        return _opened_record(super()._create_connection)
+
+
+def engine_options(url: URL, is_async: bool = False) -> dict:
+    """create_engine() keyword arguments for url, from the pool settings."""
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        if not is_async:
+            options["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            # In-memory databases live in a single connection; keep SQLAlchemy's default pool
+            return options
+
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+    if backend == "postgresql" and settings.db_statement_timeout_ms > 0:
+        timeout = settings.db_statement_timeout_ms
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection (connect event listener)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        if settings.sqlite_wal:
+            # Readers see the last commit instead of waiting for writers to finish
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")  # Literal-typed in Settings
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    finally:
+        cursor.close()
+
+
+def configure_engine(engine):
+    """Attach the per-connection setup for the engine's dialect."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine.dialect.name == "sqlite":
+        event.listen(sync_engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+engine = configure_engine(create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-)
+    **engine_options(make_url(settings.database_url)),
+))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -40,6 +155,21 @@ class Article(Base):
     # Relationship to X posts
     x_posts = relationship("XPost", back_populates="article")
 
+    # Keyset pagination orders on (column, id) for each /articles sort key
+    __table_args__ = (
+        Index("ix_articles_published_at_id", "published_at", "id"),
+        Index("ix_articles_sentiment_score_id", "sentiment_score", "id"),
+        Index("ix_articles_scraped_at_id", "scraped_at", "id"),
+        Index("ix_articles_category_published_at_id", "category", "published_at", "id"),
+        # Posting queue: unposted articles, most negative first
+        Index(
+            "ix_articles_unposted_sentiment",
+            "sentiment_score",
+            sqlite_where=is_posted == False,
+            postgresql_where=is_posted == False,
+        ),
+    )
+
 
 class Promise(Base):
     """Tracked broken promises by Starmer."""
@@ -69,7 +199,7 @@ class Poll(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     pollster = Column(Text, nullable=False)
-    date = Column(DateTime, nullable=False)
+    date = Column(DateTime, nullable=False, index=True)
     approval_rating = Column(Float, nullable=True)
     disapproval_rating = Column(Float, nullable=True)
     sample_size = Column(Integer, nullable=True)
@@ -99,6 +229,8 @@ class XPost(Base):
             status.in_(['pending', 'scheduled', 'posted', 'failed']),
             name='valid_post_status'
         ),
+        Index("ix_x_posts_status_scheduled_for", "status", "scheduled_for"),
+        Index("ix_x_posts_status_posted_at", "status", "posted_at"),
     )
 
 
@@ -113,6 +245,12 @@ class TierVote(Base):
     voter_ip_hash = Column(String(64), nullable=True)  # Anonymised for rate limiting
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Aggregates group by item; the voter/time columns serve per-voter lookups
+        Index("ix_tier_votes_item_voter_created_at", "item_id", "voter_ip_hash", "created_at"),
+        Index("ix_tier_votes_created_at", "created_at"),
+    )
+
 
 class TierItem(Base):
     """Items that can be voted on in the tier list."""
@@ -125,6 +263,13 @@ class TierItem(Base):
     source_url = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # Running vote aggregates, updated with each vote (see reconcile_tier_votes)
+    vote_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    vote_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    @property
+    def average_vote(self) -> Optional[float]:
+        return self.vote_sum / self.vote_count if self.vote_count else None
 
 
 class CopeEntry(Base):
@@ -155,8 +300,167 @@ class CopeEntry(Base):
             category.in_(['denial', 'deflection', 'whatabout', 'copium']),
             name='valid_cope_category'
         ),
+        # /cope sort keys over approved entries, and the moderation queue
+        Index(
+            "ix_cope_entries_approved_votes_id", "votes", "id",
+            sqlite_where=is_approved == True,
+            postgresql_where=is_approved == True,
+        ),
+        Index(
+            "ix_cope_entries_approved_created_at_id", "created_at", "id",
+            sqlite_where=is_approved == True,
+            postgresql_where=is_approved == True,
+        ),
+        Index(
+            "ix_cope_entries_pending_created_at", "created_at",
+            sqlite_where=is_approved == False,
+            postgresql_where=is_approved == False,
+        ),
+    )
+
+
+class FeedState(Base):
+    """Per-source polling state for RSS feeds (conditional GET validators and counters)."""
+    __tablename__ = "feed_states"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_name = Column(String(100), unique=True, nullable=False)
+    etag = Column(Text, nullable=True)
+    last_modified = Column(Text, nullable=True)
+    not_modified_count = Column(Integer, default=0)  # 304 responses (cache hits)
+    fetched_count = Column(Integer, default=0)  # Full downloads (cache misses)
+    last_polled_at = Column(DateTime, nullable=True)
+    latest_published_at = Column(DateTime, nullable=True)  # High-water mark
+    recent_guids = Column(Text, nullable=True)  # JSON array stored as text
+    new_entries_per_hour = Column(Float, nullable=True)  # Learned publishing rate
+    poll_interval_minutes = Column(Float, nullable=True)
+    next_poll_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SentimentScore(Base):
+    """Persistent sentiment score cache keyed by normalized-text hash."""
+    __tablename__ = "sentiment_scores"
+
+    text_hash = Column(String(64), primary_key=True)
+    score = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class SchedulerLease(Base):
+    """Time-limited lease naming the process that runs the background jobs."""
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(200), nullable=False)
+    acquired_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class Job(Base):
+    """A unit of background work, claimed and run by app.worker."""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claiming the next due job
+        Index("ix_jobs_status_run_at_id", "status", "run_at", "id"),
     )
 
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=True)  # JSON object stored as text
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, succeeded, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # not before; pushed back on retry
+    locked_by = Column(String(200), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True)  # JSON object stored as text
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+
+@dataclass
+class InsertResult:
+    """Outcome of a bulk article insert."""
+    inserted_ids: List[int] = field(default_factory=list)
+    skipped: int = 0
+
+    @property
+    def inserted(self) -> int:
+        return len(self.inserted_ids)
+
+
+def insert_articles(db: Session, rows: List[dict], chunk_size: int = 500) -> InsertResult:
+    """
+    Bulk insert article rows, skipping URLs that already exist.
+
+    Uses INSERT ... ON CONFLICT (url) DO NOTHING RETURNING id on PostgreSQL
+    and SQLite, in chunks, so no per-row existence checks are needed.
+    The caller owns the transaction and commits.
+    """
+    result = InsertResult()
+
+    # Drop duplicate URLs within the batch (first one wins)
+    unique = list({row["url"]: row for row in reversed(rows)}.values())[::-1]
+    result.skipped = len(rows) - len(unique)
+
+    dialect = db.get_bind().dialect.name
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+
+        if dialect in ("postgresql", "sqlite"):
+            insert_fn = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = (
+                insert_fn(Article)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["url"])
+                .returning(Article.id)
+            )
+            ids = list(db.execute(stmt).scalars())
+        else:
+            # Generic fallback: one query for the existing URLs in the chunk
+            existing = {
+                url for (url,) in db.query(Article.url).filter(
+                    Article.url.in_([row["url"] for row in chunk])
+                )
+            }
+            new_rows = [row for row in chunk if row["url"] not in existing]
+            ids = [
+                db.execute(insert(Article).values(row)).inserted_primary_key[0]
+                for row in new_rows
+            ]
+
+        result.inserted_ids.extend(ids)
+        result.skipped += len(chunk) - len(ids)
+
+    return result
+
+
+def reconcile_tier_votes(db: Session) -> int:
+    """
+    Rebuild every TierItem's vote_sum/vote_count from the raw tier_votes rows.
+
+    Returns the number of items whose aggregates were out of date.
+    The caller commits.
+    """
+    totals = {
+        item_id: (vote_sum, vote_count)
+        for item_id, vote_sum, vote_count in db.query(
+            TierVote.item_id,
+            func.coalesce(func.sum(TierVote.vote_value), 0),
+            func.count(TierVote.id),
+        ).group_by(TierVote.item_id)
+    }
+
+    fixed = 0
+    for item in db.query(TierItem):
+        vote_sum, vote_count = totals.get(item.id, (0, 0))
+        if (item.vote_sum, item.vote_count) != (vote_sum, vote_count):
+            item.vote_sum, item.vote_count = vote_sum, vote_count
+            fixed += 1
+    return fixed
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -167,6 +471,115 @@ def get_db():
         db.close()
 
 
+# Async drivers for the read routes that use get_async_db
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> URL:
+    """The DATABASE_URL with its driver swapped for the async one."""
+    url = make_url(url)
+    async_url = url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+    if async_url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        # asyncpg takes ssl= rather than libpq's sslmode=
+        async_url = async_url.difference_update_query(["sslmode"]).update_query_dict(
+            {"ssl": url.query["sslmode"]}
+        )
+    return async_url
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """The async engine, created on first use (the worker and scripts never need it)."""
+    url = async_database_url(settings.database_url)
+    return configure_engine(create_async_engine(url, **engine_options(url, is_async=True)))
+
+
+@lru_cache()
+def get_async_session_factory() -> async_sessionmaker:
+    return async_sessionmaker(get_async_engine(), expire_on_commit=False, autoflush=False)
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for getting an async database session."""
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+class ThreadpoolSession:
+    """
+    The AsyncSession calls the read routes use, run on a sync Session in the threadpool.
+
+    Results are buffered in the worker thread, so iterating them never
+    touches the database from the event loop.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def execute(self, statement, *args, **kwargs):
+        def run():
+            return self.sync_session.execute(statement, *args, **kwargs).freeze()
+        return (await run_in_threadpool(run))()
+
+    async def scalars(self, statement, *args, **kwargs):
+        return (await self.execute(statement, *args, **kwargs)).scalars()
+
+    async def scalar(self, statement, *args, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalar, statement, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, *args, **kwargs)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+
+ReadSession = Union[AsyncSession, ThreadpoolSession]
+
+
+async def get_read_db() -> AsyncIterator[ReadSession]:
+    """
+    Dependency for the public read routes.
+
+    An AsyncSession when ASYNC_READS is on, otherwise a sync session
+    whose queries run in the threadpool (the default: see the async reads
+    benchmark in benchmarks/bench_async_reads.py).
+    """
+    if settings.async_reads:
+        async with get_async_session_factory()() as db:
+            yield db
+    else:
+        db = SessionLocal()
+        try:
+            yield ThreadpoolSession(db)
+        finally:
+            await run_in_threadpool(db.close)
+
+
+def pool_stats() -> dict:
+    """Pool occupancy and checkout wait times for the sync and async engines."""
+    engines = {"sync": engine}
+    if get_async_engine.cache_info().currsize:
+        engines["async"] = get_async_engine().sync_engine
+
+    stats = {}
+    for name, eng in engines.items():
+        pool = eng.pool
+        stats[name] = {
+            "pool": type(pool).__name__,
+            "size": pool.size() if isinstance(pool, QueuePool) else None,
+            "checked_out": pool.checkedout() if isinstance(pool, QueuePool) else None,
+            "overflow": pool.overflow() if isinstance(pool, QueuePool) else None,
+            "wait": get_pool_wait_monitor(name).stats(),
+        }
+    return stats
+
+
 def init_db():
-    """Initialize the database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Bring the database schema up to date by applying pending migrations."""
+    from .migrations import upgrade
+
+    upgrade(engine)
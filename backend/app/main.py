@@ -10,10 +10,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
-from .database import init_db
+from .database import SessionLocal, init_db
 from .api.routes import router as api_router
-from .bot.scheduler import PostScheduler
-from .bot.x_bot import XBot
+from .bot.leader import LeaderElection
+from .bot.scheduler import PostScheduler, get_post_scheduler
+from .api.rate_limiter import get_rate_limiter
+from .api.compression import CompressionMiddleware
+from .api.response_cache import ResponseCacheMiddleware
+from .api.vote_buffer import get_vote_buffer
+from .processors.sentiment_pool import get_sentiment_pool
+from .utils.loop_lag import get_loop_lag_monitor
+from .worker.runner import get_job_worker
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +33,13 @@ settings = get_settings()
 
 # Global scheduler instance
 scheduler: PostScheduler = None
+leader_election: LeaderElection = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
-    global scheduler
+    global scheduler, leader_election
 
     # Startup
     logger.info("Starting Starmer Watch...")
@@ -40,39 +48,59 @@ async def lifespan(app: FastAPI):
     init_db()
     logger.info("Database initialized")
 
-    # Initialize X bot (if configured)
-    bot = XBot(
-        api_key=settings.x_api_key,
-        api_secret=settings.x_api_secret,
-        access_token=settings.x_access_token,
-        access_token_secret=settings.x_access_token_secret,
-        community_id=settings.x_community_id,
-        max_posts_per_day=settings.max_posts_per_day,
-        min_minutes_between_posts=settings.min_minutes_between_posts,
-    )
+    # Seed rate limits from recent votes and submissions
+    db = SessionLocal()
+    try:
+        get_rate_limiter().seed_from_db(db)
+    except Exception as e:
+        logger.error(f"Error seeding rate limiter: {e}")
+    finally:
+        db.close()
+
+    # Initialize scheduler and X bot (if configured)
+    scheduler = get_post_scheduler()
 
-    if bot.is_configured():
+    if scheduler.bot.is_configured():
         logger.info("X bot configured and ready")
     else:
         logger.warning("X bot not configured - posting disabled")
 
-    # Start scheduler
-    scheduler = PostScheduler(
-        bot=bot,
-        scrape_interval_minutes=settings.scrape_interval_minutes,
-    )
+    if settings.vote_buffer_enabled:
+        get_vote_buffer().start()
+
+    get_loop_lag_monitor().start()
+
+    if settings.worker_embedded:
+        get_job_worker().start()
 
-    if not settings.debug:
+    if not settings.debug and settings.scheduler_leader_election:
+        # Every worker starts paused; the lease holder resumes its scheduler
+        scheduler.start(paused=True)
+        leader_election = LeaderElection(
+            lease_seconds=settings.scheduler_lease_seconds,
+            on_elected=scheduler.resume,
+            on_demoted=scheduler.pause,
+        )
+        leader_election.start()
+    elif not settings.debug:
         scheduler.start()
-        logger.info("Scheduler started")
     else:
         logger.info("Debug mode - scheduler not started automatically")
 
     yield
 
     # Shutdown
+    if leader_election:
+        leader_election.stop()
     if scheduler:
         scheduler.stop()
+    get_vote_buffer().stop()
+    get_loop_lag_monitor().stop()
+    if settings.worker_embedded:
+        get_job_worker().stop()
+    pool = get_sentiment_pool()
+    if pool:
+        pool.shutdown()
     logger.info("Starmer Watch shutdown complete")
 
 
@@ -84,7 +112,18 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Configure CORS
+# Cache public read endpoints
+if settings.response_cache_enabled:
+    app.add_middleware(ResponseCacheMiddleware)
+
+# Compress large responses (outside the cache, so cached bodies stay uncompressed)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    threadpool_size=settings.compression_threadpool_size,
+)
+
+# Configure CORS (added last so it is outermost and also covers cached and 304 responses)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -101,6 +140,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Include API routes
@@ -124,7 +164,9 @@ def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "scheduler_running": scheduler is not None and scheduler.scheduler.running if scheduler else False,
+        "scheduler_running": scheduler.is_active if scheduler else False,
+        "leader": leader_election.status() if leader_election else {"enabled": False},
+        "event_loop_lag": get_loop_lag_monitor().stats(),
     }
 
 
@@ -0,0 +1,75 @@
+"""
+Schema migrations.
+
+Each module in app/migrations/versions is one migration with an
+upgrade(conn) function. Migrations run in filename order, each in its
+own transaction, and applied versions are recorded in the
+schema_migrations table. Run with: python -m app.migrations upgrade
+"""
+
+from datetime import datetime
+from typing import List, Optional
+import importlib
+import logging
+import pkgutil
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from . import versions
+
+logger = logging.getLogger(__name__)
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String(100), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+# Arbitrary key for the PostgreSQL advisory lock that serialises upgrades
+_LOCK_KEY = 727_110_015
+
+
+def available_versions() -> List[str]:
+    """All migration module names, in the order they apply."""
+    return sorted(m.name for m in pkgutil.iter_modules(versions.__path__))
+
+
+def applied_versions(conn: Connection) -> List[str]:
+    """Versions already recorded in schema_migrations."""
+    schema_migrations.create(conn, checkfirst=True)
+    return sorted(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_versions(engine: Engine) -> List[str]:
+    """Versions that upgrade() would apply."""
+    with engine.connect() as conn:
+        applied = set(applied_versions(conn))
+        conn.commit()
+    return [v for v in available_versions() if v not in applied]
+
+
+def upgrade(engine: Optional[Engine] = None) -> List[str]:
+    """Apply every pending migration. Returns the versions applied."""
+    if engine is None:
+        from ..database import engine
+
+    applied_now = []
+    for version in available_versions():
+        with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                # Several workers may start at once; only one migrates
+                conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+            if version in applied_versions(conn):
+                continue
+
+            module = importlib.import_module(f"{versions.__name__}.{version}")
+            logger.info(f"Applying migration {version}")
+            module.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version, applied_at=datetime.utcnow(),
+            ))
+            applied_now.append(version)
+
+    return applied_now
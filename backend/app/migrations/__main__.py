@@ -0,0 +1,50 @@
+"""
+Migration command line.
+
+    python -m app.migrations upgrade       Apply pending migrations
+    python -m app.migrations status        List applied and pending migrations
+    python -m app.migrations check-plans   EXPLAIN each hot query and verify its index
+"""
+
+import argparse
+import logging
+import sys
+
+from ..database import SessionLocal, engine
+from . import available_versions, pending_versions, upgrade
+from .plans import HOT_QUERIES, check_query_plans
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations")
+    parser.add_argument("command", choices=["upgrade", "status", "check-plans"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+
+    if args.command == "upgrade":
+        applied = upgrade(engine)
+        print(f"Applied {len(applied)} migrations" + (f": {', '.join(applied)}" if applied else ""))
+        return 0
+
+    if args.command == "status":
+        pending = set(pending_versions(engine))
+        for version in available_versions():
+            print(f"{'pending' if version in pending else 'applied':8} {version}")
+        return 0
+
+    db = SessionLocal()
+    try:
+        failures = check_query_plans(db)
+    finally:
+        db.close()
+
+    for hot in HOT_QUERIES:
+        print(f"{'FAIL' if hot.name in failures else 'ok':5} {hot.name} -> {hot.index}")
+        if hot.name in failures:
+            print("      " + failures[hot.name].replace("\n", "\n      "))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
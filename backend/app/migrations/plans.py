@@ -0,0 +1,160 @@
+"""
+EXPLAIN checks for the hot query paths.
+
+Each entry pairs a query shaped like the one a route or job issues with
+the index it is expected to use. check_query_plans() runs EXPLAIN for
+each against the live database and reports any query whose plan does
+not mention its index. Run with: python -m app.migrations check-plans
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Query, Session
+
+from ..api.pagination import order_keyset
+from ..config import get_settings
+from ..database import Article, CopeEntry, Job, Poll, TierVote, XPost
+
+
+@dataclass
+class HotQuery:
+    name: str
+    index: str
+    build: Callable[[Session], Query]
+
+
+def _negative_articles(db: Session) -> Query:
+    return db.query(Article).filter(Article.sentiment_score < get_settings().sentiment_threshold)
+
+
+def _approved_cope(db: Session) -> Query:
+    return db.query(CopeEntry).filter(CopeEntry.is_approved == True)
+
+
+HOT_QUERIES: List[HotQuery] = [
+    HotQuery(
+        "GET /articles (published_at)",
+        "ix_articles_published_at_id",
+        lambda db: order_keyset(_negative_articles(db), Article.published_at, Article.id, True).limit(21),
+    ),
+    HotQuery(
+        "GET /articles (sentiment_score)",
+        "ix_articles_sentiment_score_id",
+        lambda db: order_keyset(_negative_articles(db), Article.sentiment_score, Article.id, False).limit(21),
+    ),
+    HotQuery(
+        "GET /articles (scraped_at)",
+        "ix_articles_scraped_at_id",
+        lambda db: order_keyset(_negative_articles(db), Article.scraped_at, Article.id, True).limit(21),
+    ),
+    HotQuery(
+        "GET /articles?category=",
+        "ix_articles_category_published_at_id",
+        lambda db: order_keyset(
+            _negative_articles(db).filter(Article.category == "general"),
+            Article.published_at, Article.id, True,
+        ).limit(21),
+    ),
+    HotQuery(
+        "scheduler: unposted articles",
+        "ix_articles_unposted_sentiment",
+        lambda db: db.query(Article).filter(
+            Article.is_posted == False,
+            Article.sentiment_score < -0.2,
+        ).order_by(Article.sentiment_score).limit(10),
+    ),
+    HotQuery(
+        "GET /cope (votes)",
+        "ix_cope_entries_approved_votes_id",
+        lambda db: order_keyset(_approved_cope(db), CopeEntry.votes, CopeEntry.id, True).limit(21),
+    ),
+    HotQuery(
+        "GET /cope (recent)",
+        "ix_cope_entries_approved_created_at_id",
+        lambda db: order_keyset(_approved_cope(db), CopeEntry.created_at, CopeEntry.id, True).limit(21),
+    ),
+    HotQuery(
+        "GET /admin/cope/pending",
+        "ix_cope_entries_pending_created_at",
+        lambda db: db.query(CopeEntry).filter(
+            CopeEntry.is_approved == False
+        ).order_by(CopeEntry.created_at.desc()),
+    ),
+    HotQuery(
+        "GET /admin/queue, scheduler: due posts",
+        "ix_x_posts_status_scheduled_for",
+        lambda db: db.query(XPost).filter(
+            XPost.status == "scheduled",
+            XPost.scheduled_for > datetime.utcnow(),
+        ).order_by(XPost.scheduled_for),
+    ),
+    HotQuery(
+        "GET /stats: posts today",
+        "ix_x_posts_status_posted_at",
+        lambda db: db.query(XPost.id).filter(
+            XPost.posted_at >= datetime.utcnow().replace(hour=0, minute=0, second=0),
+            XPost.status == "posted",
+        ),
+    ),
+    HotQuery(
+        "GET /polls/latest",
+        "ix_polls_date",
+        lambda db: db.query(Poll).order_by(Poll.date.desc()).limit(1),
+    ),
+    HotQuery(
+        "reconcile_tier_votes",
+        "ix_tier_votes_item_voter_created_at",
+        lambda db: db.query(
+            TierVote.item_id,
+            func.coalesce(func.sum(TierVote.vote_value), 0),
+            func.count(TierVote.id),
+        ).group_by(TierVote.item_id),
+    ),
+    HotQuery(
+        "rate limiter seed: recent tier votes",
+        "ix_tier_votes_created_at",
+        lambda db: db.query(TierVote.item_id).filter(
+            TierVote.created_at >= datetime.utcnow() - timedelta(days=1)
+        ),
+    ),
+    HotQuery(
+        "worker: claim next job",
+        "ix_jobs_status_run_at_id",
+        lambda db: db.query(Job.id).filter(
+            Job.status == "queued",
+            Job.run_at <= datetime.utcnow(),
+        ).order_by(Job.run_at, Job.id).limit(1),
+    ),
+]
+
+
+def explain(db: Session, query: Query) -> str:
+    """Return the database's query plan for a query as text."""
+    dialect = db.get_bind().dialect
+    # Literal values, so the planner can match partial index predicates
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN "
+    rows = db.connection().exec_driver_sql(prefix + sql).all()
+    return "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+
+def check_query_plans(db: Session) -> Dict[str, str]:
+    """
+    Run EXPLAIN for every hot query. Returns {name: plan} for those missing their index.
+
+    On PostgreSQL sequential scans are disabled for the check, since the
+    planner rightly prefers them on small tables; the check is whether
+    the index can serve the query at all.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+
+    failures = {}
+    for hot in HOT_QUERIES:
+        plan = explain(db, hot.build(db))
+        if hot.index not in plan:
+            failures[hot.name] = plan
+    return failures
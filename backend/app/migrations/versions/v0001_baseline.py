@@ -0,0 +1,141 @@
+"""
+Baseline schema: the tables as created by the old create_all() in init_db.
+
+The definitions are frozen here rather than taken from the models, so a
+fresh database goes through every later migration just as an existing
+one does. Tables that already exist are left untouched, so databases
+created before migrations were introduced pick up from here.
+"""
+
+from sqlalchemy import (
+    Boolean, CheckConstraint, Column, DateTime, Float, ForeignKey, Index,
+    Integer, MetaData, String, Table, Text,
+)
+from sqlalchemy.engine import Connection
+
+metadata = MetaData()
+
+Table(
+    "articles", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("title", Text, nullable=False),
+    Column("url", Text, unique=True, nullable=False),
+    Column("source", Text, nullable=False),
+    Column("published_at", DateTime),
+    Column("scraped_at", DateTime),
+    Column("sentiment_score", Float),
+    Column("content_snippet", Text),
+    Column("is_posted", Boolean),
+    Column("posted_at", DateTime),
+    Column("category", String(50)),
+)
+
+Table(
+    "promises", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("promise_text", Text, nullable=False),
+    Column("date_promised", DateTime),
+    Column("source_url", Text),
+    Column("status", String(20)),
+    Column("evidence_urls", Text),
+    Column("mocking_comment", Text),
+    Column("created_at", DateTime),
+    Column("updated_at", DateTime),
+    CheckConstraint("status IN ('broken', 'u-turn', 'pending', 'kept')", name="valid_status"),
+)
+
+Table(
+    "polls", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("pollster", Text, nullable=False),
+    Column("date", DateTime, nullable=False),
+    Column("approval_rating", Float),
+    Column("disapproval_rating", Float),
+    Column("sample_size", Integer),
+    Column("source_url", Text),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "x_posts", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("article_id", Integer, ForeignKey("articles.id")),
+    Column("post_text", Text, nullable=False),
+    Column("x_post_id", String(100)),
+    Column("posted_at", DateTime),
+    Column("scheduled_for", DateTime),
+    Column("engagement_likes", Integer),
+    Column("engagement_retweets", Integer),
+    Column("status", String(20)),
+    CheckConstraint("status IN ('pending', 'scheduled', 'posted', 'failed')", name="valid_post_status"),
+)
+
+Table(
+    "tier_votes", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("item_id", Integer, nullable=False),
+    Column("item_description", Text, nullable=False),
+    Column("vote_value", Integer),
+    Column("voter_ip_hash", String(64)),
+    Column("created_at", DateTime),
+    Index("ix_tier_votes_item_id", "item_id"),
+)
+
+Table(
+    "tier_items", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("description", Text, nullable=False),
+    Column("category", String(50)),
+    Column("date_occurred", DateTime),
+    Column("source_url", Text),
+    Column("created_at", DateTime),
+    Column("is_active", Boolean),
+)
+
+Table(
+    "cope_entries", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("content", Text, nullable=False),
+    Column("source_url", String(500)),
+    Column("source_platform", String(50)),
+    Column("source_username", String(100)),
+    Column("screenshot_url", String(500)),
+    Column("category", String(50)),
+    Column("cope_level", Integer),
+    Column("votes", Integer),
+    Column("is_approved", Boolean),
+    Column("is_featured", Boolean),
+    Column("submitted_by_ip_hash", String(64)),
+    Column("created_at", DateTime),
+    Column("approved_at", DateTime),
+    CheckConstraint("source_platform IN ('x', 'reddit', 'facebook', 'other')", name="valid_cope_platform"),
+    CheckConstraint("category IN ('denial', 'deflection', 'whatabout', 'copium')", name="valid_cope_category"),
+)
+
+Table(
+    "feed_states", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("source_name", String(100), unique=True, nullable=False),
+    Column("etag", Text),
+    Column("last_modified", Text),
+    Column("not_modified_count", Integer),
+    Column("fetched_count", Integer),
+    Column("last_polled_at", DateTime),
+    Column("latest_published_at", DateTime),
+    Column("recent_guids", Text),
+    Column("new_entries_per_hour", Float),
+    Column("poll_interval_minutes", Float),
+    Column("next_poll_at", DateTime),
+    Column("updated_at", DateTime),
+)
+
+Table(
+    "sentiment_scores", metadata,
+    Column("text_hash", String(64), primary_key=True),
+    Column("score", Float, nullable=False),
+    Column("created_at", DateTime),
+)
+
+
+def upgrade(conn: Connection):
+    metadata.create_all(bind=conn, checkfirst=True)
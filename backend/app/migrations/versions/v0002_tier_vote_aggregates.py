@@ -0,0 +1,19 @@
+"""
+Running vote_sum/vote_count aggregates on tier_items, backfilled from tier_votes.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def upgrade(conn: Connection):
+    columns = {c["name"] for c in inspect(conn).get_columns("tier_items")}
+    for name in ("vote_sum", "vote_count"):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE tier_items ADD COLUMN {name} INTEGER NOT NULL DEFAULT 0"))
+
+    conn.execute(text(
+        "UPDATE tier_items SET "
+        "vote_sum = (SELECT COALESCE(SUM(vote_value), 0) FROM tier_votes WHERE tier_votes.item_id = tier_items.id), "
+        "vote_count = (SELECT COUNT(*) FROM tier_votes WHERE tier_votes.item_id = tier_items.id)"
+    ))
@@ -0,0 +1,96 @@
+"""
+Composite and partial indexes for the hot read paths.
+
+See app/migrations/plans.py for the query each one serves. The tables
+below declare only the columns the indexes need.
+"""
+
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, MetaData, String, Table, inspect
+from sqlalchemy.engine import Connection
+
+metadata = MetaData()
+
+articles = Table(
+    "articles", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("published_at", DateTime),
+    Column("scraped_at", DateTime),
+    Column("sentiment_score", Float),
+    Column("is_posted", Boolean),
+    Column("category", String(50)),
+)
+
+cope_entries = Table(
+    "cope_entries", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("votes", Integer),
+    Column("is_approved", Boolean),
+    Column("created_at", DateTime),
+)
+
+polls = Table(
+    "polls", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("date", DateTime),
+)
+
+tier_votes = Table(
+    "tier_votes", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("item_id", Integer),
+    Column("voter_ip_hash", String(64)),
+    Column("created_at", DateTime),
+)
+
+x_posts = Table(
+    "x_posts", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("status", String(20)),
+    Column("scheduled_for", DateTime),
+    Column("posted_at", DateTime),
+)
+
+INDEXES = [
+    # Keyset pagination orders on (column, id) for each /articles sort key
+    Index("ix_articles_published_at_id", articles.c.published_at, articles.c.id),
+    Index("ix_articles_sentiment_score_id", articles.c.sentiment_score, articles.c.id),
+    Index("ix_articles_scraped_at_id", articles.c.scraped_at, articles.c.id),
+    Index("ix_articles_category_published_at_id", articles.c.category, articles.c.published_at, articles.c.id),
+    # Posting queue: unposted articles, most negative first
+    Index(
+        "ix_articles_unposted_sentiment", articles.c.sentiment_score,
+        sqlite_where=articles.c.is_posted == False,
+        postgresql_where=articles.c.is_posted == False,
+    ),
+    # /cope sort keys over approved entries, and the moderation queue
+    Index(
+        "ix_cope_entries_approved_votes_id", cope_entries.c.votes, cope_entries.c.id,
+        sqlite_where=cope_entries.c.is_approved == True,
+        postgresql_where=cope_entries.c.is_approved == True,
+    ),
+    Index(
+        "ix_cope_entries_approved_created_at_id", cope_entries.c.created_at, cope_entries.c.id,
+        sqlite_where=cope_entries.c.is_approved == True,
+        postgresql_where=cope_entries.c.is_approved == True,
+    ),
+    Index(
+        "ix_cope_entries_pending_created_at", cope_entries.c.created_at,
+        sqlite_where=cope_entries.c.is_approved == False,
+        postgresql_where=cope_entries.c.is_approved == False,
+    ),
+    Index("ix_polls_date", polls.c.date),
+    # Aggregates group by item; the voter/time columns serve per-voter lookups
+    Index("ix_tier_votes_item_voter_created_at", tier_votes.c.item_id, tier_votes.c.voter_ip_hash, tier_votes.c.created_at),
+    Index("ix_tier_votes_created_at", tier_votes.c.created_at),
+    Index("ix_x_posts_status_scheduled_for", x_posts.c.status, x_posts.c.scheduled_for),
+    Index("ix_x_posts_status_posted_at", x_posts.c.status, x_posts.c.posted_at),
+]
+
+
+def upgrade(conn: Connection):
+    # Superseded by ix_tier_votes_item_voter_created_at
+    if "ix_tier_votes_item_id" in {i["name"] for i in inspect(conn).get_indexes("tier_votes")}:
+        conn.exec_driver_sql("DROP INDEX ix_tier_votes_item_id")
+
+    for index in INDEXES:
+        index.create(conn, checkfirst=True)
@@ -0,0 +1,18 @@
+"""
+Lease table for electing the one process that runs the scheduled jobs.
+"""
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table
+from sqlalchemy.engine import Connection
+
+scheduler_leases = Table(
+    "scheduler_leases", MetaData(),
+    Column("name", String(50), primary_key=True),
+    Column("holder", String(200), nullable=False),
+    Column("acquired_at", DateTime, nullable=False),
+    Column("expires_at", DateTime, nullable=False),
+)
+
+
+def upgrade(conn: Connection):
+    scheduler_leases.create(conn, checkfirst=True)
@@ -0,0 +1,29 @@
+"""
+Persistent job queue for app.worker.
+"""
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, Text
+from sqlalchemy.engine import Connection
+
+jobs = Table(
+    "jobs", MetaData(),
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("kind", String(50), nullable=False),
+    Column("payload", Text),
+    Column("status", String(20), nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("max_attempts", Integer, nullable=False),
+    Column("run_at", DateTime, nullable=False),
+    Column("locked_by", String(200)),
+    Column("locked_at", DateTime),
+    Column("last_error", Text),
+    Column("result", Text),
+    Column("created_at", DateTime),
+    Column("finished_at", DateTime),
+    # Claiming the next due job
+    Index("ix_jobs_status_run_at_id", "status", "run_at", "id"),
+)
+
+
+def upgrade(conn: Connection):
+    jobs.create(conn, checkfirst=True)
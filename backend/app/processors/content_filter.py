@@ -2,16 +2,21 @@
 Content filtering to identify negative Starmer coverage.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Set
 from dataclasses import dataclass
 import logging
 
 from ..scrapers.base_scraper import ScrapedArticle
 from ..scrapers.sources import STARMER_KEYWORDS, NEGATIVE_BOOST_KEYWORDS
+from ..utils.keyword_matcher import get_matcher
 from .sentiment import SentimentAnalyzer
+from .sentiment_pool import get_sentiment_pool
 
 logger = logging.getLogger(__name__)
 
+# Above this many candidate articles, sentiment is scored as one batch
+BATCH_SCORING_THRESHOLD = 8
+
 
 @dataclass
 class FilteredArticle:
@@ -21,6 +26,18 @@ class FilteredArticle:
     keyword_matches: List[str]
     relevance_score: float
 
+    def to_row(self) -> dict:
+        """Column values for inserting this article into the articles table."""
+        return {
+            "title": self.article.title,
+            "url": self.article.url,
+            "source": self.article.source,
+            "published_at": self.article.published_at,
+            "sentiment_score": self.sentiment_score,
+            "content_snippet": self.article.content_snippet,
+            "category": self.article.category,
+        }
+
 
 class ContentFilter:
     """Filters articles for negative Starmer coverage."""
@@ -34,7 +51,14 @@ class ContentFilter:
         self.sentiment_threshold = sentiment_threshold
         self.starmer_keywords = starmer_keywords or STARMER_KEYWORDS
         self.boost_keywords = boost_keywords or NEGATIVE_BOOST_KEYWORDS
-        self.analyzer = SentimentAnalyzer(boost_keywords=self.boost_keywords)
+        self.analyzer = SentimentAnalyzer(
+            boost_keywords=self.boost_keywords,
+            pool=get_sentiment_pool(),
+        )
+
+        # One automaton for both keyword lists, so each article is scanned once
+        self.matcher = get_matcher(list(self.starmer_keywords) + list(self.boost_keywords))
+        self._starmer_set = set(self.starmer_keywords)
 
     def filter_articles(
         self,
@@ -52,22 +76,38 @@ class ContentFilter:
             List of FilteredArticle objects
         """
         filtered = []
+        candidates = []
 
         for article in articles:
+            # Single keyword scan shared by every stage below
+            text = f"{article.title} {article.content_snippet or ''}"
+            matches = self.matcher.find_all(text)
+
             # Check for Starmer mention
-            if not self._mentions_starmer(article):
+            if not matches & self._starmer_set:
                 continue
 
-            # Analyze sentiment
-            text = f"{article.title} {article.content_snippet or ''}"
-            sentiment_score = self.analyzer.analyze(text)
+            candidates.append((article, text, matches))
+
+        # Analyze sentiment
+        if len(candidates) > BATCH_SCORING_THRESHOLD:
+            scores = self.analyzer.analyze_batch(
+                [text for _, text, _ in candidates],
+                [matches for _, _, matches in candidates],
+            )
+        else:
+            scores = [
+                self.analyzer.analyze(text, keyword_matches=matches)
+                for _, text, matches in candidates
+            ]
 
+        for (article, text, matches), sentiment_score in zip(candidates, scores):
             # Skip if requiring negative and not negative enough
             if require_negative and sentiment_score >= self.sentiment_threshold:
                 continue
 
             # Find keyword matches
-            keyword_matches = self._find_keyword_matches(text)
+            keyword_matches = self._find_keyword_matches(text, matches)
 
             # Calculate relevance score
             relevance = self._calculate_relevance(
@@ -91,13 +131,14 @@ class ContentFilter:
 
     def _mentions_starmer(self, article: ScrapedArticle) -> bool:
         """Check if article mentions Starmer."""
-        text = f"{article.title} {article.content_snippet or ''}".lower()
-        return any(kw.lower() in text for kw in self.starmer_keywords)
+        text = f"{article.title} {article.content_snippet or ''}"
+        return bool(self.matcher.find_all(text) & self._starmer_set)
 
-    def _find_keyword_matches(self, text: str) -> List[str]:
+    def _find_keyword_matches(self, text: str, matches: Optional[Set[str]] = None) -> List[str]:
         """Find which negative keywords appear in the text."""
-        text_lower = text.lower()
-        return [kw for kw in self.boost_keywords if kw.lower() in text_lower]
+        if matches is None:
+            matches = self.matcher.find_all(text)
+        return [kw for kw in self.boost_keywords if kw in matches]
 
     def _calculate_relevance(
         self,
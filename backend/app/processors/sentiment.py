@@ -3,18 +3,33 @@ Sentiment analysis for article content.
 Uses VADER (Valence Aware Dictionary and sEntiment Reasoner).
 """
 
-from typing import Optional, List
+from typing import Optional, List, Set
 import logging
 
+from ..utils.keyword_matcher import get_matcher
+from .sentiment_cache import SentimentCache, get_sentiment_cache, keyword_version, score_key
+from .sentiment_pool import SentimentPool
+from . import vader_batch
+
 logger = logging.getLogger(__name__)
 
 
 class SentimentAnalyzer:
     """Analyzes sentiment of text using VADER."""
 
-    def __init__(self, boost_keywords: Optional[List[str]] = None):
+    def __init__(
+        self,
+        boost_keywords: Optional[List[str]] = None,
+        cache: Optional[SentimentCache] = None,
+        pool: Optional[SentimentPool] = None,
+    ):
         self.analyzer = None
         self.boost_keywords = boost_keywords or []
+        self.matcher = get_matcher(self.boost_keywords)
+        self.cache = cache or get_sentiment_cache()
+        self.cache_version = keyword_version(self.boost_keywords)
+        self.pool = pool
+        self._batch_scorer = None
         self._init_analyzer()
 
     def _init_analyzer(self):
@@ -29,10 +44,15 @@ class SentimentAnalyzer:
                 "Install with: pip install vaderSentiment"
             )
 
-    def analyze(self, text: str) -> float:
+    def analyze(self, text: str, keyword_matches: Optional[Set[str]] = None) -> float:
         """
         Analyze the sentiment of text.
 
+        Args:
+            text: Text to score
+            keyword_matches: Keywords already found in the text by a shared
+                matcher, to avoid scanning it again for the boost
+
         Returns:
             float: Compound score from -1 (most negative) to +1 (most positive)
         """
@@ -43,21 +63,88 @@ class SentimentAnalyzer:
             return 0.0
 
         try:
+            key = score_key(text, self.cache_version)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
             scores = self.analyzer.polarity_scores(text)
             compound = scores["compound"]
 
             # Apply boost for negative keywords
-            boost = self._calculate_boost(text)
+            boost = self._calculate_boost(text, keyword_matches)
             adjusted = compound - boost
 
             # Clamp to [-1, 1]
-            return max(-1.0, min(1.0, adjusted))
+            score = max(-1.0, min(1.0, adjusted))
+            self.cache.set(key, score)
+            return score
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {e}")
             return 0.0
 
-    def _calculate_boost(self, text: str) -> float:
+    def analyze_batch(
+        self,
+        texts: List[str],
+        keyword_matches: Optional[List[Set[str]]] = None,
+    ) -> List[float]:
+        """
+        Analyze the sentiment of many texts at once.
+
+        Uncached texts are scored together by the vectorized VADER scorer
+        when NumPy is available, on the process pool if one is configured.
+        Results match analyze() for each text.
+
+        Args:
+            texts: Texts to score
+            keyword_matches: Optional per-text keyword matches, as for analyze()
+
+        Returns:
+            List of compound scores in input order
+        """
+        scores = [0.0] * len(texts)
+        if not self.analyzer:
+            return scores
+
+        matches = keyword_matches or [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = score_key(text, self.cache_version)
+            cached = self.cache.get(key)
+            if cached is not None:
+                scores[i] = cached
+            else:
+                pending.append((i, key))
+
+        if not pending:
+            return scores
+
+        # No blanket except: a batch that cannot be scored must fail the
+        # scrape (and roll back feed state) rather than score everything 0.0
+        compounds = self._compound_scores([texts[i] for i, _ in pending])
+        for (i, key), compound in zip(pending, compounds):
+            boost = self._calculate_boost(texts[i], matches[i])
+            scores[i] = max(-1.0, min(1.0, compound - boost))
+            self.cache.set(key, scores[i])
+
+        return scores
+
+    def _compound_scores(self, texts: List[str]) -> List[float]:
+        """Get raw VADER compound scores, vectorized when NumPy is installed."""
+        if self.pool:
+            return self.pool.compound_scores(texts)
+
+        if not vader_batch.is_available():
+            return [self.analyzer.polarity_scores(t)["compound"] for t in texts]
+
+        if self._batch_scorer is None:
+            self._batch_scorer = vader_batch.VaderBatchScorer(self.analyzer)
+        return self._batch_scorer.compound_scores(texts)
+
+    def _calculate_boost(self, text: str, keyword_matches: Optional[Set[str]] = None) -> float:
         """
         Calculate boost based on presence of negative keywords.
 
@@ -67,8 +154,10 @@ class SentimentAnalyzer:
         if not self.boost_keywords:
             return 0.0
 
-        text_lower = text.lower()
-        matches = sum(1 for kw in self.boost_keywords if kw.lower() in text_lower)
+        if keyword_matches is None:
+            matches = len(self.matcher.find_all(text))
+        else:
+            matches = sum(1 for kw in self.matcher.keywords if kw in keyword_matches)
 
         # Each keyword match adds 0.05 to negativity (max 0.3)
         return min(0.3, matches * 0.05)
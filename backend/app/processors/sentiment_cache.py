@@ -0,0 +1,143 @@
+"""
+Content-addressed cache for sentiment scores.
+
+Scores are keyed by a hash of the normalized text plus a version of the
+boost keyword list, so headlines that stay in a feed across scrape cycles
+are scored once. An in-process LRU sits in front of an optional
+persistent table.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from threading import Lock
+from typing import Iterable, Optional
+import hashlib
+import logging
+
+from ..config import get_settings
+from ..database import SessionLocal, SentimentScore
+
+logger = logging.getLogger(__name__)
+
+
+def keyword_version(keywords: Iterable[str]) -> str:
+    """Short, order-independent fingerprint of a keyword list."""
+    joined = "\n".join(sorted(kw.lower() for kw in keywords))
+    return hashlib.sha256(joined.encode()).hexdigest()[:12]
+
+
+def score_key(text: str, version: str) -> str:
+    """
+    Build the cache key for a text.
+
+    Only whitespace is normalized; case is kept because VADER treats
+    capitalised words as emphasis.
+    """
+    normalized = " ".join(text.split())
+    return hashlib.sha256(f"{version}:{normalized}".encode()).hexdigest()
+
+
+class SentimentScoreStore:
+    """Persistent score storage backed by the sentiment_scores table."""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def get(self, key: str) -> Optional[float]:
+        db = self.session_factory()
+        try:
+            row = db.query(SentimentScore).filter(SentimentScore.text_hash == key).first()
+            return row.score if row else None
+        finally:
+            db.close()
+
+    def set(self, key: str, score: float):
+        db = self.session_factory()
+        try:
+            if not db.query(SentimentScore).filter(SentimentScore.text_hash == key).first():
+                db.add(SentimentScore(text_hash=key, score=score, created_at=datetime.utcnow()))
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error saving sentiment score: {e}")
+        finally:
+            db.close()
+
+
+class SentimentCache:
+    """Thread-safe LRU of sentiment scores with hit/miss/eviction counters."""
+
+    def __init__(self, max_size: int = 4096, store: Optional[SentimentScoreStore] = None):
+        self.max_size = max_size
+        self.store = store
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[float]:
+        """Look up a score, falling back to the persistent store on an LRU miss."""
+        with self._lock:
+            score = self._entries.get(key)
+            if score is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return score
+
+        if self.store:
+            score = self.store.get(key)
+            if score is not None:
+                with self._lock:
+                    self.store_hits += 1
+                    self.hits += 1
+                self._put(key, score)
+                return score
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, score: float):
+        """Record a freshly computed score."""
+        self._put(key, score)
+        if self.store:
+            self.store.set(key, score)
+
+    def _put(self, key: str, score: float):
+        with self._lock:
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all in-process entries (the persistent store is left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Get cache counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "store_hits": self.store_hits,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "persistent": self.store is not None,
+            }
+
+
+@lru_cache()
+def get_sentiment_cache() -> SentimentCache:
+    """Get the process-wide sentiment cache shared by all analyzers."""
+    settings = get_settings()
+    store = SentimentScoreStore() if settings.sentiment_cache_persistent else None
+    return SentimentCache(max_size=settings.sentiment_cache_size, store=store)
@@ -0,0 +1,118 @@
+"""
+Process-pool execution for CPU-bound sentiment scoring.
+
+Used for backfills and large scrape batches so VADER work runs on other
+cores instead of the API process. Each worker loads the VADER lexicon
+once at start-up; texts are dispatched in chunks and scores come back
+in input order. If a worker dies the pool is discarded, the batch is
+scored in this process and the next batch starts a fresh pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from threading import Lock
+from typing import List, Optional
+import logging
+import multiprocessing
+
+from ..config import get_settings
+from . import vader_batch
+
+logger = logging.getLogger(__name__)
+
+# Scorer preloaded in each worker process by _init_worker
+_worker_scorer = None
+
+
+def _init_worker():
+    """Load the VADER lexicon (and its array form) once per worker."""
+    global _worker_scorer
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+    analyzer = SentimentIntensityAnalyzer()
+    if vader_batch.is_available():
+        _worker_scorer = vader_batch.VaderBatchScorer(analyzer)
+    else:
+        _worker_scorer = analyzer
+
+
+def _score_chunk(texts: List[str]) -> List[float]:
+    """Score one chunk of texts inside a worker."""
+    if isinstance(_worker_scorer, vader_batch.VaderBatchScorer):
+        return _worker_scorer.compound_scores(texts)
+    return [_worker_scorer.polarity_scores(t)["compound"] for t in texts]
+
+
+class SentimentPool:
+    """A lazily started pool of sentiment worker processes."""
+
+    def __init__(self, workers: int, chunk_size: int = 64):
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawn rather than fork: the API process runs threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+                logger.info(f"Started sentiment pool with {self.workers} workers")
+            return self._executor
+
+    def compound_scores(self, texts: List[str]) -> List[float]:
+        """Return raw VADER compound scores for the texts, in input order."""
+        if not texts:
+            return []
+
+        chunks = [
+            texts[i:i + self.chunk_size]
+            for i in range(0, len(texts), self.chunk_size)
+        ]
+        executor = self._get_executor()
+        try:
+            results = list(executor.map(_score_chunk, chunks))
+        except BrokenProcessPool as e:
+            logger.error(f"Sentiment pool broken, scoring {len(texts)} texts in-process: {e}")
+            self._discard(executor)
+            return self._score_in_process(texts)
+        return [score for chunk in results for score in chunk]
+
+    def _discard(self, executor: ProcessPoolExecutor):
+        """Drop a broken executor so the next batch starts a new one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    def _score_in_process(self, texts: List[str]) -> List[float]:
+        """Score texts in this process with the same scorer the workers use."""
+        with self._lock:
+            if _worker_scorer is None:
+                _init_worker()
+        return _score_chunk(texts)
+
+    def shutdown(self):
+        """Stop the worker processes, if they were started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+                logger.info("Sentiment pool stopped")
+
+
+@lru_cache()
+def get_sentiment_pool() -> Optional[SentimentPool]:
+    """Get the shared sentiment pool, or None when SENTIMENT_WORKERS is 0."""
+    settings = get_settings()
+    if settings.sentiment_workers <= 0:
+        return None
+    return SentimentPool(
+        workers=settings.sentiment_workers,
+        chunk_size=settings.sentiment_chunk_size,
+    )
@@ -0,0 +1,197 @@
+"""
+Vectorized VADER scoring for large batches of text.
+
+The VADER lexicon, booster words and negations are held as sorted NumPy
+string arrays. A whole batch is tokenized into one flat token array,
+words are looked up with a binary search over those arrays and every
+rule is applied as an array operation, so there are no per-text
+dictionary lookups. Texts that hit one of VADER's rarer rules (emoji,
+"but", "least", idioms and multi-word boosters) are scored with the
+reference polarity_scores so results always match it.
+"""
+
+from itertools import chain
+from typing import List
+import logging
+import string
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+
+def is_available() -> bool:
+    """Check whether the vectorized path can be used (NumPy installed)."""
+    return np is not None
+
+
+class VaderBatchScorer:
+    """Scores many texts at once against a VADER lexicon held as NumPy arrays."""
+
+    def __init__(self, analyzer):
+        """
+        Args:
+            analyzer: A vaderSentiment SentimentIntensityAnalyzer whose lexicon
+                is copied into arrays and which scores fallback texts.
+        """
+        from vaderSentiment import vaderSentiment as vader
+
+        self.analyzer = analyzer
+        self.n_scalar = vader.N_SCALAR
+        self.c_incr = vader.C_INCR
+
+        # Fixed-width arrays one char wider than the longest entry, so that
+        # longer tokens are truncated to something that never matches
+        entries = list(analyzer.lexicon) + list(vader.BOOSTER_DICT) + list(vader.NEGATE)
+        self._dtype = f"<U{max(map(len, entries)) + 1}"
+
+        self._lex_words, self._lex_vals = self._table(analyzer.lexicon)
+        self._boost_words, self._boost_vals = self._table(vader.BOOSTER_DICT)
+        self._negations, _ = self._table({w: 0.0 for w in vader.NEGATE})
+
+        # Multi-word phrases handled only by the reference implementation
+        idioms = set(vader.SPECIAL_CASES) | {k for k in vader.BOOSTER_DICT if " " in k}
+        self._idioms, _ = self._table({k: 0.0 for k in idioms})
+        self._fallback_words, _ = self._table({"but": 0.0, "least": 0.0})
+
+        # polarity_scores only ever matches single-character emoji
+        self._emoji_chars = frozenset(k for k in analyzer.emojis if len(k) == 1)
+
+    def _table(self, mapping: dict):
+        """Build a sorted word array and aligned value array from a dict."""
+        words = sorted(mapping)
+        return (
+            np.array(words, dtype=self._dtype),
+            np.array([mapping[w] for w in words], dtype=np.float64),
+        )
+
+    @staticmethod
+    def _lookup(words, values, tokens):
+        """Vectorized dictionary lookup: (found mask, values) for each token."""
+        if len(words) == 0 or len(tokens) == 0:
+            return np.zeros(len(tokens), dtype=bool), np.zeros(len(tokens))
+        idx = np.minimum(np.searchsorted(words, tokens), len(words) - 1)
+        found = words[idx] == tokens
+        return found, np.where(found, values[idx], 0.0)
+
+    def compound_scores(self, texts: List[str]) -> List[float]:
+        """Return the VADER compound score for each text, in input order."""
+        n = len(texts)
+        if n == 0:
+            return []
+
+        fallback = np.fromiter(
+            (not t.isascii() and not self._emoji_chars.isdisjoint(t) for t in texts),
+            dtype=bool,
+            count=n,
+        )
+
+        # Tokenize the whole batch into one flat array with a text id per token
+        splits = [t.split() for t in texts]
+        counts = np.fromiter(map(len, splits), dtype=np.int64, count=n)
+        total = int(counts.sum())
+        if total == 0:
+            return [0.0] * n
+        tid = np.repeat(np.arange(n), counts)
+
+        # Strip surrounding punctuation unless that leaves two chars or fewer
+        words = [
+            stripped if len(stripped := token.strip(string.punctuation)) > 2 else token
+            for token in chain.from_iterable(splits)
+        ]
+        lowered = list(map(str.lower, words))
+        lower = np.array(lowered, dtype=self._dtype)
+        upper = np.fromiter(map(str.isupper, words), dtype=bool, count=total)
+        has_nt = np.fromiter(("n't" in w for w in lowered), dtype=bool, count=total)
+
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        pos = np.arange(len(lower)) - offsets[tid]
+        length = counts[tid]
+
+        caps = np.bincount(tid, weights=upper, minlength=n)
+        cap_diff = ((counts - caps > 0) & (counts - caps < counts))[tid]
+
+        in_lex, lex_val = self._lookup(self._lex_words, self._lex_vals, lower)
+        is_boost, boost_val = self._lookup(self._boost_words, self._boost_vals, lower)
+        is_neg = self._lookup(self._negations, np.zeros(len(self._negations)), lower)[0]
+        is_neg |= has_nt
+
+        # Texts needing rules we do not vectorize go to the reference scorer
+        fallback[tid[self._lookup(self._fallback_words, np.zeros(2), lower)[0]]] = True
+        for k in (2, 3):
+            if len(lower) >= k:
+                gram = lower[: len(lower) - k + 1]
+                for j in range(1, k):
+                    gram = np.char.add(np.char.add(gram, " "), lower[j: len(lower) - k + 1 + j])
+                same = tid[: len(tid) - k + 1] == tid[k - 1:]
+                hit = self._lookup(self._idioms, np.zeros(len(self._idioms)), gram)[0] & same
+                fallback[tid[: len(tid) - k + 1][hit]] = True
+
+        def prev(arr, k, fill):
+            """Value of the token k positions earlier in the same text."""
+            out = np.concatenate((np.full(k, fill, dtype=arr.dtype), arr[:-k])) if len(arr) > k \
+                else np.full(len(arr), fill, dtype=arr.dtype)
+            return np.where(pos >= k, out, fill)
+
+        p1, p2, p3 = (prev(lower, k, "") for k in (1, 2, 3))
+        next_in_lex = np.concatenate((in_lex[1:], [False])) & (pos < length - 1)
+
+        # Lexicon words carry valence; booster words are modifiers only
+        active = in_lex & ~is_boost
+        v = np.where(active, lex_val, 0.0)
+
+        # "no" negates the next lexicon word instead of scoring itself
+        v = np.where(active & (lower == "no") & next_in_lex, 0.0, v)
+        no_rule = (p1 == "no") | (p2 == "no") | ((p3 == "no") & ((p1 == "or") | (p1 == "nor")))
+        v = np.where(active & no_rule, lex_val * self.n_scalar, v)
+
+        # ALL CAPS emphasis on the word itself
+        v = np.where(active & upper & cap_diff, np.where(v > 0, v + self.c_incr, v - self.c_incr), v)
+
+        so_this_1 = (p1 == "so") | (p1 == "this")
+        for k, damping in ((1, 1.0), (2, 0.95), (3, 0.9)):
+            cond = active & (pos >= k) & ~prev(in_lex, k, True)
+
+            # Booster/dampener k words back, sign following the current valence
+            pb = prev(is_boost, k, False)
+            s = np.where(pb, np.where(v < 0, -prev(boost_val, k, 0.0), prev(boost_val, k, 0.0)), 0.0)
+            s = np.where(
+                pb & prev(upper, k, False) & cap_diff,
+                np.where(v > 0, s + self.c_incr, s - self.c_incr),
+                s,
+            )
+            v = np.where(cond, v + s * damping, v)
+
+            negated = prev(is_neg, k, False)
+            if k == 1:
+                v = np.where(cond & negated, v * self.n_scalar, v)
+            elif k == 2:
+                emphasis = (p2 == "never") & so_this_1
+                neutral = (p2 == "without") & (p1 == "doubt")
+                v = np.where(cond & emphasis, v * 1.25,
+                             np.where(cond & ~neutral & negated, v * self.n_scalar, v))
+            else:
+                emphasis = ((p3 == "never") & ((p2 == "so") | (p2 == "this"))) | so_this_1
+                neutral = (p3 == "without") & ((p2 == "doubt") | (p1 == "doubt"))
+                v = np.where(cond & emphasis, v * 1.25,
+                             np.where(cond & ~emphasis & ~neutral & negated, v * self.n_scalar, v))
+
+        sums = np.bincount(tid, weights=v, minlength=n)
+
+        # Punctuation emphasis
+        ep = np.minimum(np.fromiter((t.count("!") for t in texts), dtype=np.int64, count=n), 4) * 0.292
+        qm_count = np.fromiter((t.count("?") for t in texts), dtype=np.int64, count=n)
+        qm = np.where(qm_count > 3, 0.96, np.where(qm_count > 1, qm_count * 0.18, 0.0))
+        amp = ep + qm
+        sums = np.where(sums > 0, sums + amp, np.where(sums < 0, sums - amp, sums))
+
+        compound = np.clip(sums / np.sqrt(sums * sums + 15), -1.0, 1.0)
+        compound = np.where(counts > 0, compound, 0.0)
+
+        scores = [round(float(c), 4) for c in compound]
+        for i in np.flatnonzero(fallback):
+            scores[i] = self.analyzer.polarity_scores(texts[i])["compound"]
+        return scores
@@ -1,11 +1,14 @@
 from .base_scraper import BaseScraper
 from .rss_scraper import RSSScraper
+from .feed_state import FeedPollState, FeedStateStore
 from .twitter_scraper import TwitterScraper
 from .sources import RSS_SOURCES, TWITTER_SEARCH_QUERIES, TWITTER_ACCOUNTS
 
 __all__ = [
     "BaseScraper",
     "RSSScraper",
+    "FeedPollState",
+    "FeedStateStore",
     "TwitterScraper",
     "RSS_SOURCES",
     "TWITTER_SEARCH_QUERIES",
@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import List, Optional
 import hashlib
 
+from ..utils.keyword_matcher import get_matcher
+
 
 @dataclass
 class ScrapedArticle:
@@ -26,8 +28,8 @@ class ScrapedArticle:
 
     def contains_starmer_mention(self, keywords: List[str]) -> bool:
         """Check if the article mentions Starmer."""
-        text = f"{self.title} {self.content_snippet or ''}".lower()
-        return any(keyword.lower() in text for keyword in keywords)
+        text = f"{self.title} {self.content_snippet or ''}"
+        return get_matcher(keywords).contains_any(text)
 
 
 class BaseScraper(ABC):
@@ -51,7 +53,11 @@ class BaseScraper(ABC):
         keywords: List[str]
     ) -> List[ScrapedArticle]:
         """Filter articles to only those mentioning Starmer."""
-        return [a for a in articles if a.contains_starmer_mention(keywords)]
+        matcher = get_matcher(keywords)
+        return [
+            a for a in articles
+            if matcher.contains_any(f"{a.title} {a.content_snippet or ''}")
+        ]
 
     def deduplicate(self, articles: List[ScrapedArticle]) -> List[ScrapedArticle]:
         """Remove duplicate articles based on URL."""
@@ -0,0 +1,178 @@
+"""
+Persistent per-source polling state for RSS feeds.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import json
+import logging
+
+from ..database import SessionLocal, FeedState
+
+logger = logging.getLogger(__name__)
+
+# Number of entry GUIDs remembered per source for the high-water mark
+RECENT_GUID_LIMIT = 200
+
+# Smoothing factor for the learned new-entry rate (higher reacts faster)
+RATE_SMOOTHING = 0.3
+
+
+@dataclass
+class FeedPollState:
+    """In-memory polling state for a single feed."""
+    source_name: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified_count: int = 0
+    fetched_count: int = 0
+    last_polled_at: Optional[datetime] = None
+    latest_published_at: Optional[datetime] = None
+    recent_guids: List[str] = field(default_factory=list)
+    new_entries_per_hour: Optional[float] = None
+    poll_interval_minutes: Optional[float] = None
+    next_poll_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        self._guid_set = set(self.recent_guids)
+
+    def is_seen(self, guid: Optional[str], published_at: Optional[datetime]) -> bool:
+        """
+        Check an entry against the high-water mark.
+
+        An entry is seen if its GUID was in a recent poll, or if it was
+        published before the newest timestamp already ingested. Entries
+        sharing the newest timestamp fall back to the GUID check so that
+        items published in the same second are not lost.
+        """
+        if guid and guid in self._guid_set:
+            return True
+        if published_at and self.latest_published_at:
+            return published_at < self.latest_published_at
+        return False
+
+    def advance(self, guids: List[str], published: List[datetime]):
+        """Move the high-water mark forward after processing a feed document."""
+        if published:
+            newest = max(published)
+            if not self.latest_published_at or newest > self.latest_published_at:
+                self.latest_published_at = newest
+
+        current = set(guids)
+        merged = list(dict.fromkeys(guids)) + [g for g in self.recent_guids if g not in current]
+        self.recent_guids = merged[:RECENT_GUID_LIMIT]
+        self._guid_set = set(self.recent_guids)
+
+    def is_due(self, now: datetime) -> bool:
+        """Check whether the feed should be polled at the given time."""
+        return self.next_poll_at is None or self.next_poll_at <= now
+
+    def record_poll(
+        self,
+        new_entries: int,
+        polled_at: datetime,
+        min_interval: float,
+        max_interval: float,
+        default_interval: float,
+    ):
+        """
+        Learn the feed's publishing rate from a completed poll and schedule the next one.
+
+        The rate is an exponentially weighted average of new entries per hour.
+        The next interval aims for roughly one new entry per poll, clamped
+        to [min_interval, max_interval] minutes. The first poll of a source
+        only establishes a baseline, since it sees the whole feed backlog.
+        """
+        if self.last_polled_at and polled_at > self.last_polled_at:
+            elapsed_hours = (polled_at - self.last_polled_at).total_seconds() / 3600
+            observed = new_entries / elapsed_hours
+            if self.new_entries_per_hour is None:
+                self.new_entries_per_hour = observed
+            else:
+                self.new_entries_per_hour = (
+                    RATE_SMOOTHING * observed
+                    + (1 - RATE_SMOOTHING) * self.new_entries_per_hour
+                )
+
+        if self.new_entries_per_hour is None:
+            interval = default_interval
+        elif self.new_entries_per_hour > 0:
+            interval = 60 / self.new_entries_per_hour
+        else:
+            interval = max_interval
+
+        self.poll_interval_minutes = max(min_interval, min(max_interval, interval))
+        self.last_polled_at = polled_at
+        self.schedule_next(polled_at)
+
+    def schedule_next(self, now: datetime):
+        """Schedule the next poll one learned interval from now."""
+        if self.poll_interval_minutes:
+            self.next_poll_at = now + timedelta(minutes=self.poll_interval_minutes)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build the conditional GET headers for the next poll."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class FeedStateStore:
+    """Loads and saves FeedPollState objects through the feed_states table."""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def load(self) -> Dict[str, FeedPollState]:
+        """Load polling state for all known sources."""
+        db = self.session_factory()
+        try:
+            return {
+                row.source_name: FeedPollState(
+                    source_name=row.source_name,
+                    etag=row.etag,
+                    last_modified=row.last_modified,
+                    not_modified_count=row.not_modified_count or 0,
+                    fetched_count=row.fetched_count or 0,
+                    last_polled_at=row.last_polled_at,
+                    latest_published_at=row.latest_published_at,
+                    recent_guids=json.loads(row.recent_guids) if row.recent_guids else [],
+                    new_entries_per_hour=row.new_entries_per_hour,
+                    poll_interval_minutes=row.poll_interval_minutes,
+                    next_poll_at=row.next_poll_at,
+                )
+                for row in db.query(FeedState).all()
+            }
+        finally:
+            db.close()
+
+    def save(self, states: Dict[str, FeedPollState]):
+        """Persist polling state for the given sources in a single transaction."""
+        db = self.session_factory()
+        try:
+            rows = {row.source_name: row for row in db.query(FeedState).all()}
+            for name, state in states.items():
+                row = rows.get(name)
+                if row is None:
+                    row = FeedState(source_name=name)
+                    db.add(row)
+                row.etag = state.etag
+                row.last_modified = state.last_modified
+                row.not_modified_count = state.not_modified_count
+                row.fetched_count = state.fetched_count
+                row.last_polled_at = state.last_polled_at
+                row.latest_published_at = state.latest_published_at
+                row.recent_guids = json.dumps(state.recent_guids)
+                row.new_entries_per_hour = state.new_entries_per_hour
+                row.poll_interval_minutes = state.poll_interval_minutes
+                row.next_poll_at = state.next_poll_at
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error saving feed state: {e}")
+        finally:
+            db.close()
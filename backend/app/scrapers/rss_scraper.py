@@ -3,40 +3,114 @@ RSS feed scraper for news sources.
 """
 
 import feedparser
+import requests
+from concurrent.futures import ThreadPoolExecutor, wait
+import copy
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from time import mktime
 import logging
 
 from .base_scraper import BaseScraper, ScrapedArticle
+from .feed_state import FeedPollState, FeedStateStore
 from .sources import RSS_SOURCES, INTERNATIONAL_RSS_SOURCES, STARMER_KEYWORDS
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "StarmerWatch/1.0 (+https://two-tier-keir.com)"
+
 
 class RSSScraper(BaseScraper):
     """Scraper for RSS feeds."""
 
-    def __init__(self, include_international: bool = True):
+    def __init__(
+        self,
+        include_international: bool = True,
+        max_workers: Optional[int] = None,
+        feed_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        state_store: Optional[FeedStateStore] = None,
+    ):
         super().__init__("RSS")
         self.sources = RSS_SOURCES.copy()
         if include_international:
             self.sources.extend(INTERNATIONAL_RSS_SOURCES)
 
-    def scrape(self) -> List[ScrapedArticle]:
-        """Scrape all configured RSS feeds."""
+        settings = get_settings()
+        self.max_workers = max_workers or settings.rss_fetch_concurrency
+        self.feed_timeout = feed_timeout or settings.rss_fetch_timeout_seconds
+        self.deadline = deadline or settings.rss_scrape_deadline_seconds
+
+        # Adaptive polling bounds (minutes)
+        self.min_poll_minutes = settings.feed_poll_min_minutes
+        self.max_poll_minutes = settings.feed_poll_max_minutes
+        self.default_poll_minutes = settings.scrape_interval_minutes
+
+        # Conditional GET validators per source; persisted when a store is given
+        self.state_store = state_store
+        self.feed_states: Dict[str, FeedPollState] = {}
+        self._committed_states: Optional[Dict[str, FeedPollState]] = None
+        self.last_cycle_stats: Dict[str, Dict[str, int]] = {}
+
+    def scrape(self, sources: Optional[List[dict]] = None) -> List[ScrapedArticle]:
+        """
+        Scrape RSS feeds concurrently (all configured feeds by default).
+
+        Feeds are fetched on a bounded thread pool. Feeds that have not
+        finished when the overall deadline expires are abandoned for this
+        run, so a single slow publisher cannot stall the whole cycle.
+
+        The advanced feed states are pending until the caller has stored
+        the articles: call commit_feed_states() after the insert commits,
+        or rollback_feed_states() if it fails, so the entries are fetched
+        again next time instead of being marked seen and lost.
+        """
+        sources = self.sources if sources is None else sources
         all_articles = []
+        self._load_feed_states()
+        self._committed_states = copy.deepcopy(self.feed_states)
+        self.last_cycle_stats = {}
 
-        for source in self.sources:
-            try:
-                articles = self._scrape_feed(source)
-                all_articles.extend(articles)
-                logger.info(f"Scraped {len(articles)} articles from {source['name']}")
-            except Exception as e:
-                logger.error(f"Error scraping {source['name']}: {e}")
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(sources))),
+            thread_name_prefix="rss-fetch",
+        )
+        try:
+            futures = [
+                (source, executor.submit(self._scrape_feed, source))
+                for source in sources
+            ]
+            done, _ = wait([f for _, f in futures], timeout=self.deadline)
+
+            # Collect in source order so results are deterministic. Only feeds
+            # finished by the deadline apply their new state: an abandoned feed
+            # keeps running, but its result is dropped with its articles.
+            for source, future in futures:
+                if future not in done:
+                    future.cancel()
+                    self._defer_feed(source)
+                    logger.warning(
+                        f"Deadline of {self.deadline}s exceeded, skipping {source['name']}"
+                    )
+                    continue
+                try:
+                    articles, state, stats = future.result()
+                    self.feed_states[source["name"]] = state
+                    self.last_cycle_stats[source["name"]] = stats
+                    all_articles.extend(articles)
+                    logger.info(f"Scraped {len(articles)} articles from {source['name']}")
+                except Exception as e:
+                    self._defer_feed(source)
+                    logger.error(f"Error scraping {source['name']}: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         self.log_scrape()
 
+        hits = sum(s["not_modified"] for s in self.last_cycle_stats.values())
+        logger.info(f"Conditional GET: {hits}/{len(self.last_cycle_stats)} feeds unchanged")
+
         # Filter for Starmer mentions
         starmer_articles = self.filter_starmer_mentions(all_articles, STARMER_KEYWORDS)
 
@@ -46,17 +120,135 @@ class RSSScraper(BaseScraper):
         logger.info(f"Total unique Starmer articles: {len(unique_articles)}")
         return unique_articles
 
-    def _scrape_feed(self, source: dict) -> List[ScrapedArticle]:
-        """Scrape a single RSS feed."""
-        feed = feedparser.parse(source["url"])
+    def _scrape_feed(
+        self, source: dict
+    ) -> Tuple[List[ScrapedArticle], FeedPollState, Dict[str, int]]:
+        """
+        Scrape a single RSS feed, skipping parsing when it is unchanged.
+
+        Works on a copy of the feed's polling state and returns the advanced
+        copy with the articles and cycle stats, leaving the caller to apply
+        them. A feed abandoned at the deadline therefore cannot mark entries
+        seen that were never returned.
+        """
+        name = source["name"]
+        state = copy.deepcopy(self.feed_states.get(name) or FeedPollState(source_name=name))
+        polled_at = datetime.utcnow()
+        response = self._fetch_feed(source, state)
+
+        if response.status_code == 304:
+            self._record_poll(state, 0, polled_at)
+            state.not_modified_count += 1
+            return [], state, {"not_modified": 1, "fetched": 0, "new": 0, "skipped": 0}
+
+        state.fetched_count += 1
+        state.etag = response.headers.get("ETag") or state.etag
+        state.last_modified = response.headers.get("Last-Modified") or state.last_modified
+
+        feed = feedparser.parse(
+            response.content,
+            response_headers={
+                "content-type": response.headers.get("Content-Type", ""),
+                "content-location": source["url"],
+            },
+        )
         articles = []
+        guids = []
+        published = []
+        skipped = 0
 
         for entry in feed.entries:
+            # Check the high-water mark before any per-entry parsing work
+            guid = self._entry_guid(entry)
+            published_at = self._entry_published_at(entry)
+            if guid:
+                guids.append(guid)
+            if published_at:
+                published.append(published_at)
+
+            if state.is_seen(guid, published_at):
+                skipped += 1
+                continue
+
             article = self._parse_entry(entry, source)
             if article:
                 articles.append(article)
 
-        return articles
+        state.advance(guids, published)
+        self._record_poll(state, len(articles), polled_at)
+        return articles, state, {
+            "not_modified": 0, "fetched": 1, "new": len(articles), "skipped": skipped,
+        }
+
+    def _fetch_feed(
+        self,
+        source: dict,
+        state: Optional[FeedPollState] = None,
+    ) -> requests.Response:
+        """Download the raw feed document, bounded by the per-feed timeout."""
+        headers = {"User-Agent": USER_AGENT}
+        if state:
+            headers.update(state.conditional_headers())
+
+        response = requests.get(
+            source["url"],
+            headers=headers,
+            timeout=self.feed_timeout,
+        )
+        response.raise_for_status()
+        return response
+
+    def _get_feed_state(self, source_name: str) -> FeedPollState:
+        """Get (or create) the polling state for a source."""
+        state = self.feed_states.get(source_name)
+        if state is None:
+            state = FeedPollState(source_name=source_name)
+            self.feed_states[source_name] = state
+        return state
+
+    def due_sources(self, now: Optional[datetime] = None) -> List[dict]:
+        """Get the sources whose adaptive next-poll time has passed."""
+        now = now or datetime.utcnow()
+        self._load_feed_states()
+        return [s for s in self.sources if self._get_feed_state(s["name"]).is_due(now)]
+
+    def _record_poll(self, state: FeedPollState, new_entries: int, polled_at: datetime):
+        """Update the learned publishing rate and next poll time for a feed."""
+        state.record_poll(
+            new_entries,
+            polled_at,
+            min_interval=self.min_poll_minutes,
+            max_interval=self.max_poll_minutes,
+            default_interval=self.default_poll_minutes,
+        )
+
+    def _defer_feed(self, source: dict):
+        """Push back the next poll of a feed that failed or timed out."""
+        state = self._get_feed_state(source["name"])
+        if not state.poll_interval_minutes:
+            state.poll_interval_minutes = self.default_poll_minutes
+        state.schedule_next(datetime.utcnow())
+
+    def _load_feed_states(self):
+        """Refresh polling state from the persistent store, if configured."""
+        if not self.state_store:
+            return
+        try:
+            self.feed_states.update(self.state_store.load())
+        except Exception as e:
+            logger.error(f"Error loading feed state: {e}")
+
+    def commit_feed_states(self):
+        """Keep the states advanced by the last scrape and persist them, if a store is configured."""
+        self._committed_states = None
+        if self.state_store:
+            self.state_store.save(self.feed_states)
+
+    def rollback_feed_states(self):
+        """Discard the states advanced by the last scrape, so its entries are fetched again."""
+        if self._committed_states is not None:
+            self.feed_states = self._committed_states
+            self._committed_states = None
 
     def _parse_entry(self, entry: dict, source: dict) -> Optional[ScrapedArticle]:
         """Parse a single RSS entry into a ScrapedArticle."""
@@ -72,11 +264,7 @@ class RSSScraper(BaseScraper):
                 return None
 
             # Get published date
-            published_at = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                published_at = datetime.fromtimestamp(mktime(entry.published_parsed))
-            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                published_at = datetime.fromtimestamp(mktime(entry.updated_parsed))
+            published_at = self._entry_published_at(entry)
 
             # Get content snippet
             content_snippet = ""
@@ -101,6 +289,18 @@ class RSSScraper(BaseScraper):
             logger.error(f"Error parsing entry: {e}")
             return None
 
+    def _entry_guid(self, entry: dict) -> Optional[str]:
+        """Get a stable identifier for an entry (GUID, falling back to the link)."""
+        return entry.get("id") or entry.get("link") or None
+
+    def _entry_published_at(self, entry: dict) -> Optional[datetime]:
+        """Get the published (or updated) timestamp of an entry."""
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            return datetime.fromtimestamp(mktime(entry.published_parsed))
+        if hasattr(entry, "updated_parsed") and entry.updated_parsed:
+            return datetime.fromtimestamp(mktime(entry.updated_parsed))
+        return None
+
     def _strip_html(self, text: str) -> str:
         """Remove HTML tags from text."""
         import re
@@ -111,5 +311,8 @@ class RSSScraper(BaseScraper):
         """Scrape a single source by name."""
         for source in self.sources:
             if source["name"].lower() == source_name.lower():
-                return self._scrape_feed(source)
+                articles, state, stats = self._scrape_feed(source)
+                self.feed_states[source["name"]] = state
+                self.last_cycle_stats[source["name"]] = stats
+                return articles
         return []
@@ -5,6 +5,9 @@ from .helpers import (
     format_datetime,
     get_uk_time,
 )
+from .keyword_matcher import KeywordMatcher, get_matcher
+from .loop_lag import LoopLagMonitor, get_loop_lag_monitor
+from .pool_wait import PoolWaitMonitor, get_pool_wait_monitor
 
 __all__ = [
     "hash_string",
@@ -12,4 +15,10 @@ __all__ = [
     "clean_html",
     "format_datetime",
     "get_uk_time",
+    "KeywordMatcher",
+    "get_matcher",
+    "LoopLagMonitor",
+    "get_loop_lag_monitor",
+    "PoolWaitMonitor",
+    "get_pool_wait_monitor",
 ]
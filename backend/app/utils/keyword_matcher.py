@@ -0,0 +1,128 @@
+"""
+Single-pass multi-keyword matching using the Aho-Corasick algorithm.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed set of keywords against text in one pass.
+
+    Matching is case-insensitive. A match must start on a word boundary,
+    so "pm" no longer matches inside "upmarket". Inflections such as
+    "resigns" or "sacked" still match unless whole_words is set, which
+    also requires a boundary at the end of the match.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+        self.whole_words = whole_words
+
+        # Trie transitions, failure links and (length, keyword) outputs per node
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str]]] = [[]]
+
+        for keyword in self.keywords:
+            self._add(keyword)
+        self._build_failure_links()
+
+    def _add(self, keyword: str):
+        """Insert a keyword into the trie."""
+        pattern = keyword.lower()
+        if not pattern:
+            return
+
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), keyword))
+
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+        # Fold failure links into a complete transition table over the keyword
+        # alphabet, so scanning is one dict lookup per character. Characters
+        # outside the alphabet always lead back to the root.
+        alphabet = {ch for node in self._goto for ch in node}
+        self._delta: List[dict] = [dict() for _ in self._goto]
+        order = deque([0])
+        while order:
+            node = order.popleft()
+            for ch in alphabet:
+                nxt = self._goto[node].get(ch)
+                if nxt is not None:
+                    self._delta[node][ch] = nxt
+                    order.append(nxt)
+                elif node:
+                    target = self._delta[self._fail[node]].get(ch, 0)
+                    if target:
+                        self._delta[node][ch] = target
+
+    def _scan(self, text: str, stop_at_first: bool) -> Set[str]:
+        """Walk the automaton over the text, collecting boundary-respecting matches."""
+        found: Set[str] = set()
+        if not text:
+            return found
+
+        text = text.lower()
+        delta, out = self._delta, self._out
+        end = len(text)
+        node = 0
+
+        for i, ch in enumerate(text):
+            node = delta[node].get(ch, 0)
+            if not out[node]:
+                continue
+
+            for length, keyword in out[node]:
+                if keyword in found:
+                    continue
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if self.whole_words and i + 1 < end and text[i + 1].isalnum():
+                    continue
+                found.add(keyword)
+                if stop_at_first:
+                    return found
+
+        return found
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return every keyword that appears in the text."""
+        return self._scan(text, stop_at_first=False)
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any keyword appears in the text."""
+        return bool(self._scan(text, stop_at_first=True))
+
+
+@lru_cache(maxsize=32)
+def _compile(keywords: Tuple[str, ...], whole_words: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, whole_words=whole_words)
+
+
+def get_matcher(keywords: Iterable[str], whole_words: bool = False) -> KeywordMatcher:
+    """Get a compiled matcher for a keyword list, building it only once per list."""
+    return _compile(tuple(keywords), whole_words)
@@ -0,0 +1,88 @@
+"""
+Event loop lag monitoring.
+
+A background task sleeps for a fixed interval and records how late it
+wakes up. Anything that blocks the event loop (synchronous I/O in an
+async function, a long CPU burst) shows up directly as lag, and with it
+as added latency on every request the loop is serving at the time.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Optional
+import asyncio
+import logging
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Samples event loop lag and keeps a window of recent samples."""
+
+    def __init__(self, interval: float = 0.5, warn_threshold: float = 0.1, window: int = 240):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start sampling on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"Loop lag monitor started (every {self.interval * 1000:.0f}ms)")
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - started - self.interval))
+
+    def record(self, lag: float):
+        self._samples.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.warn_threshold:
+            logger.warning(f"Event loop blocked for {lag * 1000:.0f}ms")
+
+    def reset(self):
+        self._samples.clear()
+        self.max_lag = 0.0
+
+    def stats(self) -> dict:
+        samples = sorted(self._samples)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+
+        return {
+            "samples": len(samples),
+            "last_ms": self._samples[-1] * 1000 if self._samples else 0.0,
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+            "max_ms": self.max_lag * 1000,
+        }
+
+
+@lru_cache()
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Get the process-wide loop lag monitor."""
+    settings = get_settings()
+    return LoopLagMonitor(
+        interval=settings.loop_lag_interval_ms / 1000,
+        warn_threshold=settings.loop_lag_warn_ms / 1000,
+    )
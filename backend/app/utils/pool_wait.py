@@ -0,0 +1,72 @@
+"""
+Connection pool checkout wait monitoring.
+
+Each checkout from a database pool is timed while it queues for a free
+connection; pre-ping and opening new connections are not counted, so the
+figures are queue wait rather than total checkout latency. Near-zero waits mean the pool has
+headroom; waits that climb towards DB_POOL_TIMEOUT_SECONDS (and
+checkout timeouts) mean requests are queueing for connections and the
+pool, or the queries holding its connections, need attention.
+"""
+
+from collections import deque
+from functools import lru_cache
+from threading import Lock
+from typing import Deque
+
+from ..config import get_settings
+
+
+class PoolWaitMonitor:
+    """Keeps a window of recent pool checkout waits."""
+
+    def __init__(self, window: int = 1000, warn_threshold: float = 1.0):
+        self.warn_threshold = warn_threshold
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+
+    def record(self, wait: float):
+        with self._lock:
+            self._samples.append(wait)
+            self.checkouts += 1
+            self.max_wait = max(self.max_wait, wait)
+            if wait >= self.warn_threshold:
+                self.slow_checkouts += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self.checkouts = self.slow_checkouts = self.timeouts = 0
+            self.max_wait = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            samples = sorted(self._samples)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+
+        return {
+            "checkouts": self.checkouts,
+            "slow_checkouts": self.slow_checkouts,
+            "timeouts": self.timeouts,
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+            "max_ms": self.max_wait * 1000,
+        }
+
+
+@lru_cache()
+def get_pool_wait_monitor(pool: str = "sync") -> PoolWaitMonitor:
+    """Get the process-wide checkout wait monitor for a pool ("sync" or "async")."""
+    return PoolWaitMonitor(warn_threshold=get_settings().db_pool_wait_warn_ms / 1000)
@@ -0,0 +1,11 @@
+"""
+Persistent background jobs.
+
+Jobs are rows in the jobs table: enqueue() adds one, and JobWorker
+(app/worker/runner.py, run with `python -m app.worker`) claims and runs
+them with retries and exponential backoff.
+"""
+
+from .queue import claim_next, complete, enqueue, fail, heartbeat, requeue_stale
+
+__all__ = ["claim_next", "complete", "enqueue", "fail", "heartbeat", "requeue_stale"]
@@ -0,0 +1,52 @@
+"""
+Job worker command line.
+
+    python -m app.worker          Run jobs until interrupted (SIGINT/SIGTERM)
+    python -m app.worker --once   Run every job that is due, then exit
+"""
+
+import argparse
+import logging
+import signal
+import sys
+
+from ..config import get_settings
+from ..database import init_db
+from .runner import JobWorker
+
+
+def main() -> int:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(prog="python -m app.worker")
+    parser.add_argument("--once", action="store_true", help="run the due jobs and exit")
+    parser.add_argument("--poll-interval", type=float, default=settings.job_poll_interval_seconds)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    init_db()
+    worker = JobWorker(
+        poll_interval=args.poll_interval,
+        stale_after=settings.job_stale_after_seconds,
+    )
+
+    if args.once:
+        worker.recover_stale()
+        ran = 0
+        while worker.run_once():
+            ran += 1
+        print(f"Ran {ran} jobs ({worker.failed} failed)")
+        return 0
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: worker.request_stop())
+    logging.getLogger(__name__).info(f"Job worker {worker.worker_id} waiting for jobs")
+    worker.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Job queue operations on the jobs table.
+
+Workers claim the oldest due job with SELECT ... FOR UPDATE SKIP LOCKED
+on PostgreSQL, so concurrent workers pass over each other's rows instead
+of queueing behind them. SQLite has no row locks; there the claim is
+the conditional UPDATE that follows (status still 'queued'), and a
+worker that loses the race simply tries the next job.
+
+A running job's worker refreshes locked_at as a heartbeat, and the
+claim's (worker, attempt) owns the row: once a job has been recovered
+as stale and claimed again, the first worker's complete() or fail()
+no longer applies.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+import json
+import logging
+
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import Job
+
+logger = logging.getLogger(__name__)
+
+# Jobs that must not be retried automatically (a retry could post twice)
+MAX_ATTEMPTS = {
+    "execute_posts": 1,
+}
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: Optional[dict] = None,
+    run_at: Optional[datetime] = None,
+    max_attempts: Optional[int] = None,
+    unique: bool = False,
+) -> Job:
+    """
+    Add a job to the queue. The caller commits.
+
+    With unique, an existing queued or running job of the same kind and
+    payload is returned instead of adding another.
+    """
+    encoded = json.dumps(payload, sort_keys=True) if payload else None
+    if unique:
+        existing = db.query(Job).filter(
+            Job.kind == kind,
+            Job.payload == encoded if encoded else Job.payload.is_(None),
+            Job.status.in_(["queued", "running"]),
+        ).order_by(Job.id).first()
+        if existing:
+            return existing
+
+    job = Job(
+        kind=kind,
+        payload=encoded,
+        status="queued",
+        attempts=0,
+        max_attempts=max_attempts or MAX_ATTEMPTS.get(kind, get_settings().job_max_attempts),
+        run_at=run_at or datetime.utcnow(),
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def claim_next(db: Session, worker_id: str, now: Optional[datetime] = None, tries: int = 5) -> Optional[Job]:
+    """Claim the oldest due job for worker_id, marking it running. Commits."""
+    now = now or datetime.utcnow()
+    for _ in range(tries):
+        job_id = db.query(Job.id).filter(
+            Job.status == "queued",
+            Job.run_at <= now,
+        ).order_by(Job.run_at, Job.id).limit(1).with_for_update(skip_locked=True).scalar()
+        if job_id is None:
+            db.rollback()
+            return None
+
+        claimed = db.query(Job).filter(Job.id == job_id, Job.status == "queued").update({
+            Job.status: "running",
+            Job.locked_by: worker_id,
+            Job.locked_at: now,
+            Job.attempts: Job.attempts + 1,
+        }, synchronize_session=False)
+        db.commit()
+        if claimed:
+            return db.get(Job, job_id)
+    return None
+
+
+def heartbeat(db: Session, job: Job, worker_id: str, now: Optional[datetime] = None) -> bool:
+    """
+    Refresh locked_at on a job worker_id is running, so it is not recovered as stale. Commits.
+
+    Returns False if the job is no longer held by this attempt.
+    """
+    return _update_held(db, job, worker_id, {Job.locked_at: now or datetime.utcnow()})
+
+
+def complete(db: Session, job: Job, worker_id: str, result: Optional[dict] = None, now: Optional[datetime] = None) -> bool:
+    """
+    Mark a claimed job succeeded. Commits.
+
+    Only applies while worker_id still holds the attempt it claimed; if the
+    job was recovered and claimed again meanwhile, nothing is written and
+    False is returned.
+    """
+    return _update_held(db, job, worker_id, {
+        Job.status: "succeeded",
+        Job.result: json.dumps(result) if result is not None else None,
+        Job.last_error: None,
+        Job.locked_by: None,
+        Job.finished_at: now or datetime.utcnow(),
+    })
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after the given number of failed attempts."""
+    settings = get_settings()
+    seconds = settings.job_retry_base_seconds * 2 ** max(0, attempts - 1)
+    return timedelta(seconds=min(seconds, settings.job_retry_max_seconds))
+
+
+def fail(
+    db: Session,
+    job: Job,
+    worker_id: str,
+    error: str,
+    now: Optional[datetime] = None,
+    retry: bool = True,
+    stale_before: Optional[datetime] = None,
+) -> bool:
+    """
+    Record a failed attempt: requeue with backoff, or fail for good once out of attempts. Commits.
+
+    Like complete(), only applies while worker_id still holds the attempt
+    (and, with stale_before, only if its last heartbeat is older than that).
+    """
+    now = now or datetime.utcnow()
+    values = {Job.last_error: error, Job.locked_by: None}
+    if retry and job.attempts < job.max_attempts:
+        values.update({Job.status: "queued", Job.run_at: now + retry_delay(job.attempts)})
+    else:
+        values.update({Job.status: "failed", Job.finished_at: now})
+    criteria = [Job.locked_at < stale_before] if stale_before else []
+    return _update_held(db, job, worker_id, values, *criteria)
+
+
+def _update_held(db: Session, job: Job, worker_id: str, values: dict, *criteria) -> bool:
+    # The attempt number tells a worker's own claim apart from a later one after recovery
+    job_id, attempts = job.id, job.attempts
+    updated = db.query(Job).filter(
+        Job.id == job_id,
+        Job.status == "running",
+        Job.locked_by == worker_id,
+        Job.attempts == attempts,
+        *criteria,
+    ).update(values, synchronize_session=False)
+    db.commit()
+    if not updated:
+        logger.warning(f"Job {job_id} attempt {attempts} is no longer held by {worker_id}, not updated")
+    return bool(updated)
+
+
+def requeue_stale(db: Session, stale_after: float, now: Optional[datetime] = None) -> int:
+    """
+    Recover jobs left running by a worker that died. Commits.
+
+    They are requeued if they have attempts left and failed otherwise.
+    A job whose worker sends a heartbeat in the meantime is left alone.
+    Returns the number of jobs recovered.
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(seconds=stale_after)
+    stale = db.query(Job).filter(
+        Job.status == "running",
+        Job.locked_at < cutoff,
+    ).all()
+    recovered = 0
+    for job in stale:
+        owner = job.locked_by
+        if fail(db, job, owner, f"Worker {owner} stopped responding", now=now, stale_before=cutoff):
+            recovered += 1
+    if recovered:
+        logger.warning(f"Recovered {recovered} stale jobs")
+    return recovered
+
+
+def decode(value: Optional[str]) -> Optional[dict]:
+    return json.loads(value) if value else None
+
@@ -0,0 +1,160 @@
+"""
+The job worker loop.
+
+Run it as its own process with `python -m app.worker`, so ingestion
+scales separately from the API, or embedded in the API process as a
+background thread (WORKER_EMBEDDED=true) for single-process setups.
+Any number of workers can share the queue.
+"""
+
+from functools import lru_cache
+from threading import Event, Thread
+from typing import Callable, Dict, Optional
+import logging
+import time
+
+from ..bot.leader import default_holder_id
+from ..config import get_settings
+from ..database import SessionLocal, Job
+from .queue import claim_next, complete, decode, fail, heartbeat, requeue_stale
+from .tasks import HANDLERS
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Claims due jobs from the queue and runs their handlers."""
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0,
+        stale_after: float = 900,
+        heartbeat_interval: Optional[float] = None,
+        handlers: Optional[Dict[str, Callable[[dict], Optional[dict]]]] = None,
+    ):
+        self.session_factory = session_factory
+        self.worker_id = worker_id or default_holder_id()
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        # Well inside stale_after, so a live job is never mistaken for a dead one
+        self.heartbeat_interval = heartbeat_interval or stale_after / 4
+        self.handlers = handlers if handlers is not None else HANDLERS
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+
+        self.succeeded = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_once(self) -> bool:
+        """Claim and run one due job. Returns False if there was none."""
+        db = self.session_factory()
+        try:
+            job = claim_next(db, self.worker_id)
+            if job is None:
+                return False
+
+            logger.info(f"Running job {job.id} ({job.kind}), attempt {job.attempts}/{job.max_attempts}")
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                fail(db, job, self.worker_id, f"Unknown job kind: {job.kind}", retry=False)
+                self.failed += 1
+                return True
+
+            beating = Event()
+            beat = Thread(target=self._heartbeat, args=(job, beating), name=f"job-{job.id}-heartbeat", daemon=True)
+            beat.start()
+            try:
+                result = handler(decode(job.payload) or {})
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                beating.set()
+                beat.join()
+                fail(db, job, self.worker_id, str(e))
+                self.failed += 1
+            else:
+                beating.set()
+                beat.join()
+                complete(db, job, self.worker_id, result)
+                self.succeeded += 1
+            return True
+        finally:
+            db.close()
+
+    def _heartbeat(self, job: Job, done: Event):
+        """Refresh the job's lock every heartbeat_interval until done is set."""
+        while not done.wait(self.heartbeat_interval):
+            db = self.session_factory()
+            try:
+                if not heartbeat(db, job, self.worker_id):
+                    return
+            except Exception as e:
+                logger.error(f"Error sending heartbeat for job {job.id}: {e}")
+            finally:
+                db.close()
+
+    def recover_stale(self) -> int:
+        db = self.session_factory()
+        try:
+            return requeue_stale(db, self.stale_after)
+        finally:
+            db.close()
+
+    def run(self):
+        """Process jobs until stop() is called, polling when the queue is empty."""
+        last_recovery = 0.0
+        while not self._stopping.is_set():
+            try:
+                if time.monotonic() - last_recovery >= self.stale_after / 4:
+                    self.recover_stale()
+                    last_recovery = time.monotonic()
+                if self.run_once():
+                    continue
+            except Exception as e:
+                logger.error(f"Error in job worker: {e}")
+            self._stopping.wait(self.poll_interval)
+
+    def start(self):
+        """Run the worker in a background thread."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = Thread(target=self.run, name="job-worker", daemon=True)
+        self._thread.start()
+        logger.info(f"Job worker {self.worker_id} started")
+
+    def request_stop(self):
+        """Stop after the current job."""
+        self._stopping.set()
+
+    def stop(self, timeout: float = 30):
+        """Stop the background thread, waiting up to timeout for the current job."""
+        self.request_stop()
+        if self._thread is not None:
+            # A job still running after this is recovered once it goes stale
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "worker_id": self.worker_id,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+
+
+@lru_cache()
+def get_job_worker() -> JobWorker:
+    """Get the process-wide job worker."""
+    settings = get_settings()
+    return JobWorker(
+        poll_interval=settings.job_poll_interval_seconds,
+        stale_after=settings.job_stale_after_seconds,
+    )
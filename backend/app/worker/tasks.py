@@ -0,0 +1,31 @@
+"""
+Job handlers, keyed by job kind.
+
+Each handler takes the job's payload dict and returns a JSON-able result
+(stored on the job), or raises to have the job retried.
+"""
+
+from typing import Callable, Dict, Optional
+
+from ..bot.scheduler import get_post_scheduler
+
+
+def scrape(payload: dict) -> dict:
+    return get_post_scheduler().scrape_and_store(due_only=payload.get("due_only", False))
+
+
+def plan_posts(payload: dict) -> Optional[dict]:
+    get_post_scheduler().plan_daily_posts()
+    return None
+
+
+def execute_posts(payload: dict) -> Optional[dict]:
+    get_post_scheduler().execute_scheduled_posts()
+    return None
+
+
+HANDLERS: Dict[str, Callable[[dict], Optional[dict]]] = {
+    "scrape": scrape,
+    "plan_posts": plan_posts,
+    "execute_posts": execute_posts,
+}
@@ -0,0 +1,188 @@
+"""
+Benchmark the async read routes against the threadpool (sync def) model.
+
+Starts the API under uvicorn in a subprocess, with sync copies of the
+hot read routes mounted under /bench/sync, and drives both with
+concurrent HTTP clients. Reports requests/sec and latency percentiles.
+The response cache is off so every request reaches the database, and
+the server runs with ASYNC_READS=true so /api serves the async routes.
+
+Runs against a temporary SQLite file by default. Point DATABASE_URL at a
+scratch PostgreSQL database to measure asyncpg, which decides whether
+ASYNC_READS should be turned on:
+Run with: [DATABASE_URL=postgresql://...] python benchmarks/bench_async_reads.py [--requests N] [--concurrency C]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+if "--serve" not in sys.argv and "DATABASE_URL" not in os.environ:
+    _db_dir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+os.environ["ASYNC_READS"] = "true"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["WORKER_EMBEDDED"] = "false"
+
+import httpx
+from fastapi import Depends, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.api.pagination import paginate
+from app.api.schemas import ArticleResponse, TierListResponse, TierItemResponse
+from app.api.serialization import FastJSONResponse, row_dicts, schema_columns
+from app.config import get_settings
+from app.database import SessionLocal, get_db, init_db, Article, Poll, TierItem
+from app.main import app
+
+
+@app.get("/bench/sync/articles")
+def sync_articles(limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
+    """/articles as a sync route on the threadpool."""
+    query = db.query(*schema_columns(Article, ArticleResponse)).filter(
+        Article.sentiment_score < get_settings().sentiment_threshold
+    )
+    articles, has_more, next_cursor = paginate(
+        query, Article.published_at, Article.id, True, "published_at", limit,
+    )
+    return FastJSONResponse({
+        "articles": row_dicts(articles),
+        "total": None,
+        "page": 1,
+        "per_page": limit,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    })
+
+
+@app.get("/bench/sync/tier-list", response_model=TierListResponse)
+def sync_tier_list(db: Session = Depends(get_db)):
+    """/tier-list as a sync route on the threadpool."""
+    average = func.coalesce(TierItem.vote_sum * 1.0 / func.nullif(TierItem.vote_count, 0), 0)
+    items = (
+        db.query(TierItem)
+        .filter(TierItem.is_active == True)
+        .order_by(average.desc(), TierItem.id)
+        .all()
+    )
+    return TierListResponse(
+        items=[TierItemResponse(
+            id=i.id, description=i.description, category=i.category,
+            date_occurred=i.date_occurred, source_url=i.source_url,
+            created_at=i.created_at, is_active=i.is_active,
+            average_vote=i.average_vote, vote_count=i.vote_count,
+        ) for i in items],
+        total_votes=sum(i.vote_count for i in items),
+    )
+
+
+@app.get("/bench/sync/polls/latest")
+def sync_latest_poll(db: Session = Depends(get_db)):
+    """/polls/latest as a sync route on the threadpool."""
+    from app.api.schemas import PollResponse
+
+    return PollResponse.model_validate(db.query(Poll).order_by(Poll.date.desc()).first())
+
+
+def seed():
+    db = SessionLocal()
+    try:
+        base = datetime(2025, 1, 1)
+        for i in range(2000):
+            db.add(Article(
+                title=f"Starmer faces fresh backlash over U-turn number {i}",
+                url=f"https://example.com/news/{i}",
+                source="Benchmark",
+                published_at=base + timedelta(minutes=i),
+                sentiment_score=-0.3 - (i % 7) * 0.1,
+                content_snippet="The Prime Minister was criticised again today " * 4,
+            ))
+        for i in range(30):
+            db.add(TierItem(description=f"Scandal {i}", vote_sum=i * 7, vote_count=i + 1))
+        for i in range(100):
+            db.add(Poll(pollster="YouGov", date=base + timedelta(days=i), approval_rating=30 - i / 10))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def load(client: httpx.AsyncClient, path: str, requests: int, concurrency: int):
+    timings = []
+    remaining = iter(range(requests))
+
+    async def user():
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path)
+            timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return requests / elapsed, statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+async def run(base_url: str, requests: int, concurrency: int):
+    cases = [
+        ("articles", "/bench/sync/articles?limit=20", "/api/articles?limit=20"),
+        ("tier-list", "/bench/sync/tier-list", "/api/tier-list"),
+        ("polls/latest", "/bench/sync/polls/latest", "/api/polls/latest"),
+    ]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        print(f"{requests} requests per case, {concurrency} concurrent clients")
+        print(f"{'endpoint':14} {'model':10} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, sync_path, async_path in cases:
+            for label, path in (("threadpool", sync_path), ("async", async_path)):
+                await load(client, path, min(200, requests), concurrency)  # warm up
+                rps, p50, p99 = await load(client, path, requests, concurrency)
+                print(f"{name:14} {label:10} {rps:8.0f} {p50:8.1f} {p99:8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        import uvicorn
+        uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+        return
+
+    init_db()
+    seed()
+
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(args.port)],
+        env=os.environ.copy(),
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        asyncio.run(run(base_url, args.requests, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
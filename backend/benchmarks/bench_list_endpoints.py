@@ -0,0 +1,138 @@
+"""
+Benchmark list endpoint latency for 100-item pages.
+
+Compares the previous serialization path (ORM objects, per-row Pydantic
+model_validate, default JSON encoding) with the current one (column
+tuples, plain dicts, orjson), and reports gzip sizes.
+Run with: python benchmarks/bench_list_endpoints.py [--requests N]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/bench.db"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"  # measure the handlers, not the cache
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.pagination import paginate
+from app.api.schemas import ArticleListResponse, ArticleResponse
+from app.config import get_settings
+from app.database import SessionLocal, get_db, init_db, Article, CopeEntry
+from app.main import app
+
+
+@app.get("/bench/legacy/articles", response_model=ArticleListResponse)
+def legacy_articles(limit: int = 100, db: Session = Depends(get_db)):
+    """The /articles handler as it was before the fast path."""
+    query = db.query(Article).filter(Article.sentiment_score < get_settings().sentiment_threshold)
+    articles, has_more, next_cursor = paginate(
+        query, Article.published_at, Article.id, True, "published_at", limit,
+    )
+    return ArticleListResponse(
+        articles=[ArticleResponse.model_validate(a) for a in articles],
+        page=1,
+        per_page=limit,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
+
+
+@app.get("/bench/legacy/cope")
+def legacy_cope(limit: int = 100, db: Session = Depends(get_db)):
+    """The /cope handler as it was before the fast path."""
+    entries = db.query(CopeEntry).filter(
+        CopeEntry.is_approved == True
+    ).order_by(CopeEntry.votes.desc(), CopeEntry.id.desc()).limit(limit + 1).all()
+    return [
+        {
+            "id": e.id,
+            "content": e.content,
+            "source_url": e.source_url,
+            "source_platform": e.source_platform,
+            "source_username": e.source_username,
+            "category": e.category,
+            "cope_level": e.cope_level,
+            "votes": e.votes,
+            "created_at": e.created_at.isoformat(),
+        }
+        for e in entries[:limit]
+    ]
+
+
+def seed(count: int):
+    db = SessionLocal()
+    try:
+        base = datetime(2025, 1, 1)
+        for i in range(count):
+            db.add(Article(
+                title=f"Starmer faces fresh backlash over U-turn number {i}",
+                url=f"https://example.com/news/{i}",
+                source="Benchmark",
+                published_at=base + timedelta(minutes=i),
+                sentiment_score=-0.3 - (i % 7) * 0.1,
+                content_snippet="The Prime Minister was criticised again today " * 4,
+            ))
+            db.add(CopeEntry(
+                content=f"He is playing 4D chess, you just cannot see it yet ({i})",
+                source_platform="x",
+                votes=i % 50,
+                is_approved=True,
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def measure(client: TestClient, url: str, params: dict, n: int, headers=None):
+    client.get(url, params=params, headers=headers)  # warm up
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        response = client.get(url, params=params, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1], len(response.content)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    init_db()
+    seed(1000)
+
+    cases = [
+        ("articles", "/bench/legacy/articles", "/api/articles"),
+        ("cope", "/bench/legacy/cope", "/api/cope"),
+    ]
+    identity = {"Accept-Encoding": "identity"}
+
+    client = TestClient(app)  # no lifespan: the benchmark needs no scheduler or vote buffer
+    print(f"{args.requests} requests per case, 100-item pages")
+    print(f"{'endpoint':10} {'path':7} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>8}")
+    for name, before, after in cases:
+        for label, url in (("before", before), ("after", after)):
+            p50, p99, size = measure(client, url, {"limit": 100}, args.requests, identity)
+            print(f"{name:10} {label:7} {p50:8.2f} {p99:8.2f} {size:8d}")
+        p50, p99, _ = measure(client, after, {"limit": 100}, args.requests, {"Accept-Encoding": "gzip"})
+        raw = client.get(after, params={"limit": 100}, headers={"Accept-Encoding": "gzip"})
+        print(f"{name:10} {'gzip':7} {p50:8.2f} {p99:8.2f} {int(raw.headers['content-length']):8d}")
+
+
+if __name__ == "__main__":
+    main()
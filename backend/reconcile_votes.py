@@ -0,0 +1,25 @@
+"""
+Rebuild tier list vote aggregates from the raw tier_votes rows.
+Run with: python reconcile_votes.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal, init_db, reconcile_tier_votes
+
+
+def main():
+    init_db()
+    db = SessionLocal()
+    try:
+        fixed = reconcile_tier_votes(db)
+        db.commit()
+        print(f"Reconciled vote aggregates ({fixed} items corrected)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,597 @@
+"""
+Tests for API routes, run against an in-memory SQLite database.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.api.compression import CompressionMiddleware, choose_encoding
+from app.api.pagination import count_cache, encode_cursor
+from app.api.schemas import ArticleResponse
+from app.api.response_cache import etag_matches, get_response_cache, matching_etag
+from app.api.stats import StatsSnapshot, stats_snapshot
+from app.api.rate_limiter import RateLimiter, get_rate_limiter
+from app.api.vote_buffer import VoteBuffer
+from app.database import (
+    get_db, get_async_db, get_read_db, insert_articles, reconcile_tier_votes, ThreadpoolSession,
+    Article, CopeEntry, Poll, Promise, TierItem, TierVote, XPost,
+)
+from app.main import app
+from app.migrations import upgrade
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    # A file rather than :memory:, so the sync and async engines share it
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def db_session(db_path):
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    upgrade(engine)
+    TestingSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = TestingSession()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture(params=["threadpool", "async"])
+def client(request, db_session, db_path):
+    def override_get_db():
+        yield db_session
+
+    # NullPool: TestClient may run each request on a different event loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    AsyncTestingSession = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+    async def override_get_async_db():
+        async with AsyncTestingSession() as session:
+            yield session
+
+    async def override_get_threadpool_db():
+        yield ThreadpoolSession(db_session)
+
+    # The read routes run in both modes (ASYNC_READS off and on)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = (
+        override_get_async_db if request.param == "async" else override_get_threadpool_db
+    )
+    count_cache.clear()
+    stats_snapshot.invalidate()
+    get_response_cache().clear()
+    get_rate_limiter().reset()
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def add_articles(db, count):
+    base = datetime(2025, 1, 1)
+    for i in range(count):
+        db.add(Article(
+            title=f"Starmer disaster {i}",
+            url=f"https://example.com/{i}",
+            source="Test",
+            # Duplicate timestamps and NULLs exercise the id tie-breaker
+            published_at=None if i % 7 == 0 else base + timedelta(hours=i // 2),
+            sentiment_score=-0.5 - (i % 5) * 0.1,
+        ))
+    db.commit()
+
+
+class TestArticlePagination:
+    """Tests for keyset pagination on /api/articles."""
+
+    @pytest.mark.parametrize("sort_by", ["published_at", "sentiment_score", "scraped_at"])
+    def test_cursor_walk_returns_every_article_once(self, client, db_session, sort_by):
+        add_articles(db_session, 23)
+        offset_ids = [
+            a["id"] for a in client.get(
+                "/api/articles", params={"limit": 100, "sort_by": sort_by}
+            ).json()["articles"]
+        ]
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 5, "sort_by": sort_by}
+            if cursor:
+                params["cursor"] = cursor
+            data = client.get("/api/articles", params=params).json()
+            seen.extend(a["id"] for a in data["articles"])
+            cursor = data["next_cursor"]
+            assert data["has_more"] == (cursor is not None)
+            if not cursor:
+                break
+
+        assert seen == offset_ids
+        assert len(seen) == 23
+
+    def test_total_is_optional(self, client, db_session):
+        add_articles(db_session, 3)
+        assert client.get("/api/articles").json()["total"] is None
+        assert client.get("/api/articles", params={"include_total": True}).json()["total"] == 3
+
+    def test_invalid_cursor(self, client):
+        assert client.get("/api/articles", params={"cursor": "garbage"}).status_code == 400
+
+    @pytest.mark.parametrize("value, row_id", [
+        ([1, 2], 1),
+        ({"x": 1}, 1),
+        ({"dt": 5}, 1),
+        ("2025-01-01T00:00:00", "1"),
+        ("2025-01-01T00:00:00", [1]),
+        ("2025-01-01T00:00:00", True),
+    ])
+    def test_well_formed_cursor_with_bad_fields(self, client, value, row_id):
+        """A decodable cursor whose value or id has the wrong shape is a 400, not a 500."""
+        cursor = encode_cursor("published_at", value, row_id)
+        assert client.get("/api/articles", params={"cursor": cursor}).status_code == 400
+
+
+class TestCopePagination:
+    """Tests for keyset pagination on /api/cope."""
+
+    def test_next_cursor_header(self, client, db_session):
+        for i in range(5):
+            db_session.add(CopeEntry(content="x" * 30, votes=i % 2, is_approved=True))
+        db_session.commit()
+
+        first = client.get("/api/cope", params={"limit": 3})
+        second = client.get(
+            "/api/cope", params={"limit": 3, "cursor": first.headers["X-Next-Cursor"]}
+        )
+
+        ids = [e["id"] for e in first.json()] + [e["id"] for e in second.json()]
+        assert sorted(ids) == [1, 2, 3, 4, 5]
+        assert "X-Next-Cursor" not in second.headers
+
+
+class TestBulkInsert:
+    """Tests for insert_articles."""
+
+    def _row(self, url, title="Starmer U-turn"):
+        return {"title": title, "url": url, "source": "BBC", "published_at": datetime(2024, 1, 1)}
+
+    def test_skips_existing_and_batch_duplicates(self, db_session):
+        db_session.add(Article(title="Old", url="https://example.com/old", source="BBC"))
+        db_session.commit()
+
+        rows = [
+            self._row("https://example.com/old"),
+            self._row("https://example.com/a"),
+            self._row("https://example.com/a", title="Duplicate"),
+            self._row("https://example.com/b"),
+        ]
+        result = insert_articles(db_session, rows, chunk_size=2)
+        db_session.commit()
+
+        assert result.inserted == 2
+        assert result.skipped == 2
+        saved = db_session.query(Article).filter(Article.id.in_(result.inserted_ids)).all()
+        assert {a.url for a in saved} == {"https://example.com/a", "https://example.com/b"}
+        assert db_session.query(Article).count() == 3
+
+    def test_empty_batch(self, db_session):
+        result = insert_articles(db_session, [])
+        assert result.inserted == 0
+        assert result.skipped == 0
+
+
+class TestTierList:
+    """Tests for the aggregate-driven tier list."""
+
+    def test_averages_and_order(self, client, db_session):
+        items = [TierItem(description=f"Item {i}") for i in range(3)]
+        items.append(TierItem(description="Hidden", is_active=False))
+        db_session.add_all(items)
+        db_session.commit()
+
+        for item_id, value in [(1, 2), (1, 4), (2, 5), (4, 5)]:
+            db_session.add(TierVote(item_id=item_id, item_description="x", vote_value=value))
+        db_session.commit()
+        assert client.get("/api/tier-list").json()["total_votes"] == 0
+
+        assert client.post("/api/admin/tier-list/reconcile").json()["items_fixed"] == 3
+
+        body = client.get("/api/tier-list").json()
+        assert [i["id"] for i in body["items"]] == [2, 1, 3]
+        assert [i["average_vote"] for i in body["items"]] == [5.0, 3.0, None]
+        assert [i["vote_count"] for i in body["items"]] == [1, 2, 0]
+        assert body["total_votes"] == 3
+
+    def test_vote_updates_aggregates(self, client, db_session):
+        db_session.add(TierItem(description="Item", vote_sum=1, vote_count=1))
+        db_session.add(TierVote(item_id=1, item_description="Item", vote_value=1))
+        db_session.commit()
+
+        body = client.post("/api/tier-list/vote", json={"item_id": 1, "vote_value": 5}).json()
+        assert body == {"success": True, "new_average": 3.0, "total_votes": 2}
+
+        # Aggregates already agree with the raw votes
+        assert reconcile_tier_votes(db_session) == 0
+
+
+class TestVoteBuffer:
+    """Tests for the write-behind vote buffer."""
+
+    def test_flush_coalesces_votes(self, db_session):
+        db_session.add(CopeEntry(content="x" * 30, votes=2, is_approved=True))
+        db_session.add(TierItem(description="Item"))
+        db_session.commit()
+
+        buffer = VoteBuffer(flush_interval=60, session_factory=lambda: db_session)
+        for _ in range(3):
+            buffer.add_cope_vote(1)
+        assert buffer.add_tier_vote(1, "Item", 4, "a") == (4, 1)
+        assert buffer.add_tier_vote(1, "Item", 2, "b") == (6, 2)
+
+        assert buffer.flush() == 5
+        db_session.expire_all()
+        assert db_session.get(CopeEntry, 1).votes == 5
+        item = db_session.get(TierItem, 1)
+        assert (item.vote_sum, item.vote_count) == (6, 2)
+        assert db_session.query(TierVote).count() == 2
+
+    def test_stop_flushes_pending_votes(self, db_session):
+        db_session.add(CopeEntry(content="x" * 30, votes=0, is_approved=True))
+        db_session.commit()
+
+        buffer = VoteBuffer(flush_interval=60, session_factory=lambda: db_session)
+        buffer.start()
+        buffer.add_cope_vote(1)
+        buffer.stop()
+
+        db_session.expire_all()
+        assert db_session.get(CopeEntry, 1).votes == 1
+        assert buffer.stats()["votes_written"] == 1
+
+    def test_failed_flush_dropped_after_retries(self):
+        class BrokenSession:
+            def connection(self):
+                raise RuntimeError("database unavailable")
+
+            def rollback(self):
+                pass
+
+            def close(self):
+                pass
+
+        buffer = VoteBuffer(flush_interval=60, max_retries=2, session_factory=BrokenSession)
+        buffer.add_cope_vote(1)
+        buffer.add_cope_vote(1)
+
+        assert buffer.flush() == 0
+        assert buffer.flush() == 0
+        assert buffer.stats()["pending"] == 2  # re-queued for the retries
+        assert buffer.flush() == 0
+        stats = buffer.stats()
+        assert (stats["pending"], stats["votes_dropped"], stats["failed_flushes"]) == (0, 2, 3)
+
+    def test_full_buffer_writes_through(self, db_session):
+        buffer = VoteBuffer(flush_interval=60, max_pending=2, session_factory=lambda: db_session)
+        assert not buffer.accepting()  # not running
+        buffer.start()
+        try:
+            buffer._wake.clear()
+            with buffer._lock:
+                buffer._pending = 2
+            assert not buffer.accepting()
+            assert buffer.stats()["write_throughs"] == 1
+        finally:
+            with buffer._lock:
+                buffer._pending = 0
+            buffer.stop()
+
+    def test_cope_vote_without_buffer(self, client, db_session):
+        db_session.add(CopeEntry(content="x" * 30, votes=7, is_approved=True))
+        db_session.commit()
+        assert client.post("/api/cope/1/vote").json() == {"success": True, "votes": 8}
+
+
+class TestRateLimiter:
+    """Tests for the sliding-window rate limiter."""
+
+    def test_sliding_window(self):
+        limiter = RateLimiter(limits={"act": (2, 60)})
+        assert limiter.allow("act", "ip", now=1000)
+        assert limiter.allow("act", "ip", now=1030)
+        assert not limiter.allow("act", "ip", now=1059)
+        assert limiter.allow("act", "ip2", now=1059)
+        # The first hit has left the window
+        assert limiter.allow("act", "ip", now=1061)
+        assert not limiter.allow("act", "ip", now=1062)
+
+    def test_seeded_from_db(self, db_session):
+        now = datetime.utcnow()
+        db_session.add(TierVote(
+            item_id=1, item_description="x", vote_value=3, voter_ip_hash="abc", created_at=now,
+        ))
+        db_session.add(TierVote(
+            item_id=2, item_description="x", vote_value=3, voter_ip_hash="abc",
+            created_at=now - timedelta(days=2),
+        ))
+        for _ in range(5):
+            db_session.add(CopeEntry(content="x" * 30, submitted_by_ip_hash="abc", created_at=now))
+        db_session.commit()
+
+        limiter = RateLimiter()
+        assert limiter.seed_from_db(db_session) == 6
+        assert not limiter.allow("tier_vote", "1:abc")
+        assert limiter.allow("tier_vote", "2:abc")
+        assert not limiter.allow("cope_submit", "abc")
+
+    def test_duplicate_tier_vote_rejected(self, client, db_session):
+        db_session.add(TierItem(description="Item"))
+        db_session.commit()
+
+        assert client.post("/api/tier-list/vote", json={"item_id": 1, "vote_value": 3}).status_code == 200
+        assert client.post("/api/tier-list/vote", json={"item_id": 1, "vote_value": 3}).status_code == 429
+
+
+class TestDashboardStats:
+    """Tests for the single-query dashboard stats and their snapshot."""
+
+    def test_counts(self, client, db_session):
+        now = datetime.utcnow()
+        add_articles(db_session, 3)
+        db_session.add(Article(
+            title="Fine", url="https://example.com/ok", source="BBC", sentiment_score=0.5,
+        ))
+        db_session.add(XPost(post_text="a", status="posted", posted_at=now))
+        db_session.add(XPost(post_text="b", status="posted", posted_at=now - timedelta(days=2)))
+        db_session.add(XPost(post_text="c", status="pending"))
+        db_session.add(Promise(promise_text="p", status="broken"))
+        db_session.add(Promise(promise_text="q", status="kept"))
+        db_session.add(Poll(pollster="YouGov", date=now - timedelta(days=9), approval_rating=20))
+        db_session.add(Poll(pollster="Ipsos", date=now, approval_rating=17))
+        db_session.commit()
+
+        assert client.get("/api/stats").json() == {
+            "total_articles": 4,
+            "negative_articles": 3,
+            "posts_today": 1,
+            "posts_total": 2,
+            "broken_promises": 1,
+            "latest_approval_rating": 17.0,
+            "days_since_disaster": 0,
+        }
+
+    def test_snapshot_served_until_refreshed(self, db_session):
+        snapshot = StatsSnapshot(ttl_seconds=60, session_factory=lambda: db_session)
+        assert snapshot.get(db_session).total_articles == 0
+
+        add_articles(db_session, 2)
+        assert snapshot.get(db_session).total_articles == 0
+
+        snapshot.refresh()
+        assert snapshot.get(db_session).total_articles == 2
+
+
+class TestResponseCache:
+    """Tests for the route-level response cache."""
+
+    def test_hit_until_invalidated(self, client, db_session):
+        db_session.add(CopeEntry(content="x" * 30, votes=1, is_approved=True))
+        db_session.add(CopeEntry(content="y" * 30, votes=1, is_approved=False))
+        db_session.commit()
+
+        first = client.get("/api/cope")
+        assert first.headers["X-Cache"] == "MISS"
+        assert len(first.json()) == 1
+
+        second = client.get("/api/cope")
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+
+        # Query params are part of the key
+        assert client.get("/api/cope", params={"sort_by": "recent"}).headers["X-Cache"] == "MISS"
+
+        client.post("/api/admin/cope/2/approve")
+        third = client.get("/api/cope")
+        assert third.headers["X-Cache"] == "MISS"
+        assert len(third.json()) == 2
+
+    def test_next_cursor_header_is_cached(self, client, db_session):
+        for _ in range(3):
+            db_session.add(CopeEntry(content="x" * 30, is_approved=True))
+        db_session.commit()
+
+        first = client.get("/api/cope", params={"limit": 2})
+        second = client.get("/api/cope", params={"limit": 2})
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    def test_uncached_paths(self, client):
+        assert "X-Cache" not in client.get("/api/admin/feeds").headers
+
+
+class TestConditionalResponses:
+    """Tests for ETag / If-None-Match handling."""
+
+    def test_not_modified_until_write(self, client, db_session):
+        db_session.add(TierItem(description="Item"))
+        db_session.commit()
+
+        first = client.get("/api/tier-list")
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        again = client.get("/api/tier-list", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["ETag"] == etag
+        assert again.content == b""
+
+        client.post("/api/tier-list/vote", json={"item_id": 1, "vote_value": 4})
+        changed = client.get("/api/tier-list", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["total_votes"] == 1
+
+    def test_stats_etag_follows_snapshot(self, client, db_session):
+        etag = client.get("/api/stats").headers["ETag"]
+        assert client.get("/api/stats", headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/api/promises", json={"promise_text": "No tax rises", "status": "broken"})
+        response = client.get("/api/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["broken_promises"] == 1
+
+    def test_recompute_during_request_not_cached(self, client, db_session):
+        first = client.get("/api/stats")
+        etag = first.headers["ETag"]
+
+        # The snapshot and the cached entry go stale, and the counts change without an invalidate
+        db_session.add(Promise(promise_text="No tax rises", status="broken"))
+        db_session.commit()
+        with stats_snapshot._lock:
+            stats_snapshot._snapshot = (0.0, stats_snapshot._snapshot[1])
+        get_response_cache().backend._entries.clear()
+
+        recomputed = client.get("/api/stats")
+        assert recomputed.status_code == 200
+        assert recomputed.json()["broken_promises"] == 1
+        assert "ETag" not in recomputed.headers  # body is newer than the key it was looked up under
+
+        again = client.get("/api/stats", headers={"If-None-Match": etag})
+        assert again.status_code == 200
+        assert again.headers["X-Cache"] == "MISS"
+        assert again.headers["ETag"] != etag
+
+    def test_etag_matching(self):
+        assert etag_matches('"a", W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+        assert matching_etag('"x", W/"b-gzip"', '"b"') == '"b-gzip"'
+
+
+class TestSerialization:
+    """Tests for the fast list serialization and compression."""
+
+    def test_articles_match_schema(self, client, db_session):
+        add_articles(db_session, 3)
+        body = client.get("/api/articles").json()
+        expected = [
+            ArticleResponse.model_validate(a).model_dump(mode="json")
+            for a in db_session.query(Article).order_by(Article.published_at.desc(), Article.id.desc())
+        ]
+        assert sorted(body["articles"], key=lambda a: a["id"]) == sorted(expected, key=lambda a: a["id"])
+
+    def test_gzip_for_large_responses(self, client, db_session):
+        add_articles(db_session, 40)
+        response = client.get("/api/articles", params={"limit": 40}, headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["ETag"].endswith('-gzip"')
+        assert len(response.json()["articles"]) == 40
+
+        # The suffixed ETag still revalidates
+        again = client.get(
+            "/api/articles", params={"limit": 40},
+            headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+        )
+        assert again.status_code == 304
+        assert again.headers["ETag"] == response.headers["ETag"]
+
+    def test_small_responses_uncompressed(self, client):
+        response = client.get("/api/cope", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.parametrize("threadpool_size", [65536, 1])
+    def test_compression_keeps_repeated_headers(self, threadpool_size):
+        """Every Set-Cookie line survives compression, inline or in the threadpool."""
+        cookies = FastAPI()
+        cookies.add_middleware(CompressionMiddleware, minimum_size=10, threadpool_size=threadpool_size)
+
+        @cookies.get("/")
+        def index(response: Response):
+            response.set_cookie("a", "1")
+            response.set_cookie("b", "2")
+            response.headers["Vary"] = "Cookie"
+            return {"text": "x" * 100}
+
+        response = TestClient(cookies).get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Cookie, Accept-Encoding"
+        assert response.headers.get_list("set-cookie") == [
+            "a=1; Path=/; SameSite=lax", "b=2; Path=/; SameSite=lax",
+        ]
+        assert response.json() == {"text": "x" * 100}
+
+    def test_choose_encoding(self):
+        assert choose_encoding("gzip, deflate") == "gzip"
+        assert choose_encoding("gzip;q=0") is None
+        assert choose_encoding("identity") is None
+        assert choose_encoding(None) is None
+
+
+class TestHomeBundle:
+    """Tests for the /bundle/home endpoint."""
+
+    def test_sections_match_standalone_endpoints(self, client, db_session):
+        db_session.add(Poll(pollster="YouGov", date=datetime.utcnow(), approval_rating=20))
+        db_session.add(TierItem(description="Item"))
+        db_session.commit()
+
+        bundle = client.get("/api/bundle/home").json()
+        assert list(bundle) == ["articles", "stats", "latest_poll", "poll_history", "promises", "tier_list"]
+        assert bundle["articles"] == client.get("/api/articles", params={"limit": 6}).json()
+        assert bundle["stats"] == client.get("/api/stats").json()
+        assert bundle["latest_poll"] == client.get("/api/polls/latest").json()
+        assert bundle["poll_history"] == client.get("/api/polls/history", params={"days": 90}).json()
+        assert bundle["promises"] == client.get("/api/promises").json()
+        assert bundle["tier_list"] == client.get("/api/tier-list").json()
+
+    def test_selected_sections(self, client):
+        response = client.get("/api/bundle/home", params={"sections": "stats,latest_poll"})
+        assert response.status_code == 200
+        assert response.json() == {"stats": client.get("/api/stats").json(), "latest_poll": None}
+
+        assert client.get("/api/bundle/home", params={"sections": "stats,nope"}).status_code == 400
+
+    def test_shares_cache_with_standalone_endpoints(self, client, db_session):
+        client.get("/api/bundle/home", params={"sections": "tier_list"})
+        assert client.get("/api/tier-list").headers["X-Cache"] == "HIT"
+
+        db_session.add(TierItem(description="Item"))
+        db_session.commit()
+        client.post("/api/tier-list/vote", json={"item_id": 1, "vote_value": 3})
+        bundle = client.get("/api/bundle/home", params={"sections": "tier_list"}).json()
+        assert bundle["tier_list"]["total_votes"] == 1
+
+
+class TestJobEndpoints:
+    """Tests for the queued scrape and job status endpoints."""
+
+    def test_scrape_is_queued(self, client):
+        response = client.post("/api/admin/scrape")
+        assert response.status_code == 202
+        job = response.json()
+        assert job["kind"] == "scrape"
+        assert job["status"] == "queued"
+
+        # A second request while one is queued returns the same job
+        assert client.post("/api/admin/scrape").json()["id"] == job["id"]
+
+        status = client.get(f"/api/admin/jobs/{job['id']}").json()
+        assert status["status"] == "queued"
+        assert status["result"] is None
+
+    def test_job_not_found(self, client):
+        assert client.get("/api/admin/jobs/999").status_code == 404
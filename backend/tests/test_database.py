@@ -0,0 +1,195 @@
+"""
+Tests for engine configuration, SQLite pragmas and pool wait monitoring.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, event, exc, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.database import (
+    ThreadpoolSession, TimedAsyncQueuePool, TimedQueuePool,
+    async_database_url, configure_engine, engine_options, get_read_db, pool_stats,
+)
+from app.utils.pool_wait import PoolWaitMonitor, get_pool_wait_monitor
+
+
+class TestEngineOptions:
+    def test_file_sqlite_gets_timed_pool(self):
+        """A file SQLite database uses the sized, timed queue pool."""
+        options = engine_options(make_url("sqlite:///./test.db"))
+        assert options["poolclass"] is TimedQueuePool
+        assert options["pool_size"] == 5
+        assert options["connect_args"] == {"check_same_thread": False}
+
+    def test_memory_sqlite_keeps_default_pool(self):
+        """In-memory SQLite keeps SQLAlchemy's single-connection pool."""
+        options = engine_options(make_url("sqlite://"))
+        assert "poolclass" not in options
+        assert "pool_size" not in options
+
+    def test_async_engine_uses_async_pool(self):
+        """The async engine gets the async queue pool and no sqlite3 connect args."""
+        options = engine_options(async_database_url("sqlite:///./test.db"), is_async=True)
+        assert options["poolclass"] is TimedAsyncQueuePool
+        assert "connect_args" not in options
+
+    def test_statement_timeout_on_postgres(self, monkeypatch):
+        """The statement timeout is passed in the form each Postgres driver expects."""
+        from app.database import settings
+
+        monkeypatch.setattr(settings, "db_statement_timeout_ms", 5000)
+        sync = engine_options(make_url("postgresql://u:p@db/app"))
+        assert sync["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+        async_ = engine_options(async_database_url("postgresql://u:p@db/app"), is_async=True)
+        assert async_["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+
+class TestSqlitePragmas:
+    def test_connections_use_wal(self, tmp_path):
+        """New SQLite connections are switched to WAL with the configured pragmas."""
+        url = make_url(f"sqlite:///{tmp_path / 'pragmas.db'}")
+        engine = configure_engine(create_engine(url, **engine_options(url)))
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        finally:
+            engine.dispose()
+
+    def test_synchronous_must_be_a_pragma_level(self):
+        """SQLITE_SYNCHRONOUS only accepts the levels SQLite defines."""
+        assert Settings(sqlite_synchronous="FULL").sqlite_synchronous == "FULL"
+        with pytest.raises(ValidationError):
+            Settings(sqlite_synchronous="NORMAL; DROP TABLE articles")
+
+    def test_reader_not_blocked_by_open_write(self, tmp_path):
+        """A reader sees the last commit while another connection holds a write transaction."""
+        url = make_url(f"sqlite:///{tmp_path / 'wal.db'}")
+        engine = configure_engine(create_engine(url, **engine_options(url)))
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE t (x INTEGER)"))
+                conn.execute(text("INSERT INTO t VALUES (1)"))
+
+            writer = engine.connect()
+            writer.begin()
+            writer.execute(text("INSERT INTO t VALUES (2)"))
+            with engine.connect() as reader:
+                assert reader.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+            writer.rollback()
+            writer.close()
+        finally:
+            engine.dispose()
+
+
+class TestPoolWait:
+    def test_checkouts_are_timed(self, tmp_path):
+        """Each checkout from a timed pool is recorded by its monitor."""
+        monitor = get_pool_wait_monitor("sync")
+        monitor.reset()
+        url = make_url(f"sqlite:///{tmp_path / 'timed.db'}")
+        engine = create_engine(url, **engine_options(url))
+        try:
+            for _ in range(3):
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            assert monitor.stats()["checkouts"] == 3
+        finally:
+            engine.dispose()
+            monitor.reset()
+
+    def test_exhausted_pool_counts_timeouts(self, tmp_path):
+        """A checkout that times out on a full pool is counted and re-raised."""
+        monitor = get_pool_wait_monitor("sync")
+        monitor.reset()
+        url = make_url(f"sqlite:///{tmp_path / 'full.db'}")
+        options = engine_options(url)
+        options.update(pool_size=1, max_overflow=0, pool_timeout=0.05)
+        engine = create_engine(url, **options)
+        try:
+            held = engine.connect()
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            held.close()
+            assert monitor.stats()["timeouts"] == 1
+        finally:
+            engine.dispose()
+            monitor.reset()
+
+    @pytest.mark.parametrize("pre_ping", [True, False])
+    def test_connection_setup_is_not_wait(self, tmp_path, pre_ping):
+        """Opening a new connection is not counted as queueing; waiting for a busy one is."""
+        monitor = get_pool_wait_monitor("sync")
+        monitor.reset()
+        url = make_url(f"sqlite:///{tmp_path / 'wait.db'}")
+        options = engine_options(url)
+        options.update(pool_size=1, max_overflow=0, pool_pre_ping=pre_ping)
+        engine = create_engine(url, **options)
+        event.listen(engine, "connect", lambda *args: time.sleep(0.2))
+        try:
+            held = engine.connect()
+            assert monitor.stats()["max_ms"] < 100
+
+            release = threading.Timer(0.2, held.close)
+            release.start()
+            with engine.connect():
+                pass
+            release.join()
+            assert monitor.stats()["checkouts"] == 2
+            assert monitor.stats()["max_ms"] >= 150
+        finally:
+            engine.dispose()
+            monitor.reset()
+
+    def test_pool_stats(self):
+        """pool_stats reports the sync engine's pool and its wait times."""
+        stats = pool_stats()["sync"]
+        assert set(stats) == {"pool", "size", "checked_out", "overflow", "wait"}
+        assert "p99_ms" in stats["wait"]
+
+    def test_stats(self):
+        """Stats report percentiles in milliseconds and count slow checkouts."""
+        monitor = PoolWaitMonitor(warn_threshold=0.1)
+        for wait in (0.001, 0.002, 0.2):
+            monitor.record(wait)
+        stats = monitor.stats()
+        assert stats["checkouts"] == 3
+        assert stats["slow_checkouts"] == 1
+        assert stats["p50_ms"] == pytest.approx(2.0)
+        assert stats["max_ms"] == pytest.approx(200.0)
+
+
+class TestReadSession:
+    def test_threadpool_unless_async_reads(self, monkeypatch):
+        """The read routes get a threadpool session by default and an AsyncSession with ASYNC_READS."""
+        from app.database import settings
+
+        async def session_type():
+            sessions = get_read_db()
+            db = await sessions.__anext__()
+            await sessions.aclose()
+            return type(db)
+
+        assert asyncio.run(session_type()) is ThreadpoolSession
+        monkeypatch.setattr(settings, "async_reads", True)
+        assert asyncio.run(session_type()) is AsyncSession
+
+    def test_threadpool_results_are_buffered(self):
+        """Rows come back fully fetched, so reading them does not touch the database."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+        try:
+            db = ThreadpoolSession(Session(bind=engine))
+            result = asyncio.run(db.execute(text("SELECT 1 UNION ALL SELECT 2")))
+            db.sync_session.close()
+            assert result.scalars().all() == [1, 2]
+        finally:
+            engine.dispose()
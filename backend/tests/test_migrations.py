@@ -0,0 +1,88 @@
+"""
+Tests for schema migrations and the hot-path index checks.
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.migrations import available_versions, pending_versions, upgrade
+from app.migrations.plans import HOT_QUERIES, check_query_plans
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestMigrations:
+    """Tests for the migration runner."""
+
+    def test_upgrade_applies_each_version_once(self, engine):
+        assert upgrade(engine) == available_versions()
+        assert pending_versions(engine) == []
+        assert upgrade(engine) == []
+
+    def test_migrations_match_models(self, engine):
+        """A fresh database built by the migrations has the tables, columns and indexes the models declare."""
+        upgrade(engine)
+        inspector = inspect(engine)
+        assert set(inspector.get_table_names()) - {"schema_migrations"} == set(Base.metadata.tables)
+        for name, table in Base.metadata.tables.items():
+            columns = {c["name"]: c["nullable"] for c in inspector.get_columns(name)}
+            assert columns == {c.name: c.nullable for c in table.columns}, name
+            indexes = {i["name"] for i in inspector.get_indexes(name)}
+            assert indexes == {i.name for i in table.indexes}, name
+
+    def test_upgrades_pre_migration_database(self, engine):
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE tier_items (id INTEGER PRIMARY KEY, description TEXT NOT NULL, "
+                "category VARCHAR(50), date_occurred DATETIME, source_url TEXT, "
+                "created_at DATETIME, is_active BOOLEAN)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE tier_votes (id INTEGER PRIMARY KEY, item_id INTEGER NOT NULL, "
+                "item_description TEXT NOT NULL, vote_value INTEGER, voter_ip_hash VARCHAR(64), "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text("CREATE INDEX ix_tier_votes_item_id ON tier_votes (item_id)"))
+            conn.execute(text("INSERT INTO tier_items (description, is_active) VALUES ('a', 1)"))
+            conn.execute(text(
+                "INSERT INTO tier_votes (item_id, item_description, vote_value) VALUES (1, 'a', 4), (1, 'a', 2)"
+            ))
+
+        upgrade(engine)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT vote_sum, vote_count FROM tier_items")).one() == (6, 2)
+        indexes = {i["name"] for i in inspect(engine).get_indexes("tier_votes")}
+        assert "ix_tier_votes_item_id" not in indexes
+        assert "ix_tier_votes_item_voter_created_at" in indexes
+
+
+class TestQueryPlans:
+    """Each hot query should be served by its index."""
+
+    def test_hot_queries_use_their_indexes(self, engine):
+        upgrade(engine)
+        with Session(engine) as db:
+            assert check_query_plans(db) == {}
+
+    def test_every_checked_index_exists(self, engine):
+        upgrade(engine)
+        inspector = inspect(engine)
+        existing = {
+            index["name"]
+            for table in inspector.get_table_names()
+            for index in inspector.get_indexes(table)
+        }
+        assert {hot.index for hot in HOT_QUERIES} <= existing
@@ -0,0 +1,213 @@
+"""
+Tests for background job scheduling and event loop health.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.bot.leader import LeaderElection
+from app.bot.scheduler import PostScheduler, get_post_scheduler
+from app.bot.x_bot import XBot
+from app.migrations import upgrade
+from app.utils.loop_lag import LoopLagMonitor
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    upgrade(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+
+    def test_detects_blocking_call(self):
+        monitor = LoopLagMonitor(interval=0.02, warn_threshold=10)
+
+        async def run():
+            monitor.start()
+            await asyncio.sleep(0.05)
+            time.sleep(0.3)  # blocks the loop
+            await asyncio.sleep(0.05)
+            monitor.stop()
+
+        asyncio.run(run())
+        assert monitor.stats()["max_ms"] >= 250
+
+    def test_stats(self):
+        monitor = LoopLagMonitor()
+        for lag in (0.001, 0.002, 0.2):
+            monitor.record(lag)
+        stats = monitor.stats()
+        assert stats["samples"] == 3
+        assert stats["last_ms"] == 200
+        assert stats["p50_ms"] == 2
+        assert stats["max_ms"] == 200
+
+        monitor.reset()
+        assert monitor.stats()["samples"] == 0
+
+
+class TestSchedulerJobs:
+    """Tests for PostScheduler job execution."""
+
+    def test_blocking_scrape_runs_off_event_loop(self):
+        scheduler = PostScheduler(bot=XBot(), adaptive_polling=True, workers=1)
+        scrape_thread = []
+
+        def slow_due_sources():
+            scrape_thread.append(threading.current_thread())
+            time.sleep(0.5)  # stands in for slow feed fetches
+            return []
+
+        scheduler.scraper.due_sources = slow_due_sources
+        monitor = LoopLagMonitor(interval=0.02, warn_threshold=10)
+
+        async def run():
+            monitor.start()
+            scheduler.start()
+            scheduler.scheduler.modify_job(
+                "scrape_job", next_run_time=datetime.now(scheduler.scheduler.timezone)
+            )
+            await asyncio.sleep(0.8)
+            scheduler.stop()
+            monitor.stop()
+
+        asyncio.run(run())
+        assert scrape_thread and scrape_thread[0] is not threading.main_thread()
+        assert monitor.stats()["max_ms"] < 100
+
+    def test_stop_when_not_started(self):
+        PostScheduler(bot=XBot()).stop()
+
+    def test_scrapes_do_not_overlap(self):
+        """The scheduled scrape and an embedded worker's scrape job take turns on the shared scraper."""
+        scheduler = PostScheduler(bot=XBot())
+        running = []
+        overlapped = []
+
+        def slow_due_sources():
+            overlapped.append(bool(running))
+            running.append(1)
+            time.sleep(0.1)
+            running.pop()
+            return []
+
+        scheduler.scraper.due_sources = slow_due_sources
+        threads = [
+            threading.Thread(target=scheduler.scrape_and_store, kwargs={"due_only": True})
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert overlapped == [False, False, False]
+
+    def test_job_handlers_share_the_scheduler(self, monkeypatch):
+        """The job handlers run on the process-wide scheduler the API lifespan starts."""
+        from app.worker import tasks
+
+        scheduler = get_post_scheduler()
+        calls = []
+        monkeypatch.setattr(scheduler, "scrape_and_store", lambda due_only=False: calls.append(due_only) or {})
+        tasks.scrape({"due_only": True})
+        assert calls == [True]
+
+
+class TestLeaderElection:
+    """Tests for the scheduler lease."""
+
+    def test_single_leader(self, session_factory):
+        a = LeaderElection(session_factory=session_factory, holder_id="a")
+        b = LeaderElection(session_factory=session_factory, holder_id="b")
+        now = datetime(2025, 1, 1, 12, 0)
+
+        assert a.try_acquire(now)
+        assert not b.try_acquire(now)
+        # Renewing keeps the lease with its holder
+        assert a.try_acquire(now + timedelta(seconds=20))
+        assert not b.try_acquire(now + timedelta(seconds=40))
+
+    def test_takeover_after_expiry(self, session_factory):
+        events = []
+        a = LeaderElection(session_factory=session_factory, holder_id="a", lease_seconds=30)
+        b = LeaderElection(
+            session_factory=session_factory, holder_id="b", lease_seconds=30,
+            on_elected=lambda: events.append("b elected"),
+        )
+        now = datetime(2025, 1, 1, 12, 0)
+
+        a.tick(now)
+        b.tick(now + timedelta(seconds=10))
+        assert a.is_leader and not b.is_leader
+
+        # a stops renewing (crashed); b takes over once the lease runs out
+        b.tick(now + timedelta(seconds=31))
+        assert b.is_leader
+        assert events == ["b elected"]
+        assert b.status()["holder_id"] == "b"
+
+    def test_release_hands_over(self, session_factory):
+        a = LeaderElection(session_factory=session_factory, holder_id="a")
+        b = LeaderElection(session_factory=session_factory, holder_id="b")
+
+        a.tick()
+        assert a.is_leader
+        a.release()
+        assert not a.is_leader
+        b.tick()
+        assert b.is_leader
+
+    def test_steps_down_when_database_unavailable(self, session_factory):
+        events = []
+        a = LeaderElection(
+            session_factory=session_factory, holder_id="a", lease_seconds=30,
+            on_demoted=lambda: events.append("demoted"),
+        )
+        now = datetime(2025, 1, 1, 12, 0)
+        a.tick(now)
+
+        def broken_session():
+            raise RuntimeError("database unavailable")
+
+        a.session_factory = broken_session
+        a.tick(now + timedelta(seconds=10))
+        assert a.is_leader  # the next tick is still inside the lease
+        a.tick(now + timedelta(seconds=20))
+        assert not a.is_leader  # demoted before the lease expires at +30s
+        assert events == ["demoted"]
+
+    @pytest.mark.parametrize("elected", [False, True])
+    def test_jobs_run_only_when_elected(self, elected):
+        scheduler = PostScheduler(bot=XBot(), adaptive_polling=True)
+        calls = []
+        scheduler.scraper.due_sources = lambda: calls.append(1) or []
+
+        async def run():
+            scheduler.start(paused=True)
+            if elected:
+                scheduler.resume()
+            scheduler.scheduler.modify_job(
+                "scrape_job", next_run_time=datetime.now(scheduler.scheduler.timezone)
+            )
+            await asyncio.sleep(0.2)
+            active = scheduler.is_active
+            scheduler.stop()
+            return active
+
+        assert asyncio.run(run()) is elected
+        assert len(calls) == (1 if elected else 0)
@@ -2,11 +2,21 @@
 Tests for scraper functionality.
 """
 
+import os
+import signal
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
 import pytest
 from app.scrapers.base_scraper import ScrapedArticle
 from app.scrapers.rss_scraper import RSSScraper
-from app.scrapers.sources import STARMER_KEYWORDS
+from app.scrapers.feed_state import FeedPollState
+from app.scrapers.sources import STARMER_KEYWORDS, NEGATIVE_BOOST_KEYWORDS
+from app.utils.keyword_matcher import KeywordMatcher
 from app.processors.sentiment import SentimentAnalyzer, analyze_sentiment
+from app.processors.sentiment_cache import SentimentCache
+from app.processors.sentiment_pool import SentimentPool
 from app.processors.content_filter import ContentFilter
 from app.processors.formatter import PostFormatter
 
@@ -42,6 +52,26 @@ class TestScrapedArticle:
         assert not article.contains_starmer_mention(STARMER_KEYWORDS)
 
 
+class TestKeywordMatcher:
+    """Tests for the Aho-Corasick keyword matcher."""
+
+    def test_finds_all_keywords_in_one_pass(self):
+        matcher = KeywordMatcher(STARMER_KEYWORDS + NEGATIVE_BOOST_KEYWORDS)
+        matches = matcher.find_all("Starmer U-turn sparks Downing Street CHAOS and backlash")
+        assert matches == {"starmer", "u-turn", "downing street", "chaos", "backlash"}
+
+    def test_overlapping_keywords(self):
+        matcher = KeywordMatcher(["two tier", "tier", "two tier policing"])
+        assert matcher.find_all("Two tier policing row") == {"two tier", "tier", "two tier policing"}
+
+    def test_word_boundaries(self):
+        matcher = KeywordMatcher(["pm", "resign"])
+        assert matcher.find_all("An upmarket shop") == set()
+        assert matcher.find_all("PM told to resign") == {"pm", "resign"}
+        assert matcher.find_all("Calls for resignation grow") == {"resign"}
+        assert KeywordMatcher(["resign"], whole_words=True).find_all("resignation") == set()
+
+
 class TestSentimentAnalyzer:
     """Tests for sentiment analysis."""
 
@@ -71,6 +101,68 @@ class TestSentimentAnalyzer:
         score_with = analyzer.analyze("The policy crisis is a disaster")
         assert score_with < score_without
 
+    def test_score_cache(self):
+        cache = SentimentCache(max_size=2)
+        analyzer = SentimentAnalyzer(boost_keywords=["crisis"], cache=cache)
+        first = analyzer.analyze("Starmer crisis deepens")
+        assert analyzer.analyze("Starmer   crisis deepens ") == first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # A different keyword list must not reuse the boosted score
+        other = SentimentAnalyzer(boost_keywords=[], cache=cache)
+        assert other.analyze("Starmer crisis deepens") > first
+
+        analyzer.analyze("Another headline")
+        assert cache.stats()["evictions"] == 1
+
+    def test_analyze_batch_matches_analyze(self):
+        texts = [
+            "Starmer faces BACKLASH over winter fuel U-turn!!",
+            "The plot was good, but the characters are uncompelling",
+            "Not bad at all",
+            "The book was only kind of good.",
+            "No 10 insists the PM is not out of touch",
+            "Catch utf-8 emoji such as 💘 and 💋 and 😁",
+            "Labour never so incompetent?? Absolutely dreadful",
+            "",
+        ] * 3
+        batch = SentimentAnalyzer(
+            boost_keywords=NEGATIVE_BOOST_KEYWORDS, cache=SentimentCache()
+        ).analyze_batch(texts)
+        single = SentimentAnalyzer(
+            boost_keywords=NEGATIVE_BOOST_KEYWORDS, cache=SentimentCache()
+        )
+        for text, score in zip(texts, batch):
+            assert score == pytest.approx(single.analyze(text), abs=1e-4)
+
+    def test_process_pool_preserves_order(self):
+        texts = [f"Starmer {word} news" for word in ("great", "awful", "fine", "terrible")] * 5
+        pool = SentimentPool(workers=2, chunk_size=3)
+        try:
+            pooled = SentimentAnalyzer(cache=SentimentCache(), pool=pool).analyze_batch(texts)
+        finally:
+            pool.shutdown()
+        local = SentimentAnalyzer(cache=SentimentCache())
+        assert pooled == [local.analyze(t) for t in texts]
+
+    def test_dead_worker_falls_back_in_process(self):
+        """Killing a worker still scores the batch, and the next batch gets a fresh pool."""
+        texts = [f"Starmer {word} news" for word in ("great", "awful", "fine", "terrible")] * 5
+        pool = SentimentPool(workers=2, chunk_size=3)
+        try:
+            pool.compound_scores(texts[:1])
+            broken = pool._executor
+            os.kill(next(iter(broken._processes)), signal.SIGKILL)
+
+            pooled = SentimentAnalyzer(cache=SentimentCache(), pool=pool).analyze_batch(texts)
+            assert pool._executor is None
+            pool.compound_scores(texts[:1])
+            assert pool._executor is not None and pool._executor is not broken
+        finally:
+            pool.shutdown()
+        local = SentimentAnalyzer(cache=SentimentCache())
+        assert pooled == [local.analyze(t) for t in texts]
+
 
 class TestContentFilter:
     """Tests for content filtering."""
@@ -142,8 +234,142 @@ class TestPostFormatter:
         assert "Custom opener:" in post.text
 
 
+SAMPLE_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Starmer faces backlash</title><link>https://example.com/{slug}</link>
+<description>A crisis in Downing Street</description></item>
+</channel></rss>"""
+
+
+def fake_response(slug: str, status_code: int = 200, headers: dict = None):
+    return SimpleNamespace(
+        status_code=status_code,
+        content=SAMPLE_FEED.replace(b"{slug}", slug.encode()) if status_code == 200 else b"",
+        headers={"Content-Type": "application/rss+xml", **(headers or {})},
+    )
+
+
+class TestFeedPollState:
+    """Tests for adaptive polling state."""
+
+    def test_busy_feed_polled_more_often_than_quiet_feed(self):
+        start = datetime(2025, 1, 1, 12, 0)
+        busy = FeedPollState(source_name="busy")
+        quiet = FeedPollState(source_name="quiet")
+
+        for state, new_per_poll in ((busy, 6), (quiet, 0)):
+            state.record_poll(20, start, 5, 180, 30)
+            state.record_poll(new_per_poll, start + timedelta(minutes=30), 5, 180, 30)
+
+        assert busy.poll_interval_minutes == 5
+        assert quiet.poll_interval_minutes == 180
+        assert busy.next_poll_at == start + timedelta(minutes=35)
+        assert not quiet.is_due(start + timedelta(hours=2))
+
+
 class TestRSSScraper:
-    """Tests for RSS scraper (requires network)."""
+    """Tests for RSS scraper."""
+
+    def test_concurrent_fetch_bounded_by_slowest_feed(self, monkeypatch):
+        scraper = RSSScraper(max_workers=len(RSSScraper().sources))
+
+        def fetch(source, state=None):
+            time.sleep(0.2)
+            return fake_response(source["name"].replace(" ", "-"))
+
+        monkeypatch.setattr(scraper, "_fetch_feed", fetch)
+        started = time.monotonic()
+        articles = scraper.scrape()
+        elapsed = time.monotonic() - started
+
+        assert len(articles) == len(scraper.sources)
+        assert elapsed < 0.2 * len(scraper.sources) / 2
+
+    def test_deadline_skips_slow_feeds(self, monkeypatch):
+        scraper = RSSScraper(max_workers=4, deadline=0.3)
+        slow = scraper.sources[0]["name"]
+
+        def fetch(source, state=None):
+            if source["name"] == slow:
+                time.sleep(1)
+            return fake_response(source["name"].replace(" ", "-"))
+
+        monkeypatch.setattr(scraper, "_fetch_feed", fetch)
+        articles = scraper.scrape()
+
+        assert len(articles) == len(scraper.sources) - 1
+        assert slow not in {a.source for a in articles}
+
+    def test_abandoned_feed_does_not_advance_state(self, monkeypatch):
+        """A feed that finishes after the deadline leaves its entries unseen."""
+        scraper = RSSScraper(max_workers=4, deadline=0.3)
+        slow = scraper.sources[0]["name"]
+        delay = {"seconds": 0.6}
+
+        def fetch(source, state=None):
+            if source["name"] == slow:
+                time.sleep(delay["seconds"])
+            return fake_response(source["name"].replace(" ", "-"))
+
+        monkeypatch.setattr(scraper, "_fetch_feed", fetch)
+        assert slow not in {a.source for a in scraper.scrape()}
+        deferred_until = scraper.feed_states[slow].next_poll_at
+        time.sleep(0.6)  # let the abandoned fetch finish
+        scraper.commit_feed_states()
+
+        assert scraper.feed_states[slow].recent_guids == []
+        assert scraper.feed_states[slow].next_poll_at == deferred_until
+        delay["seconds"] = 0
+        assert slow in {a.source for a in scraper.scrape()}
+
+    def test_conditional_get_short_circuits_on_304(self, monkeypatch):
+        scraper = RSSScraper(include_international=False)
+        sent_headers = []
+
+        def fetch(source, state=None):
+            sent_headers.append(state.conditional_headers())
+            if state.etag:
+                return fake_response("unused", status_code=304)
+            return fake_response(source["name"].replace(" ", "-"), headers={"ETag": '"v1"'})
+
+        monkeypatch.setattr(scraper, "_fetch_feed", fetch)
+        first = scraper.scrape()
+        second = scraper.scrape()
+
+        assert len(first) == len(scraper.sources)
+        assert second == []
+        assert sent_headers[-1] == {"If-None-Match": '"v1"'}
+        stats = scraper.feed_states[scraper.sources[0]["name"]]
+        assert (stats.fetched_count, stats.not_modified_count) == (1, 1)
+
+    def test_high_water_mark_skips_seen_entries(self, monkeypatch):
+        scraper = RSSScraper(include_international=False)
+        slugs = ["first"]
+
+        def fetch(source, state=None):
+            return fake_response(slugs[-1] + "-" + source["name"].replace(" ", "-"))
+
+        monkeypatch.setattr(scraper, "_fetch_feed", fetch)
+        assert len(scraper.scrape()) == len(scraper.sources)
+        assert scraper.scrape() == []
+
+        slugs.append("second")
+        articles = scraper.scrape()
+        assert len(articles) == len(scraper.sources)
+        assert all("second" in a.url for a in articles)
+
+    def test_rollback_refetches_entries(self, monkeypatch):
+        scraper = RSSScraper(include_international=False)
+
+        def fetch(source, state=None):
+            return fake_response("first-" + source["name"].replace(" ", "-"), headers={"ETag": '"v1"'})
+
+        monkeypatch.setattr(scraper, "_fetch_feed", fetch)
+        assert len(scraper.scrape()) == len(scraper.sources)
+        scraper.rollback_feed_states()  # e.g. the insert failed
+        assert len(scraper.scrape()) == len(scraper.sources)
+        scraper.commit_feed_states()
+        assert scraper.scrape() == []
 
     @pytest.mark.skip(reason="Requires network access")
     def test_scrape_sources(self):
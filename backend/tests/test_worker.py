@@ -0,0 +1,180 @@
+"""
+Tests for the persistent job queue and worker.
+"""
+
+from datetime import datetime, timedelta
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Job
+from app.migrations import upgrade
+from app.worker import claim_next, complete, enqueue, heartbeat, requeue_stale
+from app.worker.queue import retry_delay
+from app.worker.runner import JobWorker
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    upgrade(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def add_job(session_factory, kind, payload=None, **kwargs) -> int:
+    db = session_factory()
+    try:
+        job = enqueue(db, kind, payload, **kwargs)
+        db.commit()
+        return job.id
+    finally:
+        db.close()
+
+
+def get_job(session_factory, job_id) -> Job:
+    db = session_factory()
+    try:
+        return db.get(Job, job_id)
+    finally:
+        db.close()
+
+
+class TestJobQueue:
+    """Tests for enqueue and claim."""
+
+    def test_claim_order_and_exclusivity(self, session_factory):
+        first = add_job(session_factory, "a")
+        second = add_job(session_factory, "b")
+        add_job(session_factory, "later", run_at=datetime.utcnow() + timedelta(hours=1))
+
+        db = session_factory()
+        assert claim_next(db, "w1").id == first
+        assert claim_next(db, "w2").id == second
+        assert claim_next(db, "w3") is None
+        db.close()
+
+        job = get_job(session_factory, first)
+        assert job.status == "running"
+        assert job.locked_by == "w1"
+        assert job.attempts == 1
+
+    def test_unique_enqueue(self, session_factory):
+        first = add_job(session_factory, "scrape", {"due_only": False}, unique=True)
+        assert add_job(session_factory, "scrape", {"due_only": False}, unique=True) == first
+        assert add_job(session_factory, "scrape", {"due_only": True}, unique=True) != first
+
+    def test_backoff_doubles_up_to_limit(self):
+        assert retry_delay(1) == timedelta(seconds=30)
+        assert retry_delay(2) == timedelta(seconds=60)
+        assert retry_delay(20) == timedelta(seconds=3600)
+
+    def test_requeue_stale(self, session_factory):
+        job_id = add_job(session_factory, "a", max_attempts=2)
+        db = session_factory()
+        claim_next(db, "dead-worker")
+        assert requeue_stale(db, stale_after=900) == 0
+        assert requeue_stale(db, stale_after=900, now=datetime.utcnow() + timedelta(hours=1)) == 1
+        db.close()
+
+        job = get_job(session_factory, job_id)
+        assert job.status == "queued"
+        assert "dead-worker" in job.last_error
+
+    def test_heartbeat_prevents_recovery(self, session_factory):
+        add_job(session_factory, "a")
+        db = session_factory()
+        job = claim_next(db, "w1")
+        later = datetime.utcnow() + timedelta(hours=1)
+        assert heartbeat(db, job, "w1", now=later)
+        assert requeue_stale(db, stale_after=900, now=later + timedelta(seconds=60)) == 0
+        db.close()
+
+    def test_superseded_worker_cannot_complete(self, session_factory):
+        job_id = add_job(session_factory, "a", max_attempts=3)
+        db = session_factory()
+        job = claim_next(db, "w1")
+        later = datetime.utcnow() + timedelta(hours=1)
+        assert requeue_stale(db, stale_after=900, now=later) == 1
+
+        other = session_factory()
+        assert claim_next(other, "w2", now=later + timedelta(hours=1)).id == job_id
+        other.close()
+
+        # The first worker finally finishes, after its job was recovered and claimed again
+        assert not complete(db, job, "w1", {"late": True})
+        assert not heartbeat(db, job, "w1")
+        db.close()
+
+        job = get_job(session_factory, job_id)
+        assert (job.status, job.locked_by, job.attempts, job.result) == ("running", "w2", 2, None)
+
+
+class TestJobWorker:
+    """Tests for JobWorker."""
+
+    def test_runs_job_and_stores_result(self, session_factory):
+        worker = JobWorker(session_factory, handlers={"echo": lambda p: {"got": p["x"]}})
+        job_id = add_job(session_factory, "echo", {"x": 1})
+
+        assert worker.run_once()
+        assert not worker.run_once()
+
+        job = get_job(session_factory, job_id)
+        assert job.status == "succeeded"
+        assert job.result == '{"got": 1}'
+        assert job.finished_at is not None
+        assert worker.stats()["succeeded"] == 1
+
+    def test_long_job_sends_heartbeats(self, session_factory):
+        worker = JobWorker(session_factory, heartbeat_interval=0.05, handlers={"slow": lambda p: time.sleep(0.3)})
+        job_id = add_job(session_factory, "slow")
+
+        assert worker.run_once()
+        job = get_job(session_factory, job_id)
+        assert job.status == "succeeded"
+        assert job.locked_at - job.run_at >= timedelta(seconds=0.05)
+
+    def test_retries_with_backoff_then_fails(self, session_factory):
+        def broken(payload):
+            raise RuntimeError("feed down")
+
+        worker = JobWorker(session_factory, handlers={"scrape": broken})
+        job_id = add_job(session_factory, "scrape", max_attempts=2)
+
+        assert worker.run_once()
+        job = get_job(session_factory, job_id)
+        assert job.status == "queued"
+        assert job.last_error == "feed down"
+        assert job.run_at > datetime.utcnow()
+        # Not due again until the backoff has passed
+        assert not worker.run_once()
+
+        db = session_factory()
+        db.get(Job, job_id).run_at = datetime.utcnow()
+        db.commit()
+        db.close()
+
+        assert worker.run_once()
+        job = get_job(session_factory, job_id)
+        assert job.status == "failed"
+        assert job.attempts == 2
+
+    def test_unknown_kind_fails_without_retry(self, session_factory):
+        worker = JobWorker(session_factory, handlers={})
+        job_id = add_job(session_factory, "nope")
+
+        assert worker.run_once()
+        job = get_job(session_factory, job_id)
+        assert job.status == "failed"
+        assert job.attempts == 1
+
+    def test_posting_jobs_are_not_retried(self, session_factory):
+        assert get_job(session_factory, add_job(session_factory, "execute_posts")).max_attempts == 1
@@ -11,13 +11,13 @@ export default function FailuresPage() {
   const [articles, setArticles] = useState<Article[]>([]);
   const [loading, setLoading] = useState(true);
   const [loadingMore, setLoadingMore] = useState(false);
-  const [page, setPage] = useState(1);
+  const [cursor, setCursor] = useState<string | null>(null);
   const [hasMore, setHasMore] = useState(true);
   const [sortBy, setSortBy] = useState<string>('published_at');
 
   const perPage = 12;
 
-  const fetchArticles = useCallback(async (pageNum: number, append: boolean = false) => {
+  const fetchArticles = useCallback(async (pageCursor: string | null, append: boolean = false) => {
     const isInitial = !append;
     if (isInitial) setLoading(true);
     else setLoadingMore(true);
@@ -25,7 +25,7 @@ export default function FailuresPage() {
     try {
       const data = await getArticles({
         limit: perPage,
-        offset: (pageNum - 1) * perPage,
+        cursor: pageCursor ?? undefined,
         sort_by: sortBy,
       });
 
@@ -35,6 +35,7 @@ export default function FailuresPage() {
         setArticles(data.articles);
       }
       setHasMore(data.has_more);
+      setCursor(data.next_cursor);
     } catch (error) {
       console.error('Error fetching articles:', error);
     } finally {
@@ -44,14 +45,12 @@ export default function FailuresPage() {
   }, [sortBy]);
 
   useEffect(() => {
-    setPage(1);
-    fetchArticles(1);
+    setCursor(null);
+    fetchArticles(null);
   }, [sortBy, fetchArticles]);
 
   const loadMore = () => {
-    const nextPage = page + 1;
-    setPage(nextPage);
-    fetchArticles(nextPage, true);
+    fetchArticles(cursor, true);
   };
 
   return (
@@ -5,7 +5,7 @@ import Link from 'next/link';
 import NewsCard from '@/components/NewsCard';
 import NationalMoodGauge from '@/components/NationalMoodGauge';
 import StampOverlay from '@/components/StampOverlay';
-import { getArticles, getDashboardStats } from '@/lib/api';
+import { getHomeBundle } from '@/lib/api';
 import { Article, DashboardStats } from '@/lib/types';
 
 export default function HomePage() {
@@ -16,12 +16,12 @@ export default function HomePage() {
   useEffect(() => {
     async function fetchData() {
       try {
-        const [articlesData, statsData] = await Promise.all([
-          getArticles({ limit: 6 }),
-          getDashboardStats(),
-        ]);
-        setArticles(articlesData.articles);
-        setStats(statsData);
+        const bundle = await getHomeBundle({
+          sections: ['articles', 'stats'],
+          articles_limit: 6,
+        });
+        setArticles(bundle.articles?.articles ?? []);
+        setStats(bundle.stats ?? null);
       } catch (error) {
         console.error('Error fetching data:', error);
       } finally {
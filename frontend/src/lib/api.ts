@@ -7,6 +7,8 @@ import {
   PollHistoryResponse,
   TierListResponse,
   DashboardStats,
+  HomeBundle,
+  HomeBundleSection,
 } from './types';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
@@ -22,6 +24,7 @@ const api = axios.create({
 export async function getArticles(params?: {
   limit?: number;
   offset?: number;
+  cursor?: string;
   category?: string;
   sort_by?: string;
 }): Promise<ArticleListResponse> {
@@ -75,6 +78,21 @@ export async function getDashboardStats(): Promise<DashboardStats> {
   return response.data;
 }
 
+// Homepage bundle (several sections in one request)
+export async function getHomeBundle(params?: {
+  sections?: HomeBundleSection[];
+  articles_limit?: number;
+  poll_days?: number;
+}): Promise<HomeBundle> {
+  const response = await api.get('/bundle/home', {
+    params: {
+      ...params,
+      sections: params?.sections?.join(','),
+    },
+  });
+  return response.data;
+}
+
 // Utility function to get sentiment level
 export function getSentimentLevel(score: number | null): string {
   if (score === null) return 'neutral';
@@ -16,10 +16,11 @@ export interface Article {
 
 export interface ArticleListResponse {
   articles: Article[];
-  total: number;
-  page: number;
+  total: number | null;
+  page: number | null;
   per_page: number;
   has_more: boolean;
+  next_cursor: string | null;
 }
 
 export interface Promise {
@@ -87,6 +88,17 @@ export interface DashboardStats {
   days_since_disaster: number;
 }
 
+export interface HomeBundle {
+  articles?: ArticleListResponse;
+  stats?: DashboardStats;
+  latest_poll?: Poll | null;
+  poll_history?: PollHistoryResponse;
+  promises?: PromiseListResponse;
+  tier_list?: TierListResponse;
+}
+
+export type HomeBundleSection = keyof HomeBundle;
+
 // UI Types
 export type SentimentLevel = 'very-negative' | 'negative' | 'neutral' | 'positive';
 